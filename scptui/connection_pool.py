@@ -0,0 +1,158 @@
+"""Pool of SSH connections to one host, handing out SFTP channels to transfer workers."""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+import paramiko
+from paramiko import SFTPClient, SSHClient
+
+# A connection idle for this long is probed with an SSH_MSG_IGNORE before it is handed out again
+HEALTH_CHECK_AFTER = 30.0
+
+
+class _Connection:
+    """One SSH connection of the pool and the channels it carries."""
+
+    def __init__(self, client: SSHClient, owned: bool):
+        self.client = client
+        self.owned = owned  # Closed by the pool (the primary connection belongs to the SCPClient)
+        self.channels = 0
+        self.last_used = time.monotonic()
+
+
+class ConnectionPool:
+    """Thread-safe pool of up to `size` authenticated SSH connections to one host.
+
+    An SSH transport is one TCP stream with one cipher context, so every
+    channel on it shares one congestion window and one encryption thread.
+    `open_sftp` spreads the channels of transfer workers over several
+    connections: it picks the healthy connection carrying the fewest
+    channels, and opens another one (lazily, through `connect`) while fewer
+    than `size` are open and all of them are busy. Released channels are
+    closed but their connections stay open for the next job; a connection
+    that has been idle for a while is health-checked before it is reused.
+    """
+
+    def __init__(self, primary: SSHClient, connect: Callable[[], SSHClient], size: int = 1):
+        """Initialize the pool.
+
+        Args:
+            primary: Connection established by `SCPClient.connect`, always part of the pool
+            connect: Callable opening one more authenticated connection
+            size: Maximum number of connections, the primary one included
+        """
+        self.size = max(1, size)
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._connections: List[_Connection] = [_Connection(primary, owned=False)]
+        self._opening = 0  # Connections being opened outside the lock
+        self._owners: Dict[SFTPClient, _Connection] = {}
+
+    @property
+    def connection_count(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+    @staticmethod
+    def _healthy(connection: _Connection) -> bool:
+        transport = connection.client.get_transport()
+        if transport is None or not transport.is_active():
+            return False
+        if not connection.channels and time.monotonic() - connection.last_used > HEALTH_CHECK_AFTER:
+            try:
+                transport.send_ignore()
+            except Exception:
+                return False
+        return True
+
+    def _pick(self, grow: bool = True) -> Optional[_Connection]:
+        """Reserve a channel on the least busy healthy connection (callers hold the lock).
+
+        Returns:
+            The connection, or None if the caller should open a new one
+        """
+        usable = []
+        for connection in list(self._connections):
+            if self._healthy(connection):
+                usable.append(connection)
+            elif connection.owned and not connection.channels:
+                logging.debug("  Dropping dead pooled SSH connection")
+                connection.client.close()
+                self._connections.remove(connection)
+
+        best = min(usable, key=lambda c: c.channels) if usable else None
+        if grow and (best is None or best.channels) and len(usable) + self._opening < self.size:
+            self._opening += 1
+            return None
+        if best is None:
+            raise paramiko.SSHException("No SSH connection available")
+        best.channels += 1
+        return best
+
+    def open_sftp(self) -> SFTPClient:
+        """Open an SFTP channel for a transfer worker.
+
+        Returns:
+            SFTP channel; give it back with `release`
+
+        Raises:
+            paramiko.SSHException: If no connection is usable or the channel cannot be opened
+        """
+        with self._lock:
+            connection = self._pick()
+
+        if connection is None:
+            try:
+                client = self._connect()
+            except Exception as e:
+                # e.g. MaxStartups on the server: stay with the connections there are
+                logging.warning(f"  Could not open another SSH connection: {e}")
+                with self._lock:
+                    self._opening -= 1
+                    self.size = max(1, len(self._connections) + self._opening)
+                    connection = self._pick(grow=False)
+            else:
+                connection = _Connection(client, owned=True)
+                connection.channels = 1
+                with self._lock:
+                    self._opening -= 1
+                    self._connections.append(connection)
+                logging.debug(
+                    f"  Opened pooled SSH connection {len(self._connections)}/{self.size}"
+                )
+
+        try:
+            sftp = connection.client.open_sftp()
+        except Exception:
+            with self._lock:
+                connection.channels -= 1
+            raise
+        with self._lock:
+            self._owners[sftp] = connection
+        return sftp
+
+    def release(self, sftp: SFTPClient):
+        """Close a channel from `open_sftp`, keeping its connection in the pool."""
+        try:
+            sftp.close()
+        except Exception:
+            pass
+        with self._lock:
+            connection = self._owners.pop(sftp, None)
+            if connection:
+                connection.channels -= 1
+                connection.last_used = time.monotonic()
+
+    def close(self):
+        """Close the connections the pool opened (not the primary one)."""
+        with self._lock:
+            connections, self._connections = self._connections, self._connections[:1]
+            self._owners.clear()
+        for connection in connections:
+            if connection.owned:
+                try:
+                    connection.client.close()
+                except Exception:
+                    pass
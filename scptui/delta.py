@@ -0,0 +1,296 @@
+"""Rsync-style delta encoding for large files that changed only a little.
+
+The side holding the old copy (the basis) sends block signatures, the side
+holding the new file finds matching blocks with a rolling checksum and sends
+back only literal data plus block references, and the basis side rebuilds the
+new file from both.
+
+This module only uses the standard library: its source is also run on the
+remote host through ``python3 -c`` (see ``main``), so it must not import
+anything from scptui.
+"""
+
+import hashlib
+import math
+import os
+import struct
+import sys
+import zlib
+
+# Files smaller than this are always transferred in full
+DELTA_MIN_SIZE = 16 * 1024 * 1024
+
+# Suffix of the file a delta is applied to before it replaces the target
+DELTA_SUFFIX = ".delta"
+
+# Exit status of the remote helper when the delta is not worth sending
+EXIT_NOT_WORTHWHILE = 3
+
+# Literal data is sent in runs of at most this many bytes
+LITERAL_MAX = 256 * 1024
+
+# Give up once more than this share of the scanned data is literal...
+GIVE_UP_RATIO = 0.5
+# ...after at least this many bytes were scanned
+GIVE_UP_AFTER = 2 * 1024 * 1024
+# Literal data is scanned one byte at a time in Python (about 1 MB/s), give up
+# once this much of it was found, whatever the ratio
+LITERAL_BUDGET = 32 * 1024 * 1024
+
+_ADLER_MOD = 65521
+_SIGNATURE_HEADER = struct.Struct(">QI")
+_BLOCK_SIGNATURE = struct.Struct(">I16s")
+_COPY = struct.Struct(">II")
+_LENGTH = struct.Struct(">I")
+
+
+class DeltaNotWorthwhile(Exception):
+    """Raised when the new file shares too little with the basis for a delta to pay off."""
+
+
+def block_size_for(file_size):
+    """Pick a block size of about sqrt(file_size), between 2 KiB and 128 KiB."""
+    size = int(math.sqrt(file_size)) // 1024 * 1024
+    return max(2 * 1024, min(128 * 1024, size))
+
+
+def write_signature(basis, file_size, block_size, out):
+    """Write the signature of a basis file: its size, block size, and (weak, strong) per block."""
+    out.write(_SIGNATURE_HEADER.pack(file_size, block_size))
+    while True:
+        block = basis.read(block_size)
+        if not block:
+            break
+        out.write(_BLOCK_SIGNATURE.pack(zlib.adler32(block), hashlib.md5(block).digest()))
+
+
+def read_signature(stream):
+    """Read a signature written by `write_signature`.
+
+    Returns:
+        Tuple (file_size, block_size, blocks) with blocks a list of (weak, strong)
+    """
+    file_size, block_size = _SIGNATURE_HEADER.unpack(_read_exact(stream, _SIGNATURE_HEADER.size))
+    count = (file_size + block_size - 1) // block_size
+    data = _read_exact(stream, count * _BLOCK_SIGNATURE.size)
+    blocks = [_BLOCK_SIGNATURE.unpack_from(data, i * _BLOCK_SIGNATURE.size) for i in range(count)]
+    return file_size, block_size, blocks
+
+
+def compute_delta(source, signature, report=None):
+    """Encode a new file as literal data and references to blocks of the basis.
+
+    Matching blocks are skipped a block at a time, but data that matches
+    nothing is scanned byte by byte with a rolling checksum in pure Python,
+    which is far slower than sending it. So the encoder gives up (and the
+    file is transferred in full) as soon as more than GIVE_UP_RATIO of the
+    data scanned past GIVE_UP_AFTER is literal, or once LITERAL_BUDGET bytes
+    of literal data were found.
+
+    Args:
+        source: Binary file object of the new file
+        signature: Tuple returned by `read_signature`
+        report: Optional callable (scanned_bytes) called after each read
+
+    Yields:
+        Encoded operations (bytes), ending with the MD5 of the new file
+
+    Raises:
+        DeltaNotWorthwhile: If most of the new file turns out to be literal data
+    """
+    basis_size, block_size, blocks = signature
+    table = {}
+    for index, (weak, strong) in enumerate(blocks):
+        table.setdefault(weak, []).append(index)
+    last_length = basis_size - (len(blocks) - 1) * block_size if blocks else 0
+    read_size = max(1024 * 1024, 16 * block_size)
+
+    digest = hashlib.md5()
+    buf = b""
+    pos = 0  # start of the window in buf
+    lit = 0  # start of the pending literal run in buf
+    consumed = 0  # bytes of the source before buf[0]
+    literal_bytes = 0
+    run = [0, 0]  # pending copy run: first block, count
+    weak = None
+    eof = False
+
+    def flush(out, end):
+        # Copies found before the literal run must be sent first
+        nonlocal literal_bytes
+        if run[1]:
+            out.append(b"C" + _COPY.pack(run[0], run[1]))
+            run[1] = 0
+        if end > lit:
+            out.append(b"D" + _LENGTH.pack(end - lit) + buf[lit:end])
+            literal_bytes += end - lit
+
+    while True:
+        if not eof and len(buf) - pos < block_size:
+            # Drop what was already sent, then read more
+            buf = buf[lit:]
+            pos -= lit
+            consumed += lit
+            lit = 0
+            data = source.read(read_size)
+            if data:
+                digest.update(data)
+                buf += data
+            else:
+                eof = True
+            if report:
+                report(consumed + pos)
+            scanned = consumed + pos
+            mostly_literal = scanned >= GIVE_UP_AFTER and literal_bytes > scanned * GIVE_UP_RATIO
+            if mostly_literal or literal_bytes > LITERAL_BUDGET:
+                raise DeltaNotWorthwhile(f"{literal_bytes} of {scanned} bytes are literal")
+            continue
+
+        length = min(block_size, len(buf) - pos)
+        if length == 0:
+            break
+        if weak is None:
+            weak = zlib.adler32(buf[pos:pos + length])
+
+        match = None
+        candidates = table.get(weak)
+        if candidates:
+            strong = hashlib.md5(buf[pos:pos + length]).digest()
+            for index in candidates:
+                expected = block_size if index < len(blocks) - 1 else last_length
+                if expected == length and blocks[index][1] == strong:
+                    match = index
+                    break
+
+        out = []
+        if match is not None:
+            if pos > lit:
+                flush(out, pos)
+            if run[1] and run[0] + run[1] == match:
+                run[1] += 1
+            else:
+                if run[1]:
+                    out.append(b"C" + _COPY.pack(run[0], run[1]))
+                run[0], run[1] = match, 1
+            pos += length
+            lit = pos
+            weak = None
+        elif length < block_size:
+            # Short tail that matches nothing
+            pos = len(buf)
+        else:
+            if pos + block_size < len(buf):
+                # Roll the checksum one byte forward
+                old, new = buf[pos], buf[pos + block_size]
+                a = ((weak & 0xffff) - old + new) % _ADLER_MOD
+                b = ((weak >> 16) - block_size * old + a - 1) % _ADLER_MOD
+                weak = (b << 16) | a
+            else:
+                weak = None
+            pos += 1
+            if pos - lit >= LITERAL_MAX:
+                flush(out, pos)
+                lit = pos
+        for op in out:
+            yield op
+
+    out = []
+    flush(out, len(buf))
+    for op in out:
+        yield op
+    yield b"E" + digest.digest()
+
+
+def apply_delta(basis, block_size, ops, out, report=None):
+    """Rebuild a new file from a basis and a stream of operations.
+
+    Args:
+        basis: Binary file object of the basis
+        block_size: Block size of the signature the delta was computed against
+        ops: Binary stream of operations produced by `compute_delta`
+        out: Binary file object the new file is written to
+        report: Optional callable (written_bytes) called after each operation
+
+    Raises:
+        ValueError: If the stream is malformed or the result does not match its MD5
+    """
+    digest = hashlib.md5()
+    written = 0
+    while True:
+        kind = _read_exact(ops, 1)
+        if kind == b"C":
+            first, count = _COPY.unpack(_read_exact(ops, _COPY.size))
+            basis.seek(first * block_size)
+            remaining = count * block_size
+            while remaining > 0:
+                data = basis.read(min(remaining, 1024 * 1024))
+                if not data:
+                    break
+                remaining -= len(data)
+                digest.update(data)
+                out.write(data)
+                written += len(data)
+        elif kind == b"D":
+            (length,) = _LENGTH.unpack(_read_exact(ops, _LENGTH.size))
+            data = _read_exact(ops, length)
+            digest.update(data)
+            out.write(data)
+            written += length
+        elif kind == b"E":
+            if _read_exact(ops, 16) != digest.digest():
+                raise ValueError("Checksum mismatch after applying delta")
+            return
+        else:
+            raise ValueError(f"Unknown delta operation {kind!r}")
+        if report:
+            report(written)
+
+
+def _read_exact(stream, size):
+    """Read exactly `size` bytes, failing on a truncated stream."""
+    chunks = []
+    while size > 0:
+        data = stream.read(size)
+        if not data:
+            raise ValueError("Truncated delta stream")
+        chunks.append(data)
+        size -= len(data)
+    return b"".join(chunks)
+
+
+def main(argv):
+    """Remote helper entry point.
+
+    Usage:
+        signature PATH BLOCK_SIZE   write the signature of PATH to stdout
+        delta PATH                  read a signature on stdin, write the delta of PATH to stdout
+        patch BASIS OUT BLOCK_SIZE  read a delta on stdin, write the new file to OUT
+    """
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    try:
+        if argv[0] == "signature":
+            with open(argv[1], "rb") as basis:
+                write_signature(basis, os.fstat(basis.fileno()).st_size, int(argv[2]), stdout)
+        elif argv[0] == "delta":
+            signature = read_signature(stdin)
+            with open(argv[1], "rb") as source:
+                for op in compute_delta(source, signature):
+                    stdout.write(op)
+        elif argv[0] == "patch":
+            with open(argv[1], "rb") as basis, open(argv[2], "wb") as out:
+                apply_delta(basis, int(argv[3]), stdin, out)
+        else:
+            sys.stderr.write(f"unknown mode {argv[0]}\n")
+            return 2
+    except DeltaNotWorthwhile as e:
+        sys.stderr.write(f"{e}\n")
+        return EXIT_NOT_WORTHWHILE
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    stdout.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
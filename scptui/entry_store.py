@@ -0,0 +1,177 @@
+"""Columnar store of the directory entries shown by the file browser."""
+
+import bisect
+from array import array
+from typing import Iterable, List, NamedTuple, Optional
+
+# Bits of EntryStore.flags
+FLAG_DIR = 1  # Directory, or symlink to a directory
+FLAG_SYMLINK = 2
+FLAG_TARGET_DIR = 4  # Symlink whose target is a directory
+FLAG_SELECTED = 8
+
+# bytes.translate table setting the selected bit of every flag byte
+_SELECT_ALL = bytes(flags | FLAG_SELECTED for flags in range(256))
+
+
+class FileEntry(NamedTuple):
+    """Snapshot of one entry of an EntryStore."""
+    file_name: str
+    is_directory: bool
+    file_size: int
+    is_symlink: bool
+    symlink_target: str
+    target_is_dir: bool
+    ctime: float
+    mtime: float
+    is_selected: bool
+
+
+def _splice(column, positions: List[int], values: list, out):
+    """Copy a column into `out`, inserting values[i] before old index positions[i] (ascending)."""
+    previous = 0
+    for position, value in zip(positions, values):
+        out.extend(column[previous:position])
+        out.append(value)
+        previous = position
+    out.extend(column[previous:])
+    return out
+
+
+class EntryStore:
+    """Directory entries kept column by column.
+
+    Names sit in a list next to their lowercase form (used for ordering and
+    search), sizes and times in typed arrays, and the type and selection bits
+    in one byte per entry. An entry costs a few dozen bytes plus its name
+    instead of an object with a dozen attributes, and selection counts are
+    kept up to date instead of being recounted.
+
+    Entry 0 is always the parent directory "..". The others stay sorted with
+    directories first, then by lowercase name, so a batch from an incremental
+    listing is merged with one binary search per new entry.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Drop every entry but "..", and the selection."""
+        self.names: List[str] = [".."]
+        self.lower_names: List[str] = [".."]
+        self.link_targets: List[str] = [""]
+        self.sizes = array("q", [0])
+        self.ctimes = array("d", [0.0])
+        self.mtimes = array("d", [0.0])
+        self.flags = bytearray([FLAG_DIR])
+        self.dir_count = 0  # Directories after ".."
+        self.selected_files = 0
+        self.selected_folders = 0
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> FileEntry:
+        flags = self.flags[index]
+        return FileEntry(
+            self.names[index],
+            bool(flags & FLAG_DIR),
+            self.sizes[index],
+            bool(flags & FLAG_SYMLINK),
+            self.link_targets[index],
+            bool(flags & FLAG_TARGET_DIR),
+            self.ctimes[index],
+            self.mtimes[index],
+            bool(flags & FLAG_SELECTED),
+        )
+
+    def merge(self, rows: Iterable[tuple]) -> List[int]:
+        """Insert listing tuples at their sorted positions.
+
+        Args:
+            rows: Tuples (filename, is_directory, size, is_symlink, symlink_target,
+                target_is_dir[, ctime, mtime]) as returned by the listing functions
+
+        Returns:
+            Ascending positions, in indices from before the merge, that a new entry
+            was inserted in front of (for moving a cursor along)
+        """
+        new = []
+        for row in rows:
+            # Handle both old format (6 elements) and new format (8 elements)
+            if len(row) >= 8:
+                (name, is_dir, size, is_symlink, symlink_target, target_is_dir,
+                 ctime, mtime) = row[:8]
+            else:
+                name, is_dir, size, is_symlink, symlink_target, target_is_dir = row[:6]
+                ctime, mtime = 0, 0
+
+            lower = name.lower()
+            if lower == name:
+                lower = name  # Share the string
+            if is_dir:
+                position = bisect.bisect_right(self.lower_names, lower, 1, 1 + self.dir_count)
+            else:
+                position = bisect.bisect_right(self.lower_names, lower, 1 + self.dir_count)
+            flags = (
+                (FLAG_DIR if is_dir else 0)
+                | (FLAG_SYMLINK if is_symlink else 0)
+                | (FLAG_TARGET_DIR if target_is_dir else 0)
+            )
+            new.append(
+                (position, not is_dir, lower, name, size, ctime, mtime, flags, symlink_target or "")
+            )
+        if not new:
+            return []
+
+        # Entries sharing a position (the end of the directories) keep dirs-first, by-name order
+        new.sort(key=lambda entry: entry[:3])
+        positions = [entry[0] for entry in new]
+        self.names = _splice(self.names, positions, [entry[3] for entry in new], [])
+        self.lower_names = _splice(self.lower_names, positions, [entry[2] for entry in new], [])
+        self.link_targets = _splice(self.link_targets, positions, [entry[8] for entry in new], [])
+        self.sizes = _splice(self.sizes, positions, [entry[4] for entry in new], array("q"))
+        self.ctimes = _splice(self.ctimes, positions, [entry[5] for entry in new], array("d"))
+        self.mtimes = _splice(self.mtimes, positions, [entry[6] for entry in new], array("d"))
+        self.flags = _splice(self.flags, positions, [entry[7] for entry in new], bytearray())
+        self.dir_count += sum(1 for entry in new if not entry[1])
+        return positions
+
+    def toggle_selected(self, index: int) -> bool:
+        """Toggle the selection of an entry ("..", index 0, cannot be selected).
+
+        Returns:
+            Whether the entry is selected now
+        """
+        if index == 0:
+            return False
+        self.flags[index] ^= FLAG_SELECTED
+        selected = bool(self.flags[index] & FLAG_SELECTED)
+        change = 1 if selected else -1
+        if self.flags[index] & FLAG_DIR:
+            self.selected_folders += change
+        else:
+            self.selected_files += change
+        return selected
+
+    def select_all(self):
+        """Select every entry but ".."."""
+        self.flags[1:] = self.flags[1:].translate(_SELECT_ALL)
+        self.selected_folders = self.dir_count
+        self.selected_files = len(self.names) - 1 - self.dir_count
+
+    def selected_indices(self) -> List[int]:
+        """Indices of the selected entries, in display order."""
+        return [index for index, flags in enumerate(self.flags) if flags & FLAG_SELECTED]
+
+    def search(self, term: str) -> List[int]:
+        """Indices of the entries (but "..") whose name contains a lowercase term."""
+        lower_names = self.lower_names
+        return [index for index in range(1, len(lower_names)) if term in lower_names[index]]
+
+    def index_of(self, name: str) -> Optional[int]:
+        """Index of the entry with this exact name, or None."""
+        try:
+            return self.names.index(name, 1)
+        except ValueError:
+            return None
@@ -0,0 +1,117 @@
+"""Cache of remote directory listings.
+
+Browsing back and forth does not re-list directories over the network.
+"""
+
+import posixpath
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+# Listings younger than this are used without asking the server
+LISTING_CACHE_TTL = 30.0
+
+# Number of directories kept, least recently used ones are dropped first
+LISTING_CACHE_SIZE = 256
+
+# A directory modified this close to its listing (by the server's clock) may change
+# again within the same mtime second, so its mtime cannot prove the listing is current
+MTIME_GRANULARITY = 2.0
+
+
+def cache_key(remote_path: str) -> str:
+    """Normalize a remote directory path into a cache key."""
+    return posixpath.normpath(remote_path) if remote_path else "."
+
+
+class ListingCache:
+    """Thread-safe LRU cache of directory listings with a TTL.
+
+    Each entry keeps the directory mtime seen when it was listed. Once the TTL
+    has passed, a caller can revalidate the entry with one stat of the
+    directory (see `revalidate`) instead of listing it again. Adding, removing
+    or renaming entries changes a directory's mtime; changes to the files
+    themselves do not, so uploads invalidate their directory explicitly and
+    the browser can drop a listing on demand (see `invalidate`).
+    """
+
+    def __init__(self, max_entries: int = LISTING_CACHE_SIZE, ttl: float = LISTING_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> [items, dir_mtime, fetched_at]
+        self._lock = threading.Lock()
+
+    def get(self, remote_path: str):
+        """Look up a listing.
+
+        Args:
+            remote_path: Remote directory path
+
+        Returns:
+            Tuple (items, fresh, dir_mtime), or None if the directory is not cached.
+            `fresh` is False once the TTL has passed.
+        """
+        key = cache_key(remote_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            items, dir_mtime, fetched_at = entry
+            return items, time.time() - fetched_at < self.ttl, dir_mtime
+
+    def put(
+        self, remote_path: str, items: List[tuple], dir_mtime: Optional[float],
+        server_time: Optional[float] = None,
+    ):
+        """Store a listing together with the directory mtime seen before listing it.
+
+        Args:
+            remote_path: Remote directory path
+            items: Listing tuples
+            dir_mtime: Directory mtime stat'ed before listing, None if unknown
+            server_time: Server clock when the directory was stat'ed, None if unknown.
+                Remote mtimes come from the server's clock, so without it a recent
+                modification cannot be ruled out and only the TTL applies.
+        """
+        now = time.time()
+        if dir_mtime is not None and (
+            server_time is None or server_time - dir_mtime < MTIME_GRANULARITY
+        ):
+            dir_mtime = None  # Only the TTL can tell whether it is still current
+        key = cache_key(remote_path)
+        with self._lock:
+            self._entries[key] = [items, dir_mtime, now]
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def revalidate(self, remote_path: str, dir_mtime: Optional[float]) -> bool:
+        """Restart the TTL of a listing if the directory mtime is unchanged.
+
+        Returns:
+            True if the cached listing is still current
+        """
+        key = cache_key(remote_path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] is None or dir_mtime is None or entry[1] != dir_mtime:
+                return False
+            entry[2] = time.time()
+            return True
+
+    def invalidate(self, remote_path: str, recursive: bool = False):
+        """Drop the listing of a directory, and with `recursive` of everything below it."""
+        key = cache_key(remote_path)
+        prefix = key.rstrip("/") + "/"
+        with self._lock:
+            self._entries.pop(key, None)
+            if recursive:
+                for cached in [cached for cached in self._entries if cached.startswith(prefix)]:
+                    del self._entries[cached]
+
+    def clear(self):
+        """Drop every listing."""
+        with self._lock:
+            self._entries.clear()
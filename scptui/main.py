@@ -8,6 +8,9 @@ from rich.console import Console
 
 console = Console()
 
+# Seconds between two polls of a copy's cancel_check
+CANCEL_POLL_INTERVAL = 0.1
+
 
 @dataclass
 class RemotePath:
@@ -31,6 +34,15 @@ class TransferConfig:
     recursive: bool = False
     verbose: bool = False
     debug: bool = False
+    jobs: int = 4
+    segments: int = 4
+    segment_threshold_mb: int = 64
+    tar_mode: str = "never"  # "never", "always" or "auto"
+    resume: bool = True
+    sync: bool = False
+    delta: bool = False
+    tune: bool = False
+    connections: int = 1
     interactive_side: str = "source"  # "source" or "target"
 
 
@@ -73,7 +85,7 @@ def parse_arguments() -> TransferConfig:
     """
     parser = argparse.ArgumentParser(
         description="📁 SCP Interactive tool with terminal UI",
-        usage="scptui [-P port] [-i identity_file] [-r] [-v] [-R] source target"
+        usage="scptui [-P port] [-i identity_file] [-j jobs] [-r] [-v] [-R] source target"
     )
 
     parser.add_argument(
@@ -123,6 +135,74 @@ def parse_arguments() -> TransferConfig:
         dest="interactive_right",
         help="Browse local directory (reverse default behavior of browsing remote)"
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=4,
+        metavar="jobs",
+        help="Number of parallel SFTP channels for directory transfers (default: 4)"
+    )
+    parser.add_argument(
+        "--connections",
+        type=int,
+        default=1,
+        metavar="count",
+        help="Number of SSH connections the parallel channels are spread over (default: 1)"
+    )
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=4,
+        metavar="count",
+        help="Number of parallel byte ranges for a single large file (default: 4, 1 disables)"
+    )
+    parser.add_argument(
+        "--segment-threshold",
+        type=int,
+        default=64,
+        dest="segment_threshold",
+        metavar="MB",
+        help="Minimum file size in MB for segmented transfers (default: 64)"
+    )
+    parser.add_argument(
+        "--tar",
+        choices=["never", "always", "auto"],
+        default="never",
+        dest="tar_mode",
+        help=(
+            "Stream directories as a tar archive over SSH; "
+            "'auto' picks it for many small files (default: never)"
+        )
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_false",
+        dest="resume",
+        help="Do not resume interrupted transfers of large files from their .part files"
+    )
+    parser.add_argument(
+        "--sync", "--update",
+        action="store_true",
+        dest="sync",
+        help="Only transfer new or changed files (compared by size and mtime)"
+    )
+    parser.add_argument(
+        "--delta",
+        action="store_true",
+        help=(
+            "Send only the changed blocks of large files that already exist on the target "
+            "(needs python3 on the remote host)"
+        )
+    )
+    parser.add_argument(
+        "--tune",
+        action="store_true",
+        help=(
+            "Size SSH windows and packets to the measured latency and bandwidth "
+            "(probes the link once per host)"
+        )
+    )
     parser.add_argument(
         "--debug",
         action="store_true",
@@ -155,6 +235,15 @@ def parse_arguments() -> TransferConfig:
     if remote.port == 22 and args.port != 22:
         remote.port = args.port
 
+    if args.jobs < 1:
+        parser.error("❌ --jobs must be at least 1")
+
+    if args.segments < 1:
+        parser.error("❌ --segments must be at least 1")
+
+    if args.connections < 1:
+        parser.error("❌ --connections must be at least 1")
+
     # Determine interactive side
     # Default: Remote side
     if is_upload:
@@ -177,10 +266,62 @@ def parse_arguments() -> TransferConfig:
         recursive=args.recursive,
         verbose=args.verbose,
         debug=args.debug,
+        jobs=args.jobs,
+        segments=args.segments,
+        segment_threshold_mb=args.segment_threshold,
+        tar_mode=args.tar_mode,
+        resume=args.resume,
+        sync=args.sync,
+        delta=args.delta,
+        tune=args.tune,
+        connections=args.connections,
         interactive_side=interactive_side
     )
 
 
+def _local_file_info(item):
+    """Build the listing tuple of one local directory entry.
+
+    Args:
+        item: Path of the entry
+
+    Returns:
+        Tuple (filename, is_directory, size, is_symlink, symlink_target, target_is_dir,
+        ctime, mtime)
+    """
+    is_symlink = item.is_symlink()
+    is_dir = item.is_dir()  # This follows symlinks by default
+    symlink_target = ""
+    target_is_dir = False
+
+    # Resolve symlink if it is one
+    if is_symlink:
+        try:
+            # Get symlink target
+            target = item.readlink()
+            # Make absolute if relative
+            if not target.is_absolute():
+                target = (item.parent / target).resolve()
+            symlink_target = str(target)
+
+            # Check if target exists and is a directory
+            if target.exists():
+                target_is_dir = target.is_dir()
+                is_dir = target_is_dir
+            else:
+                symlink_target = f"{symlink_target} (broken link)"
+        except Exception as e:
+            # Symlink is broken or we can't access it
+            console.print(f"⚠️  [yellow]Warning: Cannot resolve symlink {item.name}: {e}[/yellow]")
+            symlink_target = "(broken link)"
+
+    stat_info = item.stat()
+    size = stat_info.st_size if not is_dir else 0
+    ctime = stat_info.st_birthtime if hasattr(stat_info, 'st_birthtime') else stat_info.st_ctime
+    mtime = stat_info.st_mtime
+    return (item.name, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime)
+
+
 def list_local_files(path: str):
     """List local files.
 
@@ -192,52 +333,59 @@ def list_local_files(path: str):
     """
     try:
         from pathlib import Path
-        import os
 
         path_obj = Path(path)
         if not path_obj.exists():
             return []
 
-        items = []
-        for item in path_obj.iterdir():
-            is_symlink = item.is_symlink()
-            is_dir = item.is_dir()  # This follows symlinks by default
-            symlink_target = ""
-            target_is_dir = False
-
-            # Resolve symlink if it is one
-            if is_symlink:
-                try:
-                    # Get symlink target
-                    target = item.readlink()
-                    # Make absolute if relative
-                    if not target.is_absolute():
-                        target = (item.parent / target).resolve()
-                    symlink_target = str(target)
-
-                    # Check if target exists and is a directory
-                    if target.exists():
-                        target_is_dir = target.is_dir()
-                        is_dir = target_is_dir
-                    else:
-                        symlink_target = f"{symlink_target} (broken link)"
-                except Exception as e:
-                    # Symlink is broken or we can't access it
-                    console.print(f"⚠️  [yellow]Warning: Cannot resolve symlink {item.name}: {e}[/yellow]")
-                    symlink_target = "(broken link)"
-
-            stat_info = item.stat()
-            size = stat_info.st_size if not is_dir else 0
-            ctime = stat_info.st_birthtime if hasattr(stat_info, 'st_birthtime') else stat_info.st_ctime
-            mtime = stat_info.st_mtime
-            items.append((item.name, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime))
-
+        items = [_local_file_info(item) for item in path_obj.iterdir()]
         return sorted(items, key=lambda x: (not x[1], x[0].lower()))
     except Exception as e:
         console.print(f"❌ [red]Failed to list local files: {e}[/red]")
         return []
 
 
+def iter_local_files(path: str):
+    """List local files incrementally with os.scandir.
+
+    The first batch is yielded as soon as it holds LISTING_FIRST_BATCH
+    entries, later ones once they hold LISTING_BATCH_SIZE entries (or a
+    quarter of what was listed so far), so a huge directory can be shown
+    before it is fully listed.
+
+    Args:
+        path: Local directory path
+
+    Yields:
+        Lists of tuples as returned by `list_local_files`, each sorted
+    """
+    import os
+    from pathlib import Path
+    from scptui.ssh_client import LISTING_BATCH_SIZE, LISTING_FIRST_BATCH
+
+    if not os.path.isdir(path):
+        return
+
+    sort_key = lambda x: (not x[1], x[0].lower())
+    batch = []
+    listed = 0
+    limit = LISTING_FIRST_BATCH
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                batch.append(_local_file_info(Path(entry.path)))
+            except OSError as e:
+                console.print(f"⚠️  [yellow]Warning: Cannot stat {entry.name}: {e}[/yellow]")
+                continue
+            if len(batch) >= limit:
+                listed += len(batch)
+                yield sorted(batch, key=sort_key)
+                batch = []
+                limit = max(LISTING_BATCH_SIZE, listed // 4)
+    if batch:
+        yield sorted(batch, key=sort_key)
+
+
 def perform_copy(
     selected_items,
     source_base,
@@ -246,10 +394,15 @@ def perform_copy(
     scp_client,
     config: TransferConfig,
     progress_callback=None,
-    cancel_check=None
+    cancel_check=None,
+    manifest=None
 ):
     """Perform the actual file copy operation.
 
+    Every selected item is walked once, in a background thread, into the
+    transfer manifest; the transfers consume its entries as they are found
+    and account each finished file in it.
+
     Args:
         selected_items: List of (path, is_dir) tuples
         source_base: Base source path
@@ -259,10 +412,14 @@ def perform_copy(
         config: Transfer configuration
         progress_callback: Optional callback for progress updates
         cancel_check: Optional callable that returns True if operation should be cancelled
+        manifest: Optional TransferManifest to fill, e.g. to follow progress from a UI
     """
     import logging
+    import threading
     from pathlib import Path
 
+    from scptui.manifest import TransferManifest
+
     logging.debug(f"=== perform_copy called ===")
     logging.debug(f"  selected_items: {selected_items}")
     logging.debug(f"  source_base: {source_base}")
@@ -278,53 +435,96 @@ def perform_copy(
             console.print(message)
 
     report_progress(f"📦 Copying {len(selected_items)} item(s)...")
+    if config.sync:
+        report_progress("🔁 Sync mode: only new or changed files are transferred")
+
+    manifest = manifest if manifest is not None else TransferManifest()
+    # Registered before the transfers start, so none of them walks an item itself
+    manifest.plan(item_path for item_path, is_dir in selected_items)
+    # Set when the copy returns, however it ends: stops the walk and the cancel watch
+    finished = threading.Event()
+
+    def walk_stopped():
+        return finished.is_set() or bool(cancel_check and cancel_check())
+
+    threading.Thread(
+        target=scp_client.build_manifest,
+        args=(selected_items, is_upload, manifest, walk_stopped),
+        daemon=True,
+    ).start()
+
+    # With a manifest the chunk callbacks only read the job's cancel flag:
+    # raise it once cancel_check turns true
+    def watch_cancel():
+        while not finished.wait(CANCEL_POLL_INTERVAL):
+            if cancel_check():
+                manifest.progress.cancel()
+                return
 
-    all_success = True
-    for item_path, is_dir in selected_items:
-        # 🛑 Check for cancellation before each item
-        if cancel_check and cancel_check():
-            logging.debug("  perform_copy cancelled during iteration")
-            report_progress("🛑 Copy operation cancelled")
-            return False
-
-        # Get relative path for creating target structure
-        item_name = Path(item_path).name
-        logging.debug(f"  Processing item: {item_name} (is_dir={is_dir})")
-
-        if is_upload:
-            local_path = item_path
-            remote_path = f"{target_base.rstrip('/')}/{item_name}"
-            logging.debug(f"  Upload: {local_path} -> {remote_path}")
-
-            if is_dir:
-                report_progress(f"📁 Uploading directory: {item_name}")
-                result = scp_client.upload_directory(local_path, remote_path, progress_callback=progress_callback, cancel_check=cancel_check)
-                logging.debug(f"  Upload directory result: {result}")
-            else:
-                report_progress(f"📄 Uploading file: {item_name}")
-                result = scp_client.upload_file(local_path, remote_path, progress_callback=progress_callback, cancel_check=cancel_check)
-                logging.debug(f"  Upload file result: {result}")
+    if cancel_check:
+        threading.Thread(target=watch_cancel, daemon=True).start()
 
-            if not result:
-                logging.error(f"  Failed to upload {item_name}")
-                all_success = False
-        else:
-            remote_path = item_path
-            local_path = str(Path(target_base) / item_name)
-            logging.debug(f"  Download: {remote_path} -> {local_path}")
-
-            if is_dir:
-                report_progress(f"📁 Downloading directory: {item_name}")
-                result = scp_client.download_directory(remote_path, local_path, progress_callback=progress_callback, cancel_check=cancel_check)
-                logging.debug(f"  Download directory result: {result}")
+    all_success = True
+    try:
+        for item_path, is_dir in selected_items:
+            # 🛑 Check for cancellation before each item
+            if cancel_check and cancel_check():
+                logging.debug("  perform_copy cancelled during iteration")
+                report_progress("🛑 Copy operation cancelled")
+                return False
+
+            # Get relative path for creating target structure
+            item_name = Path(item_path).name
+            logging.debug(f"  Processing item: {item_name} (is_dir={is_dir})")
+
+            if is_upload:
+                local_path = item_path
+                remote_path = f"{target_base.rstrip('/')}/{item_name}"
+                logging.debug(f"  Upload: {local_path} -> {remote_path}")
+
+                if is_dir:
+                    report_progress(f"📁 Uploading directory: {item_name}")
+                    result = scp_client.upload_directory(
+                        local_path, remote_path, progress_callback=progress_callback,
+                        cancel_check=cancel_check, manifest=manifest,
+                    )
+                    logging.debug(f"  Upload directory result: {result}")
+                else:
+                    report_progress(f"📄 Uploading file: {item_name}")
+                    result = scp_client.upload_file(
+                        local_path, remote_path, progress_callback=progress_callback,
+                        cancel_check=cancel_check, manifest=manifest, root=item_path,
+                    )
+                    logging.debug(f"  Upload file result: {result}")
+
+                if not result:
+                    logging.error(f"  Failed to upload {item_name}")
+                    all_success = False
             else:
-                report_progress(f"📄 Downloading file: {item_name}")
-                result = scp_client.download_file(remote_path, local_path, progress_callback=progress_callback, cancel_check=cancel_check)
-                logging.debug(f"  Download file result: {result}")
-
-            if not result:
-                logging.error(f"  Failed to download {item_name}")
-                all_success = False
+                remote_path = item_path
+                local_path = str(Path(target_base) / item_name)
+                logging.debug(f"  Download: {remote_path} -> {local_path}")
+
+                if is_dir:
+                    report_progress(f"📁 Downloading directory: {item_name}")
+                    result = scp_client.download_directory(
+                        remote_path, local_path, progress_callback=progress_callback,
+                        cancel_check=cancel_check, manifest=manifest,
+                    )
+                    logging.debug(f"  Download directory result: {result}")
+                else:
+                    report_progress(f"📄 Downloading file: {item_name}")
+                    result = scp_client.download_file(
+                        remote_path, local_path, progress_callback=progress_callback,
+                        cancel_check=cancel_check, manifest=manifest, root=item_path,
+                    )
+                    logging.debug(f"  Download file result: {result}")
+
+                if not result:
+                    logging.error(f"  Failed to download {item_name}")
+                    all_success = False
+    finally:
+        finished.set()
 
     if all_success:
         report_progress("✨ All transfers completed!")
@@ -375,6 +575,13 @@ def main():
         if config.identity_file:
             console.print(f"   Identity file: {config.identity_file}")
         console.print(f"📂 Recursive: {config.recursive}")
+        console.print(
+            f"🧵 Parallel jobs: {config.jobs} (over {config.connections} SSH connection(s))"
+        )
+        console.print(f"✂️  Segments: {config.segments} (files ≥ {config.segment_threshold_mb} MB)")
+        console.print(f"📼 Tar stream mode: {config.tar_mode}")
+        console.print(f"🔁 Sync (skip unchanged): {config.sync}")
+        console.print(f"🧩 Delta transfer: {config.delta}")
 
     # Initialize SSH client
     scp_client = SCPClient(
@@ -382,7 +589,16 @@ def main():
         port=config.remote.port,
         username=config.remote.user,
         password=config.password,
-        key_filename=config.identity_file
+        key_filename=config.identity_file,
+        jobs=config.jobs,
+        segments=config.segments,
+        segment_threshold=config.segment_threshold_mb * 1024 * 1024,
+        tar_mode=config.tar_mode,
+        resume=config.resume,
+        sync=config.sync,
+        delta=config.delta,
+        tune=config.tune,
+        connections=config.connections
     )
 
     # Connect to remote
@@ -454,15 +670,23 @@ def main():
                     target_base = config.target
 
                 # Create copy callback
-                def copy_files(selected_items, progress_callback=None, cancel_check=None):
+                def copy_files(
+                    selected_items, progress_callback=None, cancel_check=None, manifest=None
+                ):
                     """Copy selected files."""
                     if browsing_target:
                         # In this mode, selected_items is [(target_dir, is_dir)]
                         target_dir = selected_items[0][0]
                         # We copy FROM source_items TO target_dir
-                        return perform_copy(source_items, source_base, target_dir, config.is_upload, scp_client, config, progress_callback, cancel_check)
+                        return perform_copy(
+                            source_items, source_base, target_dir, config.is_upload, scp_client,
+                            config, progress_callback, cancel_check, manifest,
+                        )
                     else:
-                        return perform_copy(selected_items, source_base, target_base, config.is_upload, scp_client, config, progress_callback, cancel_check)
+                        return perform_copy(
+                            selected_items, source_base, target_base, config.is_upload,
+                            scp_client, config, progress_callback, cancel_check, manifest,
+                        )
 
                 # Build remote title with user@host[:port]
                 remote_title = f"🌐 Remote ({config.remote.user}@{config.remote.host}"
@@ -478,7 +702,9 @@ def main():
                     copy_callback=copy_files,
                     target_path=f"💻 {target_base}" if not browsing_target else f"📥 Source: {config.source}",
                     select_destination_mode=browsing_target,
-                    get_dir_size_func=scp_client.get_remote_dir_size
+                    prefetch_func=scp_client.prefetch_listing,
+                    stream_files_func=scp_client.iter_remote_files,
+                    invalidate_func=scp_client.listing_cache.invalidate,
                 )
                 browser.run()
 
@@ -536,14 +762,22 @@ def main():
                     source_base = str(Path(config.remote.path).parent) # Parent of remote file/dir
 
                 # Create copy callback
-                def copy_files(selected_items, progress_callback=None, cancel_check=None):
+                def copy_files(
+                    selected_items, progress_callback=None, cancel_check=None, manifest=None
+                ):
                     """Copy selected files."""
                     if browsing_target:
                          # In this mode, selected_items is [(target_dir, is_dir)]
                         target_dir = selected_items[0][0]
-                        return perform_copy(source_items, source_base, target_dir, config.is_upload, scp_client, config, progress_callback, cancel_check)
+                        return perform_copy(
+                            source_items, source_base, target_dir, config.is_upload, scp_client,
+                            config, progress_callback, cancel_check, manifest,
+                        )
                     else:
-                        return perform_copy(selected_items, source_base, target_base, config.is_upload, scp_client, config, progress_callback, cancel_check)
+                        return perform_copy(
+                            selected_items, source_base, target_base, config.is_upload,
+                            scp_client, config, progress_callback, cancel_check, manifest,
+                        )
 
                 # Build local title with hostname
                 import socket
@@ -557,7 +791,8 @@ def main():
                     is_remote=False,
                     copy_callback=copy_files,
                     target_path=f"🌐 {target_base}" if not browsing_target else f"📥 Source: {config.source}",
-                    select_destination_mode=browsing_target
+                    select_destination_mode=browsing_target,
+                    stream_files_func=iter_local_files
                 )
                 browser.run()
 
@@ -0,0 +1,195 @@
+"""Manifest of a transfer job: what one walk of each source found, and what was moved."""
+
+import os
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from scptui.progress import CANCELLED, DONE, ProgressAccumulator, ProgressEvent
+
+
+class ManifestEntry(NamedTuple):
+    """One file or directory found by the walk of a source."""
+    path: str  # Relative to the source, "/"-separated ("" for a source that is a file)
+    is_dir: bool
+    size: int
+    mtime: float
+    is_symlink: bool = False
+
+
+class _Root:
+    """Entries and counters of one source of the job."""
+
+    def __init__(self):
+        self.entries: List[ManifestEntry] = []
+        self.finished = False
+        self.error: Optional[Exception] = None
+        self.files = 0
+        self.bytes = 0
+        self.moved_bytes = 0
+
+
+class TransferManifest:
+    """Thread-safe manifest of a transfer job.
+
+    Each source (a selected file or directory, the "root") is walked once.
+    The walk appends entries while the transfer of that root already
+    consumes them (see `entries`), totals grow as entries are found, and the
+    transfer reports every finished file, so progress and the summary never
+    walk or measure the tree again.
+
+    Roots registered up front with `plan` are walked by whoever calls
+    `record` (typically a background thread walking the whole job); any other
+    root is walked by the first caller of `entries`.
+
+    Per-chunk progress of the files in flight goes to `progress`, which the
+    transfer threads write without taking the manifest lock.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._roots: Dict[str, _Root] = {}
+        self.total_files = 0
+        self.total_bytes = 0
+        self.files_done = 0  # Moved, skipped or failed
+        self.bytes_moved = 0
+        self.bytes_skipped = 0  # Of files skipped or failed
+        self.progress = ProgressAccumulator()
+
+    @property
+    def walking(self) -> bool:
+        """Whether some root is still being walked (totals may still grow)."""
+        with self._cond:
+            return any(not root.finished for root in self._roots.values())
+
+    def has_root(self, root: str) -> bool:
+        with self._cond:
+            return root in self._roots
+
+    def plan(self, roots: Iterable[str]):
+        """Register roots that `record` will walk, so `entries` waits for them instead."""
+        with self._cond:
+            for root in roots:
+                self._roots.setdefault(root, _Root())
+
+    def record(self, root: str, walk: Iterable[ManifestEntry]):
+        """Walk a root to the end, recording its entries."""
+        for _ in self._walk(root, walk):
+            pass
+
+    def abandon(self):
+        """Mark every root still waiting for its walk as finished (e.g. after a cancel)."""
+        with self._cond:
+            for state in self._roots.values():
+                state.finished = True
+            self._cond.notify_all()
+
+    def entries(
+        self, root: str, walk: Callable[[], Iterable[ManifestEntry]],
+    ) -> Iterator[ManifestEntry]:
+        """Iterate the entries of a root as they are found.
+
+        Args:
+            root: Source path
+            walk: Callable returning the walk of the root, only called if nobody
+                else walks (or walked) it
+
+        Yields:
+            Manifest entries, parents before their contents
+
+        Raises:
+            Exception: Whatever the walk of the root raised
+        """
+        with self._cond:
+            state = self._roots.get(root)
+            if state is None:
+                self._roots[root] = _Root()
+        if state is None:
+            yield from self._walk(root, walk())
+            return
+
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(state.entries) and not state.finished:
+                    self._cond.wait()
+                batch = state.entries[index:]
+                finished = state.finished
+            yield from batch
+            index += len(batch)
+            if finished and index >= len(state.entries):
+                break
+        if state.error:
+            raise state.error
+
+    def _walk(self, root: str, walk: Iterable[ManifestEntry]) -> Iterator[ManifestEntry]:
+        with self._cond:
+            state = self._roots.setdefault(root, _Root())
+        try:
+            for entry in walk:
+                with self._cond:
+                    state.entries.append(entry)
+                    if not entry.is_dir:
+                        state.files += 1
+                        state.bytes += entry.size
+                        self.total_files += 1
+                        self.total_bytes += entry.size
+                    self._cond.notify_all()
+                yield entry
+        except Exception as e:
+            state.error = e
+            raise
+        finally:
+            with self._cond:
+                state.finished = True
+                self._cond.notify_all()
+
+    def root_bytes(self, root: str) -> int:
+        """Bytes of the files of a root, waiting for its walk to finish (0 for an unknown root)."""
+        with self._cond:
+            state = self._roots.get(root)
+            if state is None:
+                return 0
+            while not state.finished:
+                self._cond.wait()
+            return state.bytes
+
+    @property
+    def bytes_done(self) -> int:
+        """Bytes of the job that need no more work.
+
+        Finished files count whole, the others by their transferred part.
+        """
+        in_flight = self.progress.active_bytes()
+        with self._cond:
+            return min(self.total_bytes, self.bytes_moved + self.bytes_skipped + in_flight)
+
+    def file_finished(self, root: str, path: str, size: int, state: str = DONE):
+        """Account for one file of a root that was transferred, skipped or failed.
+
+        Args:
+            root: Source the file belongs to
+            path: Source path of the file, the file id of its progress events
+            size: Size of the file from the walk
+            state: DONE, SKIPPED, FAILED or CANCELLED (see `scptui.progress`); a
+                cancelled file is only taken out of flight, it never finished
+        """
+        # Take the file out of flight first, so its bytes are never counted twice
+        bytes_done = size if state == DONE else 0
+        self.progress.publish(ProgressEvent(path, os.path.basename(path), bytes_done, size, state))
+        if state == CANCELLED:
+            return
+        with self._cond:
+            self.files_done += 1
+            if state == DONE:
+                self.bytes_moved += size
+                root_state = self._roots.get(root)
+                if root_state:
+                    root_state.moved_bytes += size
+            else:
+                self.bytes_skipped += size
+
+    def moved_bytes(self, root: str) -> Optional[int]:
+        """Bytes moved for a root, or None if the root is not part of the manifest."""
+        with self._cond:
+            state = self._roots.get(root)
+            return state.moved_bytes if state else None
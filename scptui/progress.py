@@ -0,0 +1,166 @@
+"""Typed progress events of a transfer job, coalesced for a UI that samples them."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Set, Tuple, Union
+
+# States of a ProgressEvent
+ACTIVE = "active"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# A pause this long (seconds) saves the resume state of the transfers it holds
+PAUSE_CHECKPOINT_AFTER = 30.0
+
+
+class ProgressEvent(NamedTuple):
+    """Progress of one file."""
+    file_id: str  # Source path of the file
+    name: str
+    bytes_done: int
+    bytes_total: int
+    state: str = ACTIVE
+    started: float = 0.0  # time.monotonic() when the transfer of the file started
+
+
+class FileCounter:
+    """Progress of one file in flight.
+
+    The transfer thread only stores into it, once per chunk; readers turn it
+    into a ProgressEvent when they sample.
+    """
+
+    __slots__ = ("file_id", "name", "bytes_done", "bytes_total", "started")
+
+    def __init__(self, file_id: str, name: str, bytes_done: int = 0):
+        self.file_id = file_id
+        self.name = name
+        self.bytes_done = bytes_done
+        self.bytes_total = 0
+        self.started = time.monotonic()
+
+    def event(self) -> ProgressEvent:
+        return ProgressEvent(
+            self.file_id, self.name, self.bytes_done, self.bytes_total, ACTIVE, self.started
+        )
+
+
+class ProgressAccumulator:
+    """Progress of a transfer job, written by transfer threads, sampled by the UI.
+
+    Each file in flight has a FileCounter that its transfer thread updates
+    with plain attribute stores, and cancellation or a pause raises a flag
+    the same thread reads; final events and notes go to a deque. None of
+    this takes a lock or allocates per chunk, so however many chunk
+    callbacks fire between two samples, the reader only sees the latest
+    count of each file.
+    """
+
+    def __init__(self):
+        self._active: Dict[str, FileCounter] = {}
+        self._log: Deque[Union[str, ProgressEvent]] = deque()
+        self.cancelled = False
+        self.held = False  # Cancelled or paused: transfer callbacks call hold()
+        self._running = threading.Event()
+        self._running.set()
+        self._checkpoints: Set[Callable[[], None]] = set()
+        self._checkpoint_lock = threading.Lock()
+        self._checkpointed = False
+
+    @property
+    def paused(self) -> bool:
+        return not self._running.is_set()
+
+    def cancel(self):
+        """Raise the cancel flag read by the transfer callbacks, waking paused transfers to stop."""
+        self.cancelled = True
+        self.held = True
+        self._running.set()
+
+    def pause(self):
+        """Hold the transfer threads at their next chunk, keeping their files open."""
+        self._checkpointed = False
+        self._running.clear()
+        self.held = True
+
+    def resume(self):
+        """Let paused transfer threads go on."""
+        self.held = self.cancelled
+        self._running.set()
+
+    def hold(self) -> bool:
+        """Block the calling transfer thread while the job is paused.
+
+        Once the pause lasts PAUSE_CHECKPOINT_AFTER seconds, the registered
+        checkpoints run (once per pause), so a pause that ends with the
+        process never loses more than the data in flight.
+
+        Returns:
+            True if the job was cancelled and the transfer has to stop
+        """
+        if not self._running.wait(PAUSE_CHECKPOINT_AFTER):
+            with self._checkpoint_lock:
+                if not self._checkpointed and self.paused:
+                    self._checkpointed = True
+                    for checkpoint in list(self._checkpoints):
+                        checkpoint()
+            self._running.wait()
+        return self.cancelled
+
+    def add_checkpoint(self, checkpoint: Callable[[], None]):
+        """Register a callable saving the resume state of a transfer, run during long pauses."""
+        with self._checkpoint_lock:
+            self._checkpoints.add(checkpoint)
+
+    def remove_checkpoint(self, checkpoint: Callable[[], None]):
+        """Unregister a checkpoint, waiting for it to finish if a pause is running it."""
+        with self._checkpoint_lock:
+            self._checkpoints.discard(checkpoint)
+
+    def start(self, file_id: str, name: str, bytes_done: int = 0) -> FileCounter:
+        """Register a file in flight, replacing the counter of an earlier attempt at it.
+
+        Args:
+            file_id: Source path of the file
+            name: File name shown in progress lines
+            bytes_done: Bytes already present from an earlier attempt
+
+        Returns:
+            Counter the transfer thread updates
+        """
+        counter = FileCounter(file_id, name, bytes_done)
+        self._active[file_id] = counter
+        return counter
+
+    def publish(self, event: ProgressEvent):
+        """Record the final event of a file, taking it out of flight."""
+        self._active.pop(event.file_id, None)
+        self._log.append(event)
+
+    def note(self, message: str):
+        """Log a status message for the next sample."""
+        self._log.append(message)
+
+    def active_bytes(self) -> int:
+        """Bytes transferred so far of the files in flight."""
+        return sum(counter.bytes_done for counter in self._active.copy().values())
+
+    def sample(self) -> Tuple[List[ProgressEvent], List[Union[str, ProgressEvent]]]:
+        """Take the state of the job and what happened since the previous sample.
+
+        Returns:
+            Tuple (active, log): an event with the current count of every file in
+            flight, and the final events and messages logged since the previous
+            sample, in order
+        """
+        active = [counter.event() for counter in self._active.copy().values()]
+        log = []
+        while True:
+            try:
+                log.append(self._log.popleft())
+            except IndexError:
+                break
+        return active, log
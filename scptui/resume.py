@@ -0,0 +1,87 @@
+"""Bookkeeping for resumable transfers (.part targets and segment journals)."""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+# Suffix of the partial target a transfer writes to until it is complete
+PARTIAL_SUFFIX = ".part"
+
+# Files smaller than this are transferred directly, resuming them is not worth the round trips
+RESUME_MIN_SIZE = 8 * 1024 * 1024
+
+# Bytes before the resume offset compared between source and partial target
+TAIL_CHECK_SIZE = 64 * 1024
+
+
+def journal_dir() -> Path:
+    """Directory holding segment journals of interrupted transfers."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_home) / "scptui" / "resume"
+
+
+def journal_path(host: str, port: int, direction: str, remote_path: str, local_path: str) -> Path:
+    """Build the journal path of one transfer.
+
+    Args:
+        host: Remote host address
+        port: SSH port
+        direction: "upload" or "download"
+        remote_path: Remote file path
+        local_path: Local file path
+
+    Returns:
+        Path of the JSON journal
+    """
+    key = f"{direction}\0{host}\0{port}\0{remote_path}\0{os.path.abspath(local_path)}"
+    return journal_dir() / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def load_journal(path: Path, source_size: int, source_mtime: int) -> Optional[List[List[int]]]:
+    """Load the segment ranges of an interrupted transfer.
+
+    Args:
+        path: Journal path
+        source_size: Current size of the source file
+        source_mtime: Current modification time of the source file
+
+    Returns:
+        List of [start, done, end] ranges, or None if there is no usable journal
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if data.get("size") != source_size or data.get("mtime") != source_mtime:
+        logging.debug(f"  Journal {path} does not match the source anymore")
+        return None
+
+    ranges = data.get("ranges")
+    if not ranges or any(len(r) != 3 or not r[0] <= r[1] <= r[2] for r in ranges):
+        return None
+    return [list(r) for r in ranges]
+
+
+def save_journal(path: Path, source_size: int, source_mtime: int, ranges: List[List[int]]):
+    """Record the progress of each segment of a transfer."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"size": source_size, "mtime": source_mtime, "ranges": ranges}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"  Could not save transfer journal {path}: {e}")
+
+
+def remove_journal(path: Path):
+    """Remove the journal of a finished (or restarted) transfer."""
+    try:
+        path.unlink()
+    except OSError:
+        pass
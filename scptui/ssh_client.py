@@ -1,19 +1,177 @@
 """SSH/SCP client implementation using paramiko."""
 
 import os
+import posixpath
+import queue
+import shlex
+import shutil
 import stat
 import socket
+import tarfile
+import threading
 import time
+from collections import deque
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, NamedTuple, Optional, Tuple
 
 import paramiko
 from paramiko import SSHClient, AutoAddPolicy
+from paramiko.sftp import (
+    CMD_ATTRS,
+    CMD_CLOSE,
+    CMD_DATA,
+    CMD_HANDLE,
+    CMD_NAME,
+    CMD_OPENDIR,
+    CMD_READ,
+    CMD_READDIR,
+    CMD_READLINK,
+    CMD_STAT,
+    CMD_STATUS,
+    SFTPError,
+    int64,
+)
+from paramiko.sftp_attr import SFTPAttributes
 from rich.console import Console
 from rich.prompt import Prompt
 
+from scptui import delta
+from scptui.connection_pool import ConnectionPool
+from scptui.listing_cache import ListingCache
+from scptui.manifest import ManifestEntry, TransferManifest
+from scptui.progress import CANCELLED, DONE, FAILED, SKIPPED, ProgressAccumulator
+from scptui.resume import (
+    PARTIAL_SUFFIX,
+    RESUME_MIN_SIZE,
+    TAIL_CHECK_SIZE,
+    journal_path,
+    load_journal,
+    remove_journal,
+    save_journal,
+)
+from scptui.tuning import (
+    DEFAULT_BANDWIDTH,
+    MIN_REQUEST_DEPTH,
+    compute_tuning,
+    load_tuning,
+    measure_bandwidth,
+    measure_rtt,
+    save_tuning,
+)
+
 console = Console()
 
+# Segmented transfers: bytes requested per pipelined batch on each channel
+SEGMENT_BATCH_SIZE = 8 * 1024 * 1024
+
+# Tar stream mode "auto": directories with at least this many files of this average size or less
+TAR_AUTO_MIN_FILES = 100
+TAR_AUTO_MAX_AVG_SIZE = 256 * 1024
+
+# Remote walk: relative path, type, type after following symlinks, size, mtime, link target
+FIND_PRINTF_FORMAT = r"%P\0%y\0%Y\0%s\0%T@\0%l\0"
+FIND_FIELDS = 6
+
+# Incremental listing: entries in the first batch of a local listing (about one READDIR
+# reply of a remote one), then entries gathered before each further batch is handed out.
+# Batches also grow to a quarter of what was listed so far, which keeps the number of
+# batches (each merged into the whole list) logarithmic in the directory size.
+LISTING_FIRST_BATCH = 100
+LISTING_BATCH_SIZE = 1000
+
+
+def format_size(size_bytes) -> str:
+    """Format bytes to human readable string."""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size_bytes < 1024.0:
+            return f"{size_bytes:.1f} {unit}"
+        size_bytes /= 1024.0
+    return f"{size_bytes:.1f} PB"
+
+
+def split_ranges(total_size: int, count: int) -> List[Tuple[int, int]]:
+    """Split a byte count into contiguous (start, end) ranges.
+
+    Args:
+        total_size: Number of bytes to split
+        count: Maximum number of ranges
+
+    Returns:
+        List of (start, end) tuples, end exclusive
+    """
+    if total_size <= 0:
+        return [(0, 0)]
+    count = max(1, min(count, total_size))
+    step = -(-total_size // count)  # Ceiling division
+    return [(start, min(start + step, total_size)) for start in range(0, total_size, step)]
+
+
+class RemoteEntry(NamedTuple):
+    """One entry of a remote tree walk (see `SCPClient.walk_remote`)."""
+
+    path: str  # Relative to the walked directory, '/'-separated
+    is_dir: bool  # Type of the symlink target for symlinks
+    size: int  # Of the symlink target for symlinks (0 if the link is broken)
+    mtime: float  # Of the symlink target for symlinks (0 if the link is broken)
+    is_symlink: bool  # False for symlinked directories the walk followed
+    link_target: str
+
+
+def _listing_sort_key(item: tuple):
+    """Sort listing tuples with directories first, then by name."""
+    return (not item[1], item[0].lower())
+
+
+class TransferCancelled(Exception):
+    """Raised out of a transfer when the user cancels it."""
+
+    def __init__(self, message: str = "Transfer cancelled by user"):
+        super().__init__(message)
+
+
+class _ResponseCollector:
+    """Collects the responses of pipelined SFTP requests.
+
+    paramiko hands responses to the object a request was sent for through
+    `_async_response`, in whatever order they arrive.
+    """
+
+    def __init__(self):
+        self.responses = {}
+
+    def _async_response(self, t, msg, num):
+        self.responses[num] = (t, msg)
+
+
+class _CallbackReader:
+    """File wrapper reporting bytes read through a (transferred, total) callback."""
+
+    def __init__(self, fileobj, total: int, callback):
+        self.fileobj = fileobj
+        self.total = total
+        self.callback = callback
+        self.transferred = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        if data:
+            self.transferred += len(data)
+            self.callback(self.transferred, self.total)
+        return data
+
+
+class _CountingReader:
+    """File-like wrapper counting the bytes read from a stream."""
+
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        self.count += len(data)
+        return data
+
 
 class SCPClient:
     """SCP client wrapper for file transfers."""
@@ -24,7 +182,16 @@ class SCPClient:
         port: int = 22,
         username: str = None,
         password: str = None,
-        key_filename: str = None
+        key_filename: str = None,
+        jobs: int = 1,
+        segments: int = 1,
+        segment_threshold: int = 64 * 1024 * 1024,
+        tar_mode: str = "never",
+        resume: bool = False,
+        sync: bool = False,
+        delta: bool = False,
+        tune: bool = False,
+        connections: int = 1
     ):
         """Initialize SCP client.
 
@@ -34,14 +201,44 @@ class SCPClient:
             username: SSH username
             password: SSH password
             key_filename: Path to SSH private key
+            jobs: Number of parallel SFTP channels used for directory transfers
+            segments: Number of parallel byte ranges used for a single large file
+            segment_threshold: Minimum file size in bytes for segmented transfers
+            tar_mode: Stream directories as a tar archive: "never", "always" or "auto"
+            resume: Write large files to a .part target and resume interrupted transfers
+            sync: Only transfer files that are new or changed (size and mtime) and keep their mtime
+            delta: Send only the changed blocks of large files that already exist on the other side
+            tune: Size channel windows, packets and request depth to the measured
+                bandwidth-delay product
+            connections: Maximum number of SSH connections the transfer channels are spread over
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.key_filename = key_filename
+        self.jobs = jobs
+        self.segments = segments
+        self.segment_threshold = segment_threshold
+        self.tar_mode = tar_mode
+        self.resume = resume
+        self.sync = sync
+        self.delta = delta
+        self.tune = tune
+        self.connections = connections
+        self.tuning = None  # Tuned transport settings, applied to pooled connections too
+        self.request_depth = None  # Tuned number of read requests kept in flight per segment
+        self._remote_tar = None  # Cached result of the remote tar check
+        self._remote_python = None  # Cached result of the remote python3 check
+        self._clock_checked = False  # Whether the server clock offset was measured
+        self._clock_offset = None  # Server clock minus local clock, None if unknown
         self.client: Optional[SSHClient] = None
-        self.sftp = None
+        self.sftp = None  # Shared channel for transfers
+        self.browse_sftp = None  # Channel reserved for listing and metadata calls
+        # Connections handing out channels to transfer workers
+        self.pool: Optional[ConnectionPool] = None
+        self.listing_cache = ListingCache()
+        self._browse_lock = threading.RLock()
 
     def connect(self) -> bool:
         """Establish SSH connection.
@@ -51,19 +248,14 @@ class SCPClient:
         """
         # Helper to perform the actual connection
         def try_connect(password_to_use):
-            self.client = SSHClient()
-            self.client.set_missing_host_key_policy(AutoAddPolicy())
-            
-            self.client.connect(
-                hostname=self.host,
-                port=self.port,
-                username=self.username,
-                password=password_to_use,
-                key_filename=self.key_filename,
-                timeout=10,
-                # If look_for_keys is True (default), it will try keys in ~/.ssh first.
-                # We want this, but we need to catch if it fails.
-            )
+            self.client = self._open_client(password_to_use)
+            # The browse channel and the pooled connections belonged to the previous connection
+            self.browse_sftp = None
+            if self.pool:
+                self.pool.close()
+            self.pool = ConnectionPool(self.client, self._open_pooled_client, self.connections)
+            if self.tune:
+                self._tune_transport()
             return self.client.open_sftp()
 
         console.print(f"🔌 Connecting to {self.username}@{self.host}:{self.port}")
@@ -95,14 +287,106 @@ class SCPClient:
             console.print(f"❌ [red]Connection failed: {e}[/red]")
             return False
 
+    def _open_client(self, password: Optional[str]) -> SSHClient:
+        """Open one authenticated SSH connection."""
+        client = SSHClient()
+        client.set_missing_host_key_policy(AutoAddPolicy())
+        client.connect(
+            hostname=self.host,
+            port=self.port,
+            username=self.username,
+            password=password,
+            key_filename=self.key_filename,
+            timeout=10,
+            # If look_for_keys is True (default), it will try keys in ~/.ssh first.
+            # We want this, but we need to catch if it fails.
+        )
+        return client
+
+    def _open_pooled_client(self) -> SSHClient:
+        """Open another connection for the pool, with the credentials and tuning of the first."""
+        client = self._open_client(self.password)
+        if self.tuning:
+            self._apply_tuning(client.get_transport())
+        return client
+
+    def _apply_tuning(self, transport):
+        """Make tuned window and packet sizes the defaults of a transport's new channels."""
+        transport.default_window_size = self.tuning["window_size"]
+        transport.default_max_packet_size = self.tuning["max_packet_size"]
+
+    def _tune_transport(self):
+        """Size channel windows and packets to the link, measuring it if needed.
+
+        Results are saved per host (see `scptui.tuning`). The settings become the
+        transport defaults, so every channel opened afterwards uses them.
+        """
+        import logging
+
+        key = f"{self.username}@{self.host}:{self.port}"
+        transport = self.client.get_transport()
+        try:
+            settings = load_tuning(key)
+            cached = settings is not None
+            if not cached:
+                sftp = self.client.open_sftp()
+                try:
+                    rtt = measure_rtt(sftp)
+                finally:
+                    sftp.close()
+                bandwidth = measure_bandwidth(transport) or DEFAULT_BANDWIDTH
+                settings = compute_tuning(rtt, bandwidth)
+                save_tuning(key, settings)
+        except Exception as e:
+            logging.warning(f"  Link tuning failed, using defaults: {e}")
+            return
+
+        logging.debug(f"  Tuning for {key}: {settings}")
+        self.tuning = settings
+        self._apply_tuning(transport)
+        self.request_depth = settings["request_depth"]
+        rtt_ms = settings['rtt'] * 1000
+        console.print(
+            f"📶 Tuned for {rtt_ms:.0f} ms RTT at {format_size(settings['bandwidth'])}/s: "
+            f"window {format_size(settings['window_size'])}, "
+            f"packets {format_size(settings['max_packet_size'])}, "
+            f"{settings['request_depth']} requests in flight{' (saved)' if cached else ''}"
+        )
+
     def disconnect(self):
         """Close SSH connection."""
+        if self.browse_sftp:
+            self.browse_sftp.close()
         if self.sftp:
             self.sftp.close()
+        if self.pool:
+            self.pool.close()
         if self.client:
             self.client.close()
         console.print("🔌 [yellow]Disconnected[/yellow]")
 
+    def _browse_channel(self):
+        """Return the SFTP channel reserved for listing and metadata calls.
+
+        Browsing gets its own channel so it is not queued behind bulk data on the
+        transfer channel. Callers hold `_browse_lock`, since the UI and its
+        workers may list concurrently. Falls back to the transfer channel if the
+        server refuses another session.
+        """
+        import logging
+
+        channel = self.browse_sftp
+        if channel is None or channel.sock is None or channel.sock.closed:
+            try:
+                self.browse_sftp = self.client.open_sftp()
+                logging.debug("  Browse SFTP channel opened")
+            except Exception as e:
+                logging.warning(
+                    f"  Could not open browse SFTP channel, sharing the transfer channel: {e}"
+                )
+                return self.sftp
+        return self.browse_sftp
+
     def is_remote_dir(self, remote_path: str) -> bool:
         """Check if remote path is a directory.
 
@@ -117,7 +401,8 @@ class SCPClient:
             return False
 
         try:
-            file_stat = self.sftp.stat(remote_path)
+            with self._browse_lock:
+                file_stat = self._browse_channel().stat(remote_path)
             is_dir = stat.S_ISDIR(file_stat.st_mode)
             return is_dir
         except FileNotFoundError:
@@ -140,7 +425,8 @@ class SCPClient:
             return False
 
         try:
-            self.sftp.stat(remote_path)
+            with self._browse_lock:
+                self._browse_channel().stat(remote_path)
             return True
         except FileNotFoundError:
             return False
@@ -192,48 +478,486 @@ class SCPClient:
             return remote_path
 
         try:
-            return self.sftp.normalize(remote_path)
+            with self._browse_lock:
+                return self._browse_channel().normalize(remote_path)
         except:
             return remote_path
 
-    def get_remote_dir_size(self, remote_path: str) -> int:
-        """Calculate size of remote directory in bytes.
+    def walk_remote(self, remote_dir: str, sftp=None) -> Iterator[RemoteEntry]:
+        """Walk a remote tree, parents before their contents.
+
+        Symlinks carry the size and mtime of their target, which is what a
+        transfer of them moves. Symlinked directories are followed like uploads
+        (`os.walk(followlinks=True)`) and tar mode (`tar h`) do: their contents
+        come after the rest of the tree, under the path of the link, which is
+        reported as a plain directory. A link leading back to a directory the
+        walk is inside of would loop; it is not followed and stays reported as
+        a symlink, so the transfer can report it.
 
         Args:
-            remote_path: Remote directory path
+            remote_dir: Remote directory path
+            sftp: SFTP channel for the fallback walk and resolving links, the browse
+                channel if None
+
+        Yields:
+            RemoteEntry for every entry below remote_dir
+        """
+        import logging
+
+        def realpath(path):
+            if sftp is not None:
+                return sftp.normalize(path)
+            with self._browse_lock:
+                return self._browse_channel().normalize(path)
+
+        def leads_back(target, anchors):
+            # The walk of target would come across every anchor below it again
+            prefix = target.rstrip('/') + '/'
+            return any(anchor == target or anchor.startswith(prefix) for anchor in anchors)
+
+        # (relative path of a walked directory, its real path, real directories the walk
+        # is inside of when reaching it)
+        real_root = realpath(remote_dir)
+        roots = deque([("", real_root, (real_root,))])
+        while roots:
+            rel_root, real_dir, anchors = roots.popleft()
+            prefix = f"{rel_root}/" if rel_root else ""
+            tree = f"{remote_dir.rstrip('/')}/{rel_root}" if rel_root else remote_dir
+            for entry in self._walk_remote_tree(tree, sftp):
+                entry = entry._replace(path=prefix + entry.path)
+                if entry.is_symlink and entry.is_dir:
+                    # Within a walked directory only its own subdirectories are entered
+                    parent = posixpath.dirname(entry.path[len(prefix):])
+                    real_parent = f"{real_dir.rstrip('/')}/{parent}" if parent else real_dir
+                    try:
+                        target = realpath(f"{remote_dir.rstrip('/')}/{entry.path}")
+                    except IOError as e:
+                        logging.warning(f"  Cannot resolve {entry.path}: {e}")
+                        target = None
+                    if target is not None and not leads_back(target, anchors + (real_parent,)):
+                        roots.append((entry.path, target, anchors + (real_parent,)))
+                        entry = entry._replace(is_symlink=False)
+                    else:
+                        logging.warning(f"  Not following symlinked directory {entry.path}")
+                yield entry
+
+    def _walk_remote_tree(self, remote_dir: str, sftp=None) -> Iterator[RemoteEntry]:
+        """Walk a remote tree without following symlinks (see `walk_remote`).
+
+        With a shell on the remote host this is a single `find -printf` stream
+        over one channel; otherwise the tree is listed over SFTP, one round trip
+        per directory.
+        """
+        import logging
+
+        if self.client:
+            found = 0
+            try:
+                for entry in self._walk_remote_find(remote_dir, sftp):
+                    found += 1
+                    yield entry
+                return
+            except Exception as e:
+                if found:
+                    raise
+                logging.debug(f"  find walk unavailable, walking over SFTP: {e}")
+
+        yield from self._walk_remote_sftp(remote_dir, sftp)
+
+    def _walk_remote_find(self, remote_dir: str, sftp=None) -> Iterator[RemoteEntry]:
+        """Stream a remote tree from one `find` command with NUL-separated fields.
+
+        `%s` and `%T@` describe a symlink itself, so the symlinks of each chunk
+        of output are stat'ed in one pipelined batch (see `_follow_links`).
+        """
+        import logging
+
+        stdin, stdout, stderr = self.client.exec_command(
+            f"find -H {shlex.quote(remote_dir)} -mindepth 1 -printf '{FIND_PRINTF_FORMAT}'"
+        )
+        channel = stdout.channel
+        pending = b""
+        fields = []
+        found = 0
+        finished = False
+        try:
+            while True:
+                data = stdout.read(256 * 1024)
+                if not data:
+                    finished = True
+                    break
+                parts = (pending + data).split(b"\0")
+                pending = parts.pop()
+                fields.extend(parts)
+                usable = len(fields) - len(fields) % FIND_FIELDS
+                batch = []
+                for i in range(0, usable, FIND_FIELDS):
+                    path, kind, target_kind, size, mtime, link_target = (
+                        field.decode("utf-8", "replace") for field in fields[i:i + FIND_FIELDS]
+                    )
+                    batch.append(RemoteEntry(
+                        path=path,
+                        is_dir=target_kind == "d",
+                        size=int(size),
+                        mtime=float(mtime),
+                        is_symlink=kind == "l",
+                        link_target=link_target,
+                    ))
+                del fields[:usable]
+                for entry in self._follow_links(remote_dir, batch, sftp):
+                    found += 1
+                    yield entry
+        finally:
+            if not finished:
+                # The consumer stopped iterating, stop find early
+                channel.close()
+
+        exit_status = channel.recv_exit_status()
+        if exit_status != 0:
+            error = stderr.read().decode(errors="replace").strip()
+            if not found:
+                raise IOError(f"find exited with {exit_status}: {error}")
+            # Typically unreadable subdirectories, which an SFTP walk would not list either
+            logging.warning(f"  find reported errors under {remote_dir}: {error}")
+
+    def _walk_remote_sftp(self, remote_dir: str, sftp=None) -> Iterator[RemoteEntry]:
+        """Walk a remote tree over SFTP, one listing per directory."""
+        import logging
+
+        def call(method, *args):
+            if sftp is not None:
+                return getattr(sftp, method)(*args)
+            with self._browse_lock:
+                return getattr(self._browse_channel(), method)(*args)
+
+        pending = [""]
+        while pending:
+            rel_dir = pending.pop()
+            full_dir = f"{remote_dir.rstrip('/')}/{rel_dir}" if rel_dir else remote_dir
+            try:
+                entries = call("listdir_attr", full_dir)
+            except IOError as e:
+                if not rel_dir:
+                    raise
+                logging.warning(f"  Cannot list {full_dir}: {e}")
+                continue
+
+            for attr in entries:
+                rel_path = f"{rel_dir}/{attr.filename}" if rel_dir else attr.filename
+                is_symlink = stat.S_ISLNK(attr.st_mode)
+                is_dir = stat.S_ISDIR(attr.st_mode)
+                link_target = ""
+                size, mtime = attr.st_size or 0, attr.st_mtime or 0
+                if is_symlink:
+                    # Transfers follow the link, report what they will move
+                    full_path = f"{remote_dir.rstrip('/')}/{rel_path}"
+                    size = mtime = 0
+                    try:
+                        link_target = call("readlink", full_path)
+                        target = call("stat", full_path)
+                        is_dir = stat.S_ISDIR(target.st_mode)
+                        size, mtime = target.st_size or 0, target.st_mtime or 0
+                    except IOError:
+                        pass  # Broken link
+                elif is_dir:
+                    pending.append(rel_path)
+                yield RemoteEntry(rel_path, is_dir, size, mtime, is_symlink, link_target)
+
+    def _follow_links(
+        self, remote_dir: str, entries: List[RemoteEntry], sftp=None
+    ) -> List[RemoteEntry]:
+        """Give the symlinks among walk entries the size and mtime of their targets.
+
+        Args:
+            remote_dir: Walked remote directory
+            entries: Entries of the walk, whose symlinks carry the link's own size and mtime
+            sftp: SFTP channel to stat with, the browse channel if None
 
         Returns:
-            Size in bytes
+            The entries, symlinks replaced (size and mtime 0 for a broken link)
         """
-        if not self.client:
-            return 0
+        prefix = remote_dir.rstrip('/') + "/"
+        links = [prefix + entry.path for entry in entries if entry.is_symlink]
+        if not links:
+            return entries
+        if sftp is not None:
+            resolved = self._resolve_symlinks(sftp, links)
+        else:
+            with self._browse_lock:
+                resolved = self._resolve_symlinks(self._browse_channel(), links)
+
+        followed = []
+        for entry in entries:
+            if entry.is_symlink:
+                _, target = resolved.get(prefix + entry.path, (None, None))
+                if target is None:
+                    entry = entry._replace(size=0, mtime=0)
+                else:
+                    entry = entry._replace(size=target.st_size or 0, mtime=target.st_mtime or 0)
+            followed.append(entry)
+        return followed
+
+    def _local_manifest_walk(self, local_path: str, is_dir: bool = True) -> Iterator[ManifestEntry]:
+        """Walk a local source for a transfer manifest, following symlinks like transfers do."""
+        if not is_dir:
+            file_stat = os.stat(local_path)
+            yield ManifestEntry("", False, file_stat.st_size, file_stat.st_mtime)
+            return
+
+        for root, dirs, files in os.walk(local_path, followlinks=True):
+            rel = os.path.relpath(root, local_path)
+            prefix = "" if rel == "." else Path(rel).as_posix() + "/"
+            for name in dirs:
+                yield ManifestEntry(prefix + name, True, 0, 0)
+            for name in files:
+                try:
+                    file_stat = os.stat(os.path.join(root, name))
+                except OSError:
+                    # Still transferred, so the failure gets reported
+                    yield ManifestEntry(prefix + name, False, 0, 0)
+                    continue
+                yield ManifestEntry(prefix + name, False, file_stat.st_size, file_stat.st_mtime)
+
+    def _remote_manifest_walk(
+        self, remote_path: str, is_dir: bool = True, sftp=None
+    ) -> Iterator[ManifestEntry]:
+        """Walk a remote source for a transfer manifest (see `walk_remote`)."""
+        if not is_dir:
+            if sftp is not None:
+                file_stat = sftp.stat(remote_path)
+            else:
+                with self._browse_lock:
+                    file_stat = self._browse_channel().stat(remote_path)
+            yield ManifestEntry("", False, file_stat.st_size or 0, file_stat.st_mtime or 0)
+            return
+
+        for entry in self.walk_remote(remote_path, sftp=sftp):
+            yield ManifestEntry(entry.path, entry.is_dir, entry.size, entry.mtime, entry.is_symlink)
 
+    def build_manifest(self, items, is_upload: bool, manifest: TransferManifest, cancel_check=None):
+        """Walk every source of a transfer job once into its manifest.
+
+        Meant to run in a background thread next to the transfer: the sources
+        are registered up front, so the transfer of each one consumes the
+        entries found here instead of walking again (see `TransferManifest`).
+
+        Args:
+            items: List of (path, is_dir) tuples, local paths for uploads, remote ones otherwise
+            is_upload: True for upload, False for download
+            manifest: Manifest to fill
+            cancel_check: Optional callable that returns True if the job was cancelled
+        """
+        import logging
+
+        def until_cancelled(walk):
+            for entry in walk:
+                if cancel_check and cancel_check():
+                    return
+                yield entry
+
+        manifest.plan(path for path, is_dir in items)
         try:
-            # Escape single quotes in path for shell safety
-            safe_path = remote_path.replace("'", "'\\''")
-            
-            # Try du -sb first (GNU du - apparent size in bytes)
-            # -s: summarize, -b: bytes
-            command = f"du -sb '{safe_path}' 2>/dev/null | cut -f1"
-            stdin, stdout, stderr = self.client.exec_command(command)
-            size_str = stdout.read().decode().strip()
-            
-            if size_str and size_str.isdigit():
-                return int(size_str)
+            for path, is_dir in items:
+                if cancel_check and cancel_check():
+                    break
+                if is_upload:
+                    walk = self._local_manifest_walk(path, is_dir)
+                else:
+                    walk = self._remote_manifest_walk(path, is_dir)
+                try:
+                    manifest.record(path, until_cancelled(walk))
+                except Exception as e:
+                    # The transfer of this source reports the error
+                    logging.debug(f"  Manifest walk of {path} failed: {e}")
+        finally:
+            manifest.abandon()
 
-            # Fallback to du -sk (POSIX - 1024-byte blocks)
-            # -k: kilobytes
-            command = f"du -sk '{safe_path}' 2>/dev/null | cut -f1"
-            stdin, stdout, stderr = self.client.exec_command(command)
-            size_str = stdout.read().decode().strip()
-            
-            if size_str and size_str.isdigit():
-                return int(size_str) * 1024
+    def prefetch_listing(self, remote_path: str, cancel_check=None):
+        """Warm the listing cache for a directory (background use).
+
+        Unlike `list_remote_files`, this never reconnects or closes anything, so
+        a failing directory cannot disturb running transfers or prompt for a
+        password from a background thread: any error just leaves the cache
+        as it was. The browse channel is only locked per request, and
+        `cancel_check` is polled between READDIR replies, so a navigation
+        takes over the channel without waiting for the whole listing.
+
+        Args:
+            remote_path: Remote directory path
+            cancel_check: Optional function returning True to stop prefetching
+        """
+        import logging
 
+        transport = self.client.get_transport() if self.client else None
+        if not transport or not transport.is_active():
+            return
+        try:
+            cached_items, dir_mtime = self._cached_listing(remote_path)
+            if cached_items is not None:
+                return
+            dir_mtime, server_time = self._listing_stamp(remote_path, dir_mtime)
+            items = []
+            for batch in self._read_directory(remote_path):
+                if cancel_check and cancel_check():
+                    return
+                items += batch
         except Exception as e:
-            console.print(f"⚠️  [yellow]Error getting directory size: {e}[/yellow]")
+            logging.debug(f"prefetch_listing: Listing {remote_path} failed: {e}")
+            return
+        self.listing_cache.put(
+            remote_path, sorted(items, key=_listing_sort_key), dir_mtime, server_time
+        )
+
+    def _resolve_symlinks(self, sftp, paths: List[str]) -> dict:
+        """Read the target and stat of many symlinks with pipelined requests.
+
+        A window of readlink and stat requests (the tuned request depth) is kept
+        in flight and refilled as responses come back, so a directory full of
+        symlinks costs about one extra round trip per window instead of two per
+        link, without flooding the channel when there are thousands of links.
+
+        Args:
+            sftp: SFTP channel (callers hold `_browse_lock` for the browse channel)
+            paths: Remote symlink paths
+
+        Returns:
+            Dict mapping each resolvable path to (target, SFTPAttributes of the target);
+            broken or unreadable links are left out
+        """
+        if not paths:
+            return {}
+
+        collector = _ResponseCollector()
+        # Two requests per link
+        depth = max(1, (self.request_depth or MIN_REQUEST_DEPTH) // 2)
+        pending = iter(paths)
+        in_flight = deque()  # (path, readlink request number, stat request number)
+        resolved = {}
+        try:
+            while True:
+                while len(in_flight) < depth:
+                    path = next(pending, None)
+                    if path is None:
+                        break
+                    in_flight.append((
+                        path,
+                        sftp._async_request(collector, CMD_READLINK, sftp._adjust_cwd(path)),
+                        sftp._async_request(collector, CMD_STAT, sftp._adjust_cwd(path)),
+                    ))
+                if not in_flight:
+                    return resolved
+
+                path, readlink_num, stat_num = in_flight.popleft()
+                for num in (readlink_num, stat_num):
+                    while num not in collector.responses:
+                        sftp._read_response()
+                readlink_type, readlink_msg = collector.responses.pop(readlink_num)
+                stat_type, stat_msg = collector.responses.pop(stat_num)
+                # Anything else is an error status (e.g. a broken link)
+                if readlink_type != CMD_NAME or stat_type != CMD_ATTRS:
+                    continue
+                if readlink_msg.get_int() != 1:
+                    continue
+                target = readlink_msg.get_string().decode("utf-8", "replace")
+                resolved[path] = (target, SFTPAttributes._from_msg(stat_msg))
+        except Exception:
+            # Drain the window, so nothing is left pending on the channel
+            try:
+                for _, readlink_num, stat_num in in_flight:
+                    for num in (readlink_num, stat_num):
+                        while num not in collector.responses:
+                            sftp._read_response()
+            except Exception:
+                pass
+            raise
+
+    def _cached_listing(self, remote_path: str):
+        """Look up a listing in the cache, revalidating it with one stat once its TTL has passed.
 
-        return 0
+        Returns:
+            Tuple (items, dir_mtime): items is a copy of the cached listing, or None
+            if the directory must be listed; dir_mtime is the mtime seen by a failed
+            revalidation (None if not known)
+        """
+        import logging
+        cached = self.listing_cache.get(remote_path)
+        if not cached:
+            return None, None
+        cached_items, fresh, cached_mtime = cached
+        if fresh:
+            logging.debug(f"list_remote_files: Cache hit for {remote_path}")
+            return list(cached_items), None
+        try:
+            with self._browse_lock:
+                dir_mtime = self._browse_channel().stat(remote_path).st_mtime
+            if self.listing_cache.revalidate(remote_path, dir_mtime):
+                logging.debug(f"list_remote_files: Cache revalidated for {remote_path}")
+                return list(cached_items), None
+            return None, dir_mtime
+        except (OSError, EOFError, paramiko.SSHException, socket.error) as e:
+            logging.debug(f"list_remote_files: Cache revalidation failed: {e}")
+            return None, None
+
+    def _listing_item(self, remote_path: str, entry: SFTPAttributes, links: dict) -> tuple:
+        """Convert one directory entry into a listing tuple.
+
+        Args:
+            remote_path: Remote directory the entry belongs to
+            entry: Attributes of the entry (not following symlinks)
+            links: Symlinks resolved by `_resolve_symlinks`
+
+        Returns:
+            Tuple (filename, is_directory, size, is_symlink, symlink_target, target_is_dir,
+            ctime, mtime)
+        """
+        is_symlink = stat.S_ISLNK(entry.st_mode)
+        is_dir = stat.S_ISDIR(entry.st_mode)
+        size = entry.st_size if not is_dir else 0
+        symlink_target = ""
+        target_is_dir = False
+
+        # Get modification time (SFTP doesn't provide creation time)
+        mtime = entry.st_mtime if hasattr(entry, 'st_mtime') else 0
+        ctime = mtime  # Use mtime as ctime for remote files
+
+        # Resolve symlink if it is one
+        if is_symlink:
+            try:
+                full_path = f"{remote_path.rstrip('/')}/{entry.filename}"
+                # Target and stat (which follows symlinks) were fetched in one batch
+                symlink_target, target_stat = links[full_path]
+
+                # If target is relative, make it absolute
+                if not symlink_target.startswith('/'):
+                    symlink_target = f"{remote_path.rstrip('/')}/{symlink_target}"
+
+                target_is_dir = stat.S_ISDIR(target_stat.st_mode)
+                # Update is_dir to reflect the target's type
+                is_dir = target_is_dir
+                # Update size to reflect the target's size
+                size = target_stat.st_size if not target_is_dir else 0
+                # Update mtime to reflect the target's mtime
+                if hasattr(target_stat, 'st_mtime'):
+                    mtime = target_stat.st_mtime
+                    ctime = mtime
+            except Exception as e:
+                # Symlink is broken or we can't access it
+                # logging.debug(f"Warning: Cannot resolve symlink {entry.filename}: {e}")
+                symlink_target = f"(broken link)"
+
+        return (
+            entry.filename, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime
+        )
+
+    def _resolve_listing(
+        self, sftp, remote_path: str, entries: List[SFTPAttributes]
+    ) -> List[tuple]:
+        """Resolve the symlinks among some entries of a directory into listing tuples."""
+        links = self._resolve_symlinks(sftp, [
+            f"{remote_path.rstrip('/')}/{entry.filename}"
+            for entry in entries if stat.S_ISLNK(entry.st_mode)
+        ])
+        return [self._listing_item(remote_path, entry, links) for entry in entries]
 
     def list_remote_files(self, remote_path: str = ".") -> List[Tuple[str, bool, int, bool, str, bool]]:
         """List files in remote directory.
@@ -252,68 +976,29 @@ class SCPClient:
             if not self.client or not self.client.get_transport() or not self.client.get_transport().is_active():
                 logging.debug("list_remote_files: SSH transport is dead. Reconnecting...")
                 return self.connect()
-            
-            if not self.sftp or self.sftp.sock is None or (self.sftp.sock.closed if hasattr(self.sftp.sock, 'closed') else False):
-                logging.debug("list_remote_files: SFTP session is dead. Re-opening...")
-                try:
-                    self.sftp = self.client.open_sftp()
-                    return True
-                except Exception as e:
-                    logging.error(f"list_remote_files: Failed to re-open SFTP: {e}")
-                    return False
             return True
 
         # First attempt to ensure connection
         if not ensure_connection():
             logging.error("list_remote_files: Could not establish connection.")
             return []
-        
+
+        # Serve from the cache; past the TTL, one stat tells whether the directory changed
+        cached_items, dir_mtime = self._cached_listing(remote_path)
+        if cached_items is not None:
+            return cached_items
+
         for attempt in range(2):
             try:
-                logging.debug(f"list_remote_files: Calling sftp.listdir_attr (attempt {attempt+1})...")
-                items = []
-                for entry in self.sftp.listdir_attr(remote_path):
-                    is_symlink = stat.S_ISLNK(entry.st_mode)
-                    is_dir = stat.S_ISDIR(entry.st_mode)
-                    size = entry.st_size if not is_dir else 0
-                    symlink_target = ""
-                    target_is_dir = False
-
-                    # Get modification time (SFTP doesn't provide creation time)
-                    mtime = entry.st_mtime if hasattr(entry, 'st_mtime') else 0
-                    ctime = mtime  # Use mtime as ctime for remote files
-
-                    # Resolve symlink if it is one
-                    if is_symlink:
-                        try:
-                            full_path = f"{remote_path.rstrip('/')}/{entry.filename}"
-                            # Get symlink target
-                            symlink_target = self.sftp.readlink(full_path)
-
-                            # If target is relative, make it absolute
-                            if not symlink_target.startswith('/'):
-                                symlink_target = f"{remote_path.rstrip('/')}/{symlink_target}"
-
-                            # Check if target is a directory
-                            target_stat = self.sftp.stat(full_path)  # stat follows symlinks
-                            target_is_dir = stat.S_ISDIR(target_stat.st_mode)
-                            # Update is_dir to reflect the target's type
-                            is_dir = target_is_dir
-                            # Update size to reflect the target's size
-                            size = target_stat.st_size if not target_is_dir else 0
-                            # Update mtime to reflect the target's mtime
-                            if hasattr(target_stat, 'st_mtime'):
-                                mtime = target_stat.st_mtime
-                                ctime = mtime
-                        except Exception as e:
-                            # Symlink is broken or we can't access it
-                            # logging.debug(f"Warning: Cannot resolve symlink {entry.filename}: {e}")
-                            symlink_target = f"(broken link)"
+                logging.debug(f"list_remote_files: Reading directory (attempt {attempt+1})...")
+                # The browse channel is re-opened here if it died
+                dir_mtime, server_time = self._listing_stamp(remote_path, dir_mtime)
+                items = [item for batch in self._read_directory(remote_path) for item in batch]
 
-                    items.append((entry.filename, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime))
-                
                 logging.debug(f"list_remote_files: Found {len(items)} items")
-                return sorted(items, key=lambda x: (not x[1], x[0].lower()))
+                items = sorted(items, key=_listing_sort_key)
+                self.listing_cache.put(remote_path, items, dir_mtime, server_time)
+                return list(items)
 
             except (OSError, EOFError, paramiko.SSHException, socket.error) as e:
                 logging.warning(f"list_remote_files: Attempt {attempt+1} failed with error: {e}")
@@ -321,6 +1006,7 @@ class SCPClient:
                     logging.info("list_remote_files: Retrying after reconnecting...")
                     # Force close and reconnect
                     try:
+                        if self.browse_sftp: self.browse_sftp.close()
                         if self.sftp: self.sftp.close()
                         if self.client: self.client.close()
                     except:
@@ -340,17 +1026,882 @@ class SCPClient:
         
         return []
 
-    def upload_file(self, local_path: str, remote_path: str, progress_callback=None, cancel_check=None) -> bool:
+    def iter_remote_files(self, remote_path: str = ".") -> Iterator[List[tuple]]:
+        """List a remote directory incrementally, one READDIR reply at a time.
+
+        The first batch is yielded as soon as the server answers, so a huge
+        directory can be shown before it is fully listed. Later replies are
+        gathered into batches of at least LISTING_BATCH_SIZE entries. The browse
+        channel is only locked while a request is in flight, never across a
+        yield. A listing read to the end is stored in the listing cache.
+
+        Args:
+            remote_path: Remote directory path
+
+        Yields:
+            Lists of listing tuples (see `list_remote_files`), each sorted
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        import logging
+        logging.debug(f"iter_remote_files called for path: {remote_path}")
+
+        transport = self.client.get_transport() if self.client else None
+        if not transport or not transport.is_active():
+            logging.debug("iter_remote_files: SSH transport is dead. Reconnecting...")
+            if not self.connect():
+                raise OSError("Could not establish connection")
+
+        cached_items, dir_mtime = self._cached_listing(remote_path)
+        if cached_items is not None:
+            yield cached_items
+            return
+
+        dir_mtime, server_time = self._listing_stamp(remote_path, dir_mtime)
+        items = []
+        batch = []
+        yielded = False
+        replies = self._read_directory(remote_path)
+        try:
+            while True:
+                reply = next(replies, None)
+                finished = reply is None
+                batch += reply or []
+
+                batch_size = max(LISTING_BATCH_SIZE, len(items) // 4)
+                if batch and (finished or not yielded or len(batch) >= batch_size):
+                    items += batch
+                    yield sorted(batch, key=_listing_sort_key)
+                    yielded = True
+                    batch = []
+                if finished:
+                    break
+        finally:
+            # Closes the directory handle when the browser stops listing early
+            replies.close()
+
+        logging.debug(f"iter_remote_files: Found {len(items)} items")
+        self.listing_cache.put(
+            remote_path, sorted(items, key=_listing_sort_key), dir_mtime, server_time
+        )
+
+    def _listing_stamp(
+        self, remote_path: str, dir_mtime: Optional[float]
+    ) -> Tuple[float, Optional[float]]:
+        """Stamp a directory about to be listed, for the listing cache.
+
+        The mtime is taken before listing, so a change during the listing is
+        noticed later.
+
+        Args:
+            remote_path: Remote directory path
+            dir_mtime: Directory mtime if just stat'ed, stat'ed again if None
+
+        Returns:
+            Tuple (dir_mtime, server_time): server_time is the server's clock (see
+            `_server_time`), None if unknown
+        """
+        if dir_mtime is None:
+            with self._browse_lock:
+                dir_mtime = self._browse_channel().stat(remote_path).st_mtime
+        return dir_mtime, self._server_time()
+
+    def _server_time(self) -> Optional[float]:
+        """Estimate the server's clock, from an offset measured once per client.
+
+        Remote mtimes come from the server's clock, so telling whether one is
+        recent must not rely on the local clock being in sync.
+
+        Returns:
+            Server time in seconds since the epoch, None if it cannot be measured
+        """
+        import logging
+
+        if not self._clock_checked:
+            self._clock_checked = True
+            try:
+                before = time.time()
+                stdin, stdout, stderr = self.client.exec_command("date +%s")
+                server_seconds = int(stdout.read().decode().strip())
+                after = time.time()
+                # date truncates to the second, its middle is the best guess
+                self._clock_offset = server_seconds + 0.5 - (before + after) / 2
+            except Exception as e:
+                logging.debug(f"  Server clock check failed: {e}")
+            logging.debug(f"  Server clock offset: {self._clock_offset}")
+        if self._clock_offset is None:
+            return None
+        return time.time() + self._clock_offset
+
+    def _read_directory(self, remote_path: str) -> Iterator[List[tuple]]:
+        """Read a remote directory on the browse channel, one READDIR reply at a time.
+
+        The browse channel is only locked while a request is in flight, never
+        across a yield, so other listings can use it in between. This never
+        reconnects; errors propagate to the caller. The directory handle is
+        closed even if the caller stops early.
+
+        Args:
+            remote_path: Remote directory path
+
+        Yields:
+            Listing tuples (see `list_remote_files`) of each reply, unsorted
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        import logging
+
+        with self._browse_lock:
+            sftp = self._browse_channel()
+            t, msg = sftp._request(CMD_OPENDIR, sftp._adjust_cwd(remote_path))
+            if t != CMD_HANDLE:
+                raise OSError(f"Expected handle listing {remote_path}")
+            handle = msg.get_binary()
+
+        try:
+            while True:
+                with self._browse_lock:
+                    try:
+                        t, msg = sftp._request(CMD_READDIR, handle)
+                    except EOFError:
+                        return
+                    if t != CMD_NAME:
+                        raise OSError(f"Expected name listing {remote_path}")
+                    entries = []
+                    for _ in range(msg.get_int()):
+                        filename = msg.get_text()
+                        longname = msg.get_text()
+                        if filename not in (".", ".."):
+                            entries.append(SFTPAttributes._from_msg(msg, filename, longname))
+                    items = self._resolve_listing(sftp, remote_path, entries)
+                yield items
+        finally:
+            with self._browse_lock:
+                try:
+                    sftp._request(CMD_CLOSE, handle)
+                except Exception as e:
+                    logging.debug(f"_read_directory: Closing {remote_path} failed: {e}")
+
+    def _make_transfer_callback(
+        self, file_name: str, progress_callback=None, cancel_check=None, initial: int = 0,
+        manifest: Optional[TransferManifest] = None, source: str = "",
+    ):
+        """Build a paramiko-style (transferred, total) callback.
+
+        The callback runs for every chunk and enforces cancellation by raising
+        TransferCancelled. The transfer closes its file handle on the way out,
+        after the responses to its outstanding requests came back, so the SFTP
+        session stays open for the next transfer. With a manifest the callback
+        only stores the byte count into the file's counter and reads the job's
+        cancel/pause flag, blocking while the job is paused; the UI samples the
+        counters at its own pace (see `ProgressAccumulator`). cancel_check is
+        then not called per chunk: the caller raises the flag with
+        `manifest.progress.cancel()` once it turns true (`perform_copy` polls
+        it). Otherwise the callback calls cancel_check and sends a message to
+        progress_callback every 1%.
+
+        Args:
+            file_name: File name shown in progress messages
+            progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable that returns True if operation should be cancelled
+                (only used without a manifest)
+            initial: Bytes already present from an earlier attempt (not counted in the speed)
+            manifest: Optional job manifest whose progress accumulator gets the counts
+            source: Source path of the file, the file id of its progress
+
+        Returns:
+            Callable (transferred, total)
+        """
+        if manifest:
+            progress = manifest.progress
+            counter = progress.start(source, file_name, initial)
+
+            def count(transferred, total):
+                counter.bytes_done = transferred
+                counter.bytes_total = total
+                if progress.held and progress.hold():
+                    raise TransferCancelled()
+
+            return count
+
+        start_time = time.time()
+        last_reported = [initial]  # Use list to allow modification in nested function
+
+        def check_cancel_and_report(transferred, total):
+            # Check for cancellation during transfer
+            if cancel_check and cancel_check():
+                raise TransferCancelled()
+
+            if progress_callback:
+                # Report every 1% or at completion (more frequent updates for smoother UI)
+                progress_percent = (transferred / total * 100) if total > 0 else 0
+                last_percent = (last_reported[0] / total * 100) if total > 0 else 0
+
+                if transferred == total or progress_percent - last_percent >= 1:
+                    # Calculate speed
+                    elapsed = time.time() - start_time
+                    if elapsed > 0:
+                        speed = (transferred - initial) / elapsed
+                        speed_str = f"{format_size(speed)}/s"
+                    else:
+                        speed_str = "..."
+
+                    transferred_str = format_size(transferred)
+                    total_str = format_size(total)
+                    # Truncate so that only a finished file ever shows 100%
+                    progress_msg = (
+                        f"📄 {file_name}: {transferred_str} / {total_str} "
+                        f"({int(progress_percent)}%) - {speed_str}"
+                    )
+                    progress_callback(progress_msg)
+                    last_reported[0] = transferred
+
+        return check_cancel_and_report
+
+    def _is_unchanged(self, source_size: int, source_mtime: float, target) -> bool:
+        """Check whether a target file is up to date with its source (sync mode).
+
+        A target counts as unchanged when it has the same size and is not older
+        than the source; transferred files get the source mtime, so this holds
+        until the source is modified.
+
+        Args:
+            source_size: Source file size in bytes
+            source_mtime: Source modification time
+            target: (size, mtime) of the target file, or None if it does not exist
+
+        Returns:
+            True if the file can be skipped
+        """
+        if target is None:
+            return False
+        return target[0] == source_size and int(target[1]) >= int(source_mtime)
+
+    def _use_segments(self, file_size: int) -> bool:
+        """Check whether a file is large enough for a segmented transfer."""
+        return self.segments > 1 and file_size >= self.segment_threshold
+
+    def _use_resume(self, file_size: int) -> bool:
+        """Check whether a file should go through a resumable .part target."""
+        return self.resume and file_size >= RESUME_MIN_SIZE
+
+    def _journal_path(self, direction: str, remote_path: str, local_path: str):
+        """Journal path recording the segment progress of one transfer."""
+        return journal_path(self.host, self.port, direction, remote_path, local_path)
+
+    def _tail_matches(self, sftp, remote_path: str, local_path: str, offset: int) -> bool:
+        """Compare the bytes just before `offset` in a remote and a local file.
+
+        Used before resuming, to make sure a partial target still continues the source.
+
+        Args:
+            sftp: SFTP channel to read the remote file with
+            remote_path: Remote file path
+            local_path: Local file path
+            offset: Resume offset
+
+        Returns:
+            True if the last TAIL_CHECK_SIZE bytes before offset are identical
+        """
+        start = max(0, offset - TAIL_CHECK_SIZE)
+        try:
+            with open(local_path, 'rb') as local_file:
+                local_file.seek(start)
+                local_tail = local_file.read(offset - start)
+            with sftp.open(remote_path, 'rb') as remote_file:
+                remote_tail = b"".join(remote_file.readv([(start, offset - start)]))
+        except (IOError, OSError):
+            return False
+        return len(local_tail) == offset - start and local_tail == remote_tail
+
+    def _plan_segments(self, file_size: int, source_mtime: int, journal, tail_matches):
+        """Split a file into segment ranges, continuing an interrupted transfer if possible.
+
+        Args:
+            file_size: Source file size in bytes
+            source_mtime: Source modification time, part of the journal check
+            journal: Journal path, or None if the transfer is not resumable
+            tail_matches: Callable (offset) -> bool checking the partial target at offset
+
+        Returns:
+            Tuple (ranges, fresh): [start, done, end] lists, and whether the target must be
+            recreated
+        """
+        import logging
+
+        ranges = load_journal(journal, file_size, source_mtime) if journal else None
+        if ranges is None:
+            ranges = [[start, start, end] for start, end in split_ranges(file_size, self.segments)]
+            return ranges, True
+
+        for segment in ranges:
+            if segment[1] > segment[0] and not tail_matches(segment[1]):
+                logging.debug(f"  Segment {segment} does not match the source, restarting it")
+                segment[1] = segment[0]
+        return ranges, False
+
+    def _read_pipelined(self, sftp, remote_file, start: int, end: int, consume):
+        """Read bytes [start, end) of an open remote file with pipelined requests.
+
+        A window of read requests (the tuned request depth) is kept in flight and
+        refilled as responses come back. Unlike paramiko's prefetch there is no
+        thread sending requests on its own: when reading or `consume` fails (e.g.
+        on cancellation), the responses to the requests already sent are read
+        before the exception propagates, so closing the handle afterwards leaves
+        nothing pending on the channel.
+
+        Args:
+            sftp: SFTP channel the file was opened on
+            remote_file: Open remote file
+            start: Offset of the first byte
+            end: Offset to stop at
+            consume: Callable receiving each chunk of data, in order
+
+        Raises:
+            EOFError: If the remote file is shorter than `end`
+        """
+        collector = _ResponseCollector()
+        chunk_size = remote_file.MAX_REQUEST_SIZE
+        depth = self.request_depth or MIN_REQUEST_DEPTH
+        in_flight = deque()  # (request number, offset, size)
+        offset = start
+        try:
+            while offset < end or in_flight:
+                while offset < end and len(in_flight) < depth:
+                    size = min(chunk_size, end - offset)
+                    num = sftp._async_request(
+                        collector, CMD_READ, remote_file.handle, int64(offset), int(size)
+                    )
+                    in_flight.append((num, offset, size))
+                    offset += size
+
+                num, pos, size = in_flight.popleft()
+                while num not in collector.responses:
+                    sftp._read_response()
+                t, msg = collector.responses.pop(num)
+                if t == CMD_STATUS:
+                    sftp._convert_status(msg)
+                if t != CMD_DATA:
+                    raise SFTPError(f"Expected data at offset {pos}")
+                data = msg.get_string()
+                if len(data) != size:
+                    raise EOFError(f"Short read at offset {pos}: expected {size}, got {len(data)}")
+                consume(data)
+        except Exception:
+            # Drain the window; if the channel itself is gone there is nothing left to drain
+            try:
+                for num, _, _ in in_flight:
+                    while num not in collector.responses:
+                        sftp._read_response()
+            except Exception:
+                pass
+            raise
+
+    def _run_segments(
+        self, sftp, ranges, file_size: int, transfer_range, report, checkpoint=None,
+        progress: Optional[ProgressAccumulator] = None,
+    ):
+        """Transfer byte ranges of one file concurrently over several SFTP channels.
+
+        The caller's channel plus up to `segments - 1` extra channels each take
+        ranges from a shared queue. If the server refuses more channels the
+        ranges are spread across the ones that could be opened.
+
+        Args:
+            sftp: SFTP channel of the caller
+            ranges: List of [start, done, end] lists; `done` is advanced in place
+            file_size: Total file size in bytes
+            transfer_range: Callable (channel, start, end, advance) moving bytes [start, end)
+                and calling advance(nbytes) after each chunk
+            report: Callback (transferred, total) for progress and cancellation
+            checkpoint: Optional callable persisting `ranges`, called regularly and at the end
+            progress: Optional progress accumulator of the job, which also runs the
+                checkpoint when a pause lasts long
+
+        Raises:
+            The first exception raised by any range (including cancellation)
+        """
+        import logging
+
+        pending = queue.Queue()
+        for segment in ranges:
+            if segment[1] < segment[2]:
+                pending.put(segment)
+
+        channels = [sftp]
+        for _ in range(min(self.segments, pending.qsize()) - 1):
+            try:
+                channels.append(self.pool.open_sftp())
+            except Exception as e:
+                logging.warning(f"  Could not open extra SFTP channel for segment: {e}")
+                break
+
+        logging.debug(
+            f"  Segmented transfer: {pending.qsize()} range(s) over {len(channels)} channel(s)"
+        )
+
+        lock = threading.Lock()
+        state = {
+            'transferred': sum(done - start for start, done, end in ranges),
+            'since_checkpoint': 0,
+            'error': None,
+        }
+        save_lock = threading.Lock()
+
+        def save():
+            # Ranges and a long pause both save the journal, one at a time
+            with save_lock:
+                checkpoint()
+
+        def run(channel):
+            while state['error'] is None:
+                try:
+                    segment = pending.get_nowait()
+                except queue.Empty:
+                    return
+
+                def advance(nbytes):
+                    with lock:
+                        if state['error'] is not None:
+                            raise Exception("Segment aborted")
+                        segment[1] += nbytes
+                        state['transferred'] += nbytes
+                        transferred = state['transferred']
+                        state['since_checkpoint'] += nbytes
+                        due = checkpoint and state['since_checkpoint'] >= SEGMENT_BATCH_SIZE
+                        if due:
+                            state['since_checkpoint'] = 0
+                    # Outside the lock: report blocks while the job is paused, the other
+                    # ranges must still reach their next chunk and hold there too
+                    if due:
+                        save()
+                    report(transferred, file_size)
+
+                try:
+                    transfer_range(channel, segment[1], segment[2], advance)
+                except Exception as e:
+                    # Other ranges stop at their next chunk
+                    with lock:
+                        if state['error'] is None:
+                            state['error'] = e
+                    return
+
+        threads = [
+            threading.Thread(target=run, args=(channel,), daemon=True) for channel in channels
+        ]
+        if checkpoint and progress:
+            progress.add_checkpoint(save)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            if checkpoint and progress:
+                progress.remove_checkpoint(save)
+            for extra in channels[1:]:
+                self.pool.release(extra)
+            if checkpoint:
+                save()
+
+        if state['error'] is not None:
+            raise state['error']
+
+    def _download_segmented(
+        self, remote_path: str, target_path: str, file_stat, report, sftp, journal=None,
+        progress: Optional[ProgressAccumulator] = None,
+    ):
+        """Download one large file as concurrent byte ranges.
+
+        Each range is read with pipelined requests over its own SFTP channel and
+        written at its offset in a preallocated local file. With a journal, the
+        progress of each range is recorded so an interrupted download continues
+        where it stopped.
+
+        Args:
+            remote_path: Remote file path
+            target_path: Local file path written to (the .part file when resumable)
+            file_stat: SFTP attributes of the remote file
+            report: Callback (transferred, total) for progress and cancellation
+            sftp: SFTP channel of the caller
+            journal: Optional journal path for resumable downloads
+            progress: Optional progress accumulator of the job (see `_run_segments`)
+        """
+        file_size = file_stat.st_size
+        source_mtime = int(file_stat.st_mtime or 0)
+
+        # Ranges can only continue in a preallocated file of the right size
+        preallocated = os.path.exists(target_path) and os.path.getsize(target_path) == file_size
+        if journal and not preallocated:
+            remove_journal(journal)
+        ranges, fresh = self._plan_segments(
+            file_size, source_mtime, journal,
+            lambda offset: self._tail_matches(sftp, remote_path, target_path, offset)
+        )
+        if fresh:
+            # Preallocate so every range can be written at its own offset
+            with open(target_path, 'wb') as local_file:
+                local_file.truncate(file_size)
+
+        def fetch_range(channel, start, end, advance):
+            # Unbuffered, so bytes reported to advance() are really in the file
+            with channel.open(remote_path, 'rb') as remote_file, \
+                    open(target_path, 'r+b', buffering=0) as local_file:
+                local_file.seek(start)
+
+                def consume(data):
+                    local_file.write(data)
+                    advance(len(data))
+
+                self._read_pipelined(channel, remote_file, start, end, consume)
+
+        def checkpoint():
+            save_journal(journal, file_size, source_mtime, ranges)
+
+        try:
+            self._run_segments(
+                sftp, ranges, file_size, fetch_range, report,
+                checkpoint if journal else None, progress,
+            )
+        except Exception:
+            if not journal:
+                # A preallocated file has the full size, never leave it looking complete
+                try:
+                    os.remove(target_path)
+                except OSError:
+                    pass
+            raise
+
+        if journal:
+            remove_journal(journal)
+
+    def _upload_segmented(
+        self, local_path: str, target_path: str, file_size: int, report, sftp, journal=None,
+        progress: Optional[ProgressAccumulator] = None,
+    ):
+        """Upload one large file as concurrent byte ranges.
+
+        Each range is sent with pipelined positioned writes over its own SFTP
+        channel into a single remote file. With a journal, the progress of each
+        range is recorded so an interrupted upload continues where it stopped.
+
+        Args:
+            local_path: Local file path
+            target_path: Remote file path written to (the .part file when resumable)
+            file_size: Local file size in bytes
+            report: Callback (transferred, total) for progress and cancellation
+            sftp: SFTP channel of the caller
+            journal: Optional journal path for resumable uploads
+            progress: Optional progress accumulator of the job (see `_run_segments`)
+        """
+        source_mtime = int(os.path.getmtime(local_path))
+
+        if journal:
+            try:
+                sftp.stat(target_path)
+            except IOError:
+                remove_journal(journal)
+        ranges, fresh = self._plan_segments(
+            file_size, source_mtime, journal,
+            lambda offset: self._tail_matches(sftp, target_path, local_path, offset)
+        )
+        if fresh:
+            # Create (or truncate) the target; ranges then write at their own offsets
+            sftp.open(target_path, 'wb').close()
+
+        def send_range(channel, start, end, advance):
+            with open(local_path, 'rb') as local_file, \
+                    channel.open(target_path, 'r+b') as remote_file:
+                remote_file.set_pipelined(True)
+                chunk_size = remote_file.MAX_REQUEST_SIZE
+                local_file.seek(start)
+                remote_file.seek(start)
+                offset = start
+                while offset < end:
+                    data = local_file.read(min(chunk_size, end - offset))
+                    if not data:
+                        raise EOFError(f"Local file shrank during upload at offset {offset}")
+                    remote_file.write(data)
+                    offset += len(data)
+                    advance(len(data))
+
+        def checkpoint():
+            save_journal(journal, file_size, source_mtime, ranges)
+
+        try:
+            self._run_segments(
+                sftp, ranges, file_size, send_range, report,
+                checkpoint if journal else None, progress,
+            )
+        except Exception:
+            if not journal:
+                # Ranges may have left holes, never leave a file that looks complete
+                try:
+                    sftp.remove(target_path)
+                except Exception:
+                    pass
+            raise
+
+        if journal:
+            remove_journal(journal)
+
+    def _download_sequential(
+        self, remote_path: str, target_path: str, file_size: int, offset: int, report, sftp
+    ):
+        """Download a file sequentially into `target_path`, continuing at `offset`.
+
+        `target_path` is the .part file when the download can be resumed.
+        """
+        with sftp.open(remote_path, 'rb') as remote_file, \
+                open(target_path, 'r+b' if offset else 'wb') as local_file:
+            local_file.seek(offset)
+            local_file.truncate()
+            transferred = [offset]  # Use list to allow modification in nested function
+
+            def consume(data):
+                local_file.write(data)
+                transferred[0] += len(data)
+                report(transferred[0], file_size)
+
+            self._read_pipelined(sftp, remote_file, offset, file_size, consume)
+
+    def _upload_resumable(
+        self, local_path: str, part_path: str, file_size: int, offset: int, report, sftp
+    ):
+        """Upload a file sequentially into a remote .part file, continuing at `offset`."""
+        with open(local_path, 'rb') as local_file, \
+                sftp.open(part_path, 'r+b' if offset else 'wb') as remote_file:
+            remote_file.set_pipelined(True)
+            local_file.seek(offset)
+            remote_file.seek(offset)
+            transferred = offset
+            while True:
+                data = local_file.read(remote_file.MAX_REQUEST_SIZE)
+                if not data:
+                    break
+                remote_file.write(data)
+                transferred += len(data)
+                report(transferred, file_size)
+
+    def _commit_remote_part(self, sftp, part_path: str, remote_path: str):
+        """Atomically move a completed remote .part file into place."""
+        try:
+            sftp.posix_rename(part_path, remote_path)
+        except IOError:
+            # Server without posix-rename@openssh.com: plain SFTP rename refuses to overwrite
+            try:
+                sftp.remove(remote_path)
+            except IOError:
+                pass
+            sftp.rename(part_path, remote_path)
+
+    def _has_remote_python(self) -> bool:
+        """Check (once per client) whether the remote shell provides python3 (delta helper)."""
+        import logging
+
+        if self._remote_python is None:
+            try:
+                stdin, stdout, stderr = self.client.exec_command("command -v python3")
+                self._remote_python = stdout.channel.recv_exit_status() == 0
+            except Exception as e:
+                logging.debug(f"  Remote python3 check failed: {e}")
+                self._remote_python = False
+            logging.debug(f"  Remote python3 available: {self._remote_python}")
+        return self._remote_python
+
+    def _use_delta(self, file_size: int) -> bool:
+        """Check whether a delta transfer should be tried for a file of this size."""
+        if not self.delta or file_size < delta.DELTA_MIN_SIZE or self.client is None:
+            return False
+        return self._has_remote_python()
+
+    def _delta_command(self, *args) -> str:
+        """Build the shell command running the delta helper on the remote host."""
+        source = Path(delta.__file__).read_text()
+        arguments = [shlex.quote(str(arg)) for arg in args]
+        return " ".join(["python3", "-c", shlex.quote(source)] + arguments)
+
+    def _finish_delta_command(self, channel, stderr):
+        """Wait for the remote delta helper and raise if it failed."""
+        exit_status = channel.recv_exit_status()
+        if exit_status == delta.EXIT_NOT_WORTHWHILE:
+            raise delta.DeltaNotWorthwhile(stderr.read().decode(errors='replace').strip())
+        if exit_status != 0:
+            error = stderr.read().decode(errors='replace').strip()
+            raise IOError(f"Delta helper exited with {exit_status}: {error}")
+
+    def _upload_delta(
+        self, local_path: str, remote_path: str, file_size: int, report, sftp
+    ) -> Optional[int]:
+        """Update an existing remote file by sending only what changed.
+
+        The remote helper sends the block signatures of the old remote file, the
+        delta against them is computed locally and applied remotely to a
+        temporary file that then replaces the target.
+
+        Args:
+            local_path: Local file path
+            remote_path: Remote file path (the basis)
+            file_size: Local file size in bytes
+            report: Callback (transferred, total) for progress and cancellation
+            sftp: SFTP channel of the caller
+
+        Returns:
+            Number of literal bytes sent, or None if the file has to be sent in full
+        """
+        import logging
+
+        try:
+            basis_size = sftp.stat(remote_path).st_size
+        except IOError:
+            return None
+        if not basis_size:
+            return None
+
+        block_size = delta.block_size_for(basis_size)
+        temp_path = remote_path + delta.DELTA_SUFFIX
+        channel = None
+        try:
+            command = self._delta_command("signature", remote_path, block_size)
+            stdin, stdout, stderr = self.client.exec_command(command)
+            signature = delta.read_signature(stdout)
+            self._finish_delta_command(stdout.channel, stderr)
+            logging.debug(f"  Delta: {len(signature[2])} block signature(s) of {block_size} bytes")
+
+            command = self._delta_command("patch", remote_path, temp_path, block_size)
+            stdin, stdout, stderr = self.client.exec_command(command)
+            channel = stdin.channel
+            literal = 0
+            with open(local_path, 'rb') as local_file:
+                ops = delta.compute_delta(
+                    local_file, signature, lambda scanned: report(scanned, file_size)
+                )
+                for op in ops:
+                    if op[:1] == b"D":
+                        literal += len(op) - 5
+                    stdin.write(op)
+            channel.shutdown_write()
+            self._finish_delta_command(channel, stderr)
+            report(file_size, file_size)
+            self._commit_remote_part(sftp, temp_path, remote_path)
+            return literal
+
+        except Exception as e:
+            if channel:
+                channel.close()
+            try:
+                sftp.remove(temp_path)
+            except Exception:
+                pass
+            if isinstance(e, TransferCancelled):
+                raise
+            logging.debug(f"  Delta upload not used: {type(e).__name__}: {e}")
+            return None
+
+    def _download_delta(
+        self, remote_path: str, local_path: str, file_size: int, report
+    ) -> Optional[int]:
+        """Update an existing local file by receiving only what changed.
+
+        The block signatures of the old local file are sent to the remote
+        helper, which streams back the delta; it is applied to a temporary file
+        that then replaces the target.
+
+        Args:
+            remote_path: Remote file path
+            local_path: Local file path (the basis)
+            file_size: Remote file size in bytes
+            report: Callback (transferred, total) for progress and cancellation
+
+        Returns:
+            Number of literal bytes received, or None if the file has to be fetched in full
+        """
+        import logging
+
+        try:
+            basis_size = os.path.getsize(local_path)
+        except OSError:
+            return None
+        if not basis_size:
+            return None
+
+        block_size = delta.block_size_for(basis_size)
+        temp_path = local_path + delta.DELTA_SUFFIX
+        channel = None
+        try:
+            command = self._delta_command("delta", remote_path)
+            stdin, stdout, stderr = self.client.exec_command(command)
+            channel = stdin.channel
+            with open(local_path, 'rb') as basis:
+                delta.write_signature(basis, basis_size, block_size, stdin)
+            channel.shutdown_write()
+
+            counter = _CountingReader(stdout)
+            with open(local_path, 'rb') as basis, open(temp_path, 'wb') as temp_file:
+                delta.apply_delta(
+                    basis, block_size, counter, temp_file,
+                    lambda written: report(written, file_size),
+                )
+            self._finish_delta_command(channel, stderr)
+            report(file_size, file_size)
+            os.replace(temp_path, local_path)
+            return counter.count
+
+        except Exception as e:
+            if channel:
+                channel.close()
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            if isinstance(e, TransferCancelled):
+                raise
+            logging.debug(f"  Delta download not used: {type(e).__name__}: {e}")
+            return None
+
+    def upload_file(
+        self, local_path: str, remote_path: str, progress_callback=None, cancel_check=None,
+        sftp=None, check_unchanged: bool = True, manifest: Optional[TransferManifest] = None,
+        root: Optional[str] = None,
+    ) -> bool:
         """Upload a single file.
 
+        Large files are written to a remote .part file first and moved into place
+        once complete, so an interrupted upload can be resumed (see `resume`).
+
         Args:
             local_path: Local file path
             remote_path: Remote file path
             progress_callback: Optional callback for progress updates
             cancel_check: Optional callable that returns True if operation should be cancelled
+            sftp: Optional SFTP channel to use instead of the shared session
+            check_unchanged: In sync mode, stat the target and skip it if unchanged
+                (directory transfers already decided this from one listing)
+            manifest: Optional job manifest the transferred bytes are accounted in
+            root: Manifest root to account the file in once it finishes, its outcome
+                included (directory transfers account their files themselves)
 
         Returns:
-            True if upload successful, False otherwise
+            True if upload successful (or skipped as unchanged), False otherwise
+        """
+        state = self._upload_file(
+            local_path, remote_path, progress_callback, cancel_check, sftp, check_unchanged,
+            manifest,
+        )
+        if manifest and root is not None:
+            manifest.file_finished(root, local_path, manifest.root_bytes(root), state)
+        return state in (DONE, SKIPPED)
+
+    def _upload_file(
+        self, local_path: str, remote_path: str, progress_callback=None, cancel_check=None,
+        sftp=None, check_unchanged: bool = True, manifest: Optional[TransferManifest] = None,
+    ) -> str:
+        """Upload a single file, see `upload_file`.
+
+        Returns:
+            DONE, SKIPPED (unchanged in sync mode), CANCELLED or FAILED
         """
         import logging
 
@@ -361,121 +1912,142 @@ class SCPClient:
         # 🛑 Check for cancellation before starting
         if cancel_check and cancel_check():
             logging.debug("  Upload cancelled before starting")
-            return False
+            return CANCELLED
 
-        if not self.sftp:
+        sftp = sftp or self.sftp
+        if not sftp:
             logging.error("  SFTP connection not available")
-            return False
+            return FAILED
 
         try:
             # Check if local file exists
             if not os.path.exists(local_path):
                 logging.error(f"  Local file does not exist: {local_path}")
-                return False
+                return FAILED
 
-            file_size = os.path.getsize(local_path)
+            local_stat = os.stat(local_path)
+            file_size = local_stat.st_size
             logging.debug(f"  Local file size: {file_size} bytes")
 
+            if self.sync and check_unchanged:
+                try:
+                    remote_stat = sftp.stat(remote_path)
+                    target = (remote_stat.st_size, remote_stat.st_mtime or 0)
+                except IOError:
+                    target = None
+                if self._is_unchanged(file_size, local_stat.st_mtime, target):
+                    logging.debug(f"  Unchanged, skipping: {remote_path}")
+                    if progress_callback:
+                        progress_callback(f"⏭️  {Path(local_path).name}: unchanged")
+                    return SKIPPED
+
             # Check remote directory exists
             remote_dir = os.path.dirname(remote_path)
             if remote_dir:
                 logging.debug(f"  Remote directory: {remote_dir}")
                 try:
-                    self.sftp.stat(remote_dir)
+                    sftp.stat(remote_dir)
                     logging.debug(f"  Remote directory exists")
                 except FileNotFoundError:
                     logging.debug(f"  Creating remote directory: {remote_dir}")
-                    self._create_remote_directory(remote_dir)
+                    self._create_remote_directory(remote_dir, sftp=sftp)
 
             logging.debug(f"  Starting SFTP put operation...")
-
-            # Format file size for display
-            def format_size(size_bytes):
-                """Format bytes to human readable string."""
-                for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                    if size_bytes < 1024.0:
-                        return f"{size_bytes:.1f} {unit}"
-                    size_bytes /= 1024.0
-                return f"{size_bytes:.1f} PB"
+            self.listing_cache.invalidate(remote_dir)
 
             file_name = Path(local_path).name
-            start_time = time.time()
+            resumable = self._use_resume(file_size)
+            keep_target = False
+            part_path = remote_path + PARTIAL_SUFFIX
 
-            # Use callback-based progress reporting and cancellation check
-            try:
-                # Define callback that enforces cancellation
-                def check_cancel_and_report(transferred, total):
-                    # Check for cancellation during transfer
-                    if cancel_check and cancel_check():
-                        # 🛑 FORCE STOP: Close SFTP session to break blocking I/O immediately
-                        if self.sftp:
-                            try:
-                                self.sftp.close()
-                            except:
-                                pass
-                        raise Exception("Transfer cancelled by user")
+            def transfer_callback(initial: int = 0):
+                # The chunk callback reports progress and raises TransferCancelled
+                return self._make_transfer_callback(
+                    file_name, progress_callback, cancel_check, initial, manifest, local_path
+                )
 
+            try:
+                literal = None
+                if self._use_delta(file_size):
+                    # The existing remote file is the basis, a cancelled delta must not remove it
+                    keep_target = True
+                    literal = self._upload_delta(
+                        local_path, remote_path, file_size, transfer_callback(), sftp
+                    )
+                    keep_target = False
+
+                if literal is not None:
+                    resumable = False
+                    logging.debug(f"  Delta upload sent {literal} literal bytes")
                     if progress_callback:
-                        # Report every 1% or at completion (more frequent updates for smoother UI)
-                        progress_percent = (transferred / total * 100) if total > 0 else 0
-                        last_percent = (last_reported[0] / total * 100) if total > 0 else 0
-
-                        if transferred == total or progress_percent - last_percent >= 1:
-                            # Calculate speed
-                            elapsed = time.time() - start_time
-                            if elapsed > 0:
-                                speed = transferred / elapsed
-                                speed_str = f"{format_size(speed)}/s"
-                            else:
-                                speed_str = "..."
-
-                            transferred_str = format_size(transferred)
-                            total_str = format_size(total)
-                            progress_msg = f"📄 {file_name}: {transferred_str} / {total_str} ({progress_percent:.0f}%) - {speed_str}"
-                            progress_callback(progress_msg)
-                            last_reported[0] = transferred
-
-                if progress_callback:
-                    last_reported = [0]  # Use list to allow modification in nested function
-                    self.sftp.put(local_path, remote_path, callback=check_cancel_and_report)
+                        progress_callback(
+                            f"🧩 {file_name}: sent {format_size(literal)} of "
+                            f"{format_size(file_size)} as delta"
+                        )
+                elif self._use_segments(file_size):
+                    journal = None
+                    if resumable:
+                        journal = self._journal_path("upload", remote_path, local_path)
+                    self._upload_segmented(
+                        local_path, part_path if resumable else remote_path, file_size,
+                        transfer_callback(), sftp, journal, manifest.progress if manifest else None,
+                    )
+                elif resumable:
+                    offset = 0
+                    try:
+                        part_size = sftp.stat(part_path).st_size
+                        fits = 0 < part_size <= file_size
+                        if fits and self._tail_matches(sftp, part_path, local_path, part_size):
+                            offset = part_size
+                    except IOError:
+                        pass
+                    if offset:
+                        logging.debug(f"  Resuming upload at offset {offset}")
+                        if progress_callback:
+                            progress_callback(f"↩️  Resuming {file_name} at {format_size(offset)}")
+                    self._upload_resumable(
+                        local_path, part_path, file_size, offset, transfer_callback(offset), sftp
+                    )
                 else:
-                    self.sftp.put(local_path, remote_path, callback=check_cancel_and_report)
+                    sftp.put(local_path, remote_path, callback=transfer_callback())
+
+                if resumable:
+                    self._commit_remote_part(sftp, part_path, remote_path)
 
             except Exception as e:
-                # If cancelled, we might get various exceptions
-                is_cancelled = (cancel_check and cancel_check()) or "Transfer cancelled by user" in str(e) or "Session is closed" in str(e)
+                # Cancellation surfaces as TransferCancelled from the chunk callback; an error
+                # raised once the user cancelled is not reported as a failure either
+                is_cancelled = isinstance(e, TransferCancelled) or (cancel_check and cancel_check())
 
                 if is_cancelled:
                     logging.debug(f"  Transfer cancelled by user (caught {type(e).__name__}: {e})")
-                    
-                    # 🔄 Try to restore SFTP session/connection
-                    try:
-                        transport_active = self.client and self.client.get_transport() and self.client.get_transport().is_active()
-                        
-                        if not transport_active:
-                             logging.debug("  SSH transport is dead. Reconnecting...")
-                             # Re-connect
-                             if self.connect():
-                                 logging.debug("  Reconnection successful.")
-                             else:
-                                 logging.error("  Reconnection failed.")
-                        
-                        elif self.client and (not self.sftp or self.sftp.sock is None):
-                            logging.debug("  Restoring SFTP session after forced close...")
-                            self.sftp = self.client.open_sftp()
-                            logging.debug("  SFTP session restored.")
-                    except Exception as restore_err:
-                        logging.error(f"  Failed to restore connection/session: {restore_err}")
-                        
-                    return False
+
+                    # Clean up partial file, unless it is kept for resuming
+                    if resumable:
+                        logging.debug(f"  Keeping partial file for resume: {part_path}")
+                    elif not keep_target:
+                        try:
+                            sftp.remove(remote_path)
+                            logging.debug(f"  Removed partial file: {remote_path}")
+                        except IOError:
+                            pass  # Never created
+
+                    # Only the file handle of this transfer was closed (after its outstanding
+                    # requests were answered), the SFTP session stays open for the next one
+                    return CANCELLED
 
                 raise e
 
-            logging.debug(f"  SFTP put completed")
+            logging.debug(f"  SFTP upload completed")
+            self.listing_cache.invalidate(remote_dir)
+
+            if self.sync:
+                # Keep the source mtime so the next sync sees the file as unchanged
+                sftp.utime(remote_path, (local_stat.st_atime, local_stat.st_mtime))
 
             # Verify file was actually uploaded
             try:
-                uploaded_stat = self.sftp.stat(remote_path)
+                uploaded_stat = sftp.stat(remote_path)
                 uploaded_size = uploaded_stat.st_size
                 logging.debug(f"  Uploaded file exists: {remote_path}")
                 logging.debug(f"  Uploaded file size: {uploaded_size} bytes")
@@ -488,24 +2060,54 @@ class SCPClient:
 
             console.print(f"✅ [green]Uploaded: {local_path} → {remote_path}[/green]")
             logging.debug("=== upload_file completed successfully ===")
-            return True
+            return DONE
 
         except Exception as e:
             logging.error(f"  Upload failed with exception: {type(e).__name__}: {e}", exc_info=True)
             console.print(f"❌ [red]Upload failed: {e}[/red]")
-            return False
+            return FAILED
 
-    def download_file(self, remote_path: str, local_path: str, progress_callback=None, cancel_check=None) -> bool:
+    def download_file(
+        self, remote_path: str, local_path: str, progress_callback=None, cancel_check=None,
+        sftp=None, check_unchanged: bool = True, manifest: Optional[TransferManifest] = None,
+        root: Optional[str] = None,
+    ) -> bool:
         """Download a single file.
 
+        Large files are written to a local .part file first and renamed into place
+        once complete, so an interrupted download can be resumed (see `resume`).
+
         Args:
             remote_path: Remote file path
             local_path: Local file path
             progress_callback: Optional callback for progress updates
             cancel_check: Optional callable that returns True if operation should be cancelled
+            sftp: Optional SFTP channel to use instead of the shared session
+            check_unchanged: In sync mode, stat the target and skip it if unchanged
+                (directory transfers already decided this from one listing)
+            manifest: Optional job manifest the transferred bytes are accounted in
+            root: Manifest root to account the file in once it finishes, its outcome
+                included (directory transfers account their files themselves)
 
         Returns:
-            True if download successful, False otherwise
+            True if download successful (or skipped as unchanged), False otherwise
+        """
+        state = self._download_file(
+            remote_path, local_path, progress_callback, cancel_check, sftp, check_unchanged,
+            manifest,
+        )
+        if manifest and root is not None:
+            manifest.file_finished(root, remote_path, manifest.root_bytes(root), state)
+        return state in (DONE, SKIPPED)
+
+    def _download_file(
+        self, remote_path: str, local_path: str, progress_callback=None, cancel_check=None,
+        sftp=None, check_unchanged: bool = True, manifest: Optional[TransferManifest] = None,
+    ) -> str:
+        """Download a single file, see `download_file`.
+
+        Returns:
+            DONE, SKIPPED (unchanged in sync mode), CANCELLED or FAILED
         """
         import logging
 
@@ -516,19 +2118,32 @@ class SCPClient:
         # 🛑 Check for cancellation before starting
         if cancel_check and cancel_check():
             logging.debug("  Download cancelled before starting")
-            return False
+            return CANCELLED
 
-        if not self.sftp:
+        sftp = sftp or self.sftp
+        if not sftp:
             logging.error("  SFTP connection not available")
-            return False
+            return FAILED
 
         try:
             # Check if remote file exists
             logging.debug(f"  Checking if remote file exists...")
-            file_stat = self.sftp.stat(remote_path)
+            file_stat = sftp.stat(remote_path)
             file_size = file_stat.st_size
             logging.debug(f"  Remote file size: {file_size} bytes")
 
+            if self.sync and check_unchanged:
+                try:
+                    local_stat = os.stat(local_path)
+                    target = (local_stat.st_size, local_stat.st_mtime)
+                except OSError:
+                    target = None
+                if self._is_unchanged(file_size, file_stat.st_mtime or 0, target):
+                    logging.debug(f"  Unchanged, skipping: {local_path}")
+                    if progress_callback:
+                        progress_callback(f"⏭️  {Path(remote_path).name}: unchanged")
+                    return SKIPPED
+
             # Check local directory exists
             local_dir = os.path.dirname(local_path)
             logging.debug(f"  Local directory: {local_dir}")
@@ -538,98 +2153,96 @@ class SCPClient:
 
             logging.debug(f"  Starting SFTP get operation...")
 
-            # Format file size for display
-            def format_size(size_bytes):
-                """Format bytes to human readable string."""
-                for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                    if size_bytes < 1024.0:
-                        return f"{size_bytes:.1f} {unit}"
-                    size_bytes /= 1024.0
-                return f"{size_bytes:.1f} PB"
-
             file_name = Path(remote_path).name
-            start_time = time.time()
+            resumable = self._use_resume(file_size)
+            keep_target = False
+            part_path = local_path + PARTIAL_SUFFIX
 
-            # Use callback-based progress reporting and cancellation check
-            try:
-                # Define callback that enforces cancellation
-                def check_cancel_and_report(transferred, total):
-                    # Check for cancellation during transfer
-                    if cancel_check and cancel_check():
-                        # 🛑 FORCE STOP: Close SFTP session to break blocking I/O immediately
-                        if self.sftp:
-                            try:
-                                self.sftp.close()
-                            except:
-                                pass
-                        raise Exception("Transfer cancelled by user")
+            def transfer_callback(initial: int = 0):
+                # The chunk callback reports progress and raises TransferCancelled
+                return self._make_transfer_callback(
+                    file_name, progress_callback, cancel_check, initial, manifest, remote_path
+                )
 
+            try:
+                literal = None
+                if self._use_delta(file_size):
+                    # The existing local file is the basis, a cancelled delta must not remove it
+                    keep_target = True
+                    literal = self._download_delta(
+                        remote_path, local_path, file_size, transfer_callback()
+                    )
+                    keep_target = False
+
+                if literal is not None:
+                    resumable = False
+                    logging.debug(f"  Delta download received {literal} bytes")
                     if progress_callback:
-                        # Report every 1% or at completion
-                        progress_percent = (transferred / total * 100) if total > 0 else 0
-                        last_percent = (last_reported[0] / total * 100) if total > 0 else 0
-
-                        if transferred == total or progress_percent - last_percent >= 1:
-                            # Calculate speed
-                            elapsed = time.time() - start_time
-                            if elapsed > 0:
-                                speed = transferred / elapsed
-                                speed_str = f"{format_size(speed)}/s"
-                            else:
-                                speed_str = "..."
-
-                            transferred_str = format_size(transferred)
-                            total_str = format_size(total)
-                            progress_msg = f"📄 {file_name}: {transferred_str} / {total_str} ({progress_percent:.0f}%) - {speed_str}"
-                            progress_callback(progress_msg)
-                            last_reported[0] = transferred
-
-                if progress_callback:
-                    last_reported = [0]  # Use list to allow modification in nested function
-                    self.sftp.get(remote_path, local_path, callback=check_cancel_and_report)
+                        progress_callback(
+                            f"🧩 {file_name}: received {format_size(literal)} of "
+                            f"{format_size(file_size)} as delta"
+                        )
+                elif self._use_segments(file_size):
+                    journal = None
+                    if resumable:
+                        journal = self._journal_path("download", remote_path, local_path)
+                    self._download_segmented(
+                        remote_path, part_path if resumable else local_path, file_stat,
+                        transfer_callback(), sftp, journal, manifest.progress if manifest else None,
+                    )
+                elif resumable:
+                    offset = 0
+                    if os.path.exists(part_path):
+                        part_size = os.path.getsize(part_path)
+                        fits = 0 < part_size <= file_size
+                        if fits and self._tail_matches(sftp, remote_path, part_path, part_size):
+                            offset = part_size
+                    if offset:
+                        logging.debug(f"  Resuming download at offset {offset}")
+                        if progress_callback:
+                            progress_callback(f"↩️  Resuming {file_name} at {format_size(offset)}")
+                    self._download_sequential(
+                        remote_path, part_path, file_size, offset, transfer_callback(offset), sftp
+                    )
                 else:
-                    self.sftp.get(remote_path, local_path, callback=check_cancel_and_report)
+                    self._download_sequential(
+                        remote_path, local_path, file_size, 0, transfer_callback(), sftp
+                    )
+
+                if resumable:
+                    # Atomic rename, the target never holds a partial file
+                    os.replace(part_path, local_path)
 
             except Exception as e:
-                # If cancelled, we might get various exceptions
-                is_cancelled = (cancel_check and cancel_check()) or "Transfer cancelled by user" in str(e) or "Session is closed" in str(e)
+                # Cancellation surfaces as TransferCancelled from the chunk callback; an error
+                # raised once the user cancelled is not reported as a failure either
+                is_cancelled = isinstance(e, TransferCancelled) or (cancel_check and cancel_check())
                 
                 if is_cancelled:
                     logging.debug(f"  Transfer cancelled by user (caught {type(e).__name__}: {e})")
                     
-                    # Clean up partial file
-                    if os.path.exists(local_path):
+                    # Clean up partial file, unless it is kept for resuming
+                    if resumable:
+                        logging.debug(f"  Keeping partial file for resume: {part_path}")
+                    elif os.path.exists(local_path) and not keep_target:
                         try:
                             os.remove(local_path)
                             logging.debug(f"  Removed partial file: {local_path}")
                         except Exception as rm_err:
                             logging.error(f"  Failed to remove partial file: {rm_err}")
 
-                    # 🔄 Try to restore SFTP session/connection
-                    try:
-                        transport_active = self.client and self.client.get_transport() and self.client.get_transport().is_active()
-                        
-                        if not transport_active:
-                             logging.debug("  SSH transport is dead. Reconnecting...")
-                             # Re-connect
-                             if self.connect():
-                                 logging.debug("  Reconnection successful.")
-                             else:
-                                 logging.error("  Reconnection failed.")
-                        
-                        elif self.client and (not self.sftp or self.sftp.sock is None):
-                            logging.debug("  Restoring SFTP session after forced close...")
-                            self.sftp = self.client.open_sftp()
-                            logging.debug("  SFTP session restored.")
-                    except Exception as restore_err:
-                        logging.error(f"  Failed to restore connection/session: {restore_err}")
-
-                    return False
+                    # Only the file handle of this transfer was closed (after its outstanding
+                    # requests were answered), the SFTP session stays open for the next one
+                    return CANCELLED
                 
                 raise e
 
             logging.debug(f"  SFTP get completed")
 
+            if self.sync and file_stat.st_mtime:
+                # Keep the source mtime so the next sync sees the file as unchanged
+                os.utime(local_path, (file_stat.st_atime or file_stat.st_mtime, file_stat.st_mtime))
+
             # Verify file was actually downloaded
             if os.path.exists(local_path):
                 downloaded_size = os.path.getsize(local_path)
@@ -641,48 +2254,405 @@ class SCPClient:
                     logging.warning(f"  File size mismatch! Expected {file_size}, got {downloaded_size}")
             else:
                 logging.error(f"  Downloaded file does not exist: {local_path}")
-                return False
+                return FAILED
 
             console.print(f"✅ [green]Downloaded: {remote_path} → {local_path}[/green]")
             logging.debug("=== download_file completed successfully ===")
-            return True
+            return DONE
 
         except Exception as e:
             logging.error(f"  Download failed with exception: {type(e).__name__}: {e}", exc_info=True)
             console.print(f"❌ [red]Download failed: {e}[/red]")
-            return False
+            return FAILED
 
-    def _create_remote_directory(self, remote_dir: str):
+    def _create_remote_directory(self, remote_dir: str, sftp=None):
         """Create remote directory recursively.
 
         Args:
             remote_dir: Remote directory path
+            sftp: Optional SFTP channel to use instead of the shared session
         """
         import logging
 
         if not remote_dir or remote_dir == '/':
             return
 
+        sftp = sftp or self.sftp
         try:
-            self.sftp.stat(remote_dir)
+            sftp.stat(remote_dir)
             logging.debug(f"  Directory already exists: {remote_dir}")
         except FileNotFoundError:
             # Directory doesn't exist, create parent first
             parent = os.path.dirname(remote_dir)
             if parent and parent != remote_dir:
-                self._create_remote_directory(parent)
+                self._create_remote_directory(parent, sftp=sftp)
 
             logging.debug(f"  Creating directory: {remote_dir}")
-            self.sftp.mkdir(remote_dir)
+            self.listing_cache.invalidate(parent)
+            try:
+                sftp.mkdir(remote_dir)
+            except IOError:
+                # Another worker may have created it in the meantime
+                sftp.stat(remote_dir)
+
+    def _run_transfer_pool(
+        self, tasks, transfer_one, progress_callback=None, cancel_check=None
+    ) -> bool:
+        """Run file transfers across a pool of SFTP channels.
+
+        Tasks are consumed while they are still being produced, so workers start
+        moving data as soon as the directory walk finds the first file.
+
+        Args:
+            tasks: Iterable of (source, target) tuples, typically a directory walk
+            transfer_one: Callable (source, target, sftp) -> bool transferring one file
+            progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable that returns True if operation should be cancelled
+
+        Returns:
+            True if every task succeeded, False otherwise
+        """
+        import logging
 
-    def upload_directory(self, local_dir: str, remote_dir: str, progress_callback=None, cancel_check=None) -> bool:
+        jobs = max(1, self.jobs)
+        if jobs == 1:
+            all_success = True
+            for source, target in tasks:
+                # 🛑 Check for cancellation before each item
+                if cancel_check and cancel_check():
+                    logging.debug("  Transfer pool cancelled during iteration")
+                    return False
+                if not transfer_one(source, target, self.sftp):
+                    logging.error(f"  Failed to transfer: {source}")
+                    all_success = False
+            return all_success
+
+        task_queue = queue.Queue()
+        lock = threading.Lock()
+        state = {'failed': 0, 'done': 0, 'cancelled': False}
+
+        def is_cancelled():
+            if not state['cancelled'] and cancel_check and cancel_check():
+                state['cancelled'] = True
+            return state['cancelled']
+
+        def worker(worker_id):
+            try:
+                sftp = self.pool.open_sftp()
+            except Exception as e:
+                # Server may limit sessions per connection (MaxSessions)
+                logging.warning(f"  Worker {worker_id}: could not open SFTP channel: {e}")
+                return
+            logging.debug(f"  Worker {worker_id}: SFTP channel opened")
+            try:
+                while True:
+                    task = task_queue.get()
+                    if task is None:
+                        break
+                    if is_cancelled():
+                        continue
+                    source, target = task
+                    try:
+                        result = transfer_one(source, target, sftp)
+                    except Exception as e:
+                        logging.error(f"  Worker {worker_id}: {source} failed: {e}")
+                        result = False
+                    with lock:
+                        state['done'] += 1
+                        if not result:
+                            logging.error(f"  Failed to transfer: {source}")
+                            state['failed'] += 1
+                    if not result and sftp.sock.closed:
+                        # Cancelling keeps the channel open, so the server closed it: replace it
+                        self.pool.release(sftp)
+                        try:
+                            sftp = self.pool.open_sftp()
+                        except Exception as e:
+                            logging.error(
+                                f"  Worker {worker_id}: could not reopen SFTP channel: {e}"
+                            )
+                            return
+            finally:
+                # The channel is closed, its connection stays in the pool for the next job
+                self.pool.release(sftp)
+
+        workers = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(jobs)]
+        for thread in workers:
+            thread.start()
+        logging.debug(f"  Transfer pool started with {jobs} worker(s)")
+
+        queued = 0
+        try:
+            for task in tasks:
+                if is_cancelled():
+                    break
+                task_queue.put(task)
+                queued += 1
+        finally:
+            for _ in workers:
+                task_queue.put(None)
+            for thread in workers:
+                thread.join()
+
+        if is_cancelled():
+            logging.debug("  Transfer pool cancelled")
+            return False
+
+        # If no worker could open a channel, finish the remaining tasks on the shared session
+        while True:
+            try:
+                task = task_queue.get_nowait()
+            except queue.Empty:
+                break
+            if task is None:
+                continue
+            if is_cancelled():
+                logging.debug("  Transfer pool cancelled")
+                return False
+            source, target = task
+            result = transfer_one(source, target, self.sftp)
+            with lock:
+                state['done'] += 1
+                if not result:
+                    logging.error(f"  Failed to transfer: {source}")
+                    state['failed'] += 1
+
+        logging.debug(
+            f"  Transfer pool finished: {state['done']}/{queued} done, {state['failed']} failed"
+        )
+        if progress_callback and queued:
+            connections = self.pool.connection_count
+            over = f"{jobs} channel(s)"
+            if connections > 1:
+                over += f" on {connections} connection(s)"
+            transferred = state['done'] - state['failed']
+            progress_callback(f"📦 {transferred}/{queued} file(s) transferred over {over}")
+        return state['failed'] == 0 and state['done'] == queued
+
+    def _has_remote_tar(self) -> bool:
+        """Check (once per client) whether the remote shell provides tar."""
+        import logging
+
+        if self._remote_tar is None:
+            try:
+                stdin, stdout, stderr = self.client.exec_command("command -v tar")
+                self._remote_tar = stdout.channel.recv_exit_status() == 0
+            except Exception as e:
+                logging.debug(f"  Remote tar check failed: {e}")
+                self._remote_tar = False
+            logging.debug(f"  Remote tar available: {self._remote_tar}")
+        return self._remote_tar
+
+    def _use_tar(self, count_files) -> bool:
+        """Decide whether a directory should be transferred as a tar stream.
+
+        Args:
+            count_files: Callable returning (file_count, total_bytes) of the tree,
+                only called in "auto" mode
+
+        Returns:
+            True if the tar stream mode should be used
+        """
+        import logging
+
+        if self.tar_mode == "never" or not self.client:
+            return False
+        if self.sync:
+            # The archive would carry every file, sync compares them one by one
+            logging.debug("  Sync mode, not using tar stream mode")
+            return False
+        if not self._has_remote_tar():
+            if self.tar_mode == "always":
+                console.print("⚠️  [yellow]tar not available on remote host, using SFTP[/yellow]")
+            return False
+        if self.tar_mode == "always":
+            return True
+
+        file_count, total_bytes = count_files()
+        logging.debug(f"  Tar auto mode: {file_count} file(s), {total_bytes} bytes")
+        if file_count < TAR_AUTO_MIN_FILES:
+            return False
+        return total_bytes / file_count <= TAR_AUTO_MAX_AVG_SIZE
+
+    def _upload_directory_tar(
+        self, local_dir: str, remote_dir: str, entries, manifest: TransferManifest,
+        progress_callback=None, cancel_check=None,
+    ) -> bool:
+        """Upload a directory by streaming a tar archive into `tar xf -` on the remote host.
+
+        The archive is built on the fly from the manifest entries of the local
+        tree, without any temporary file. Progress is reported per file.
+
+        Args:
+            local_dir: Local directory path
+            remote_dir: Remote directory path
+            entries: Manifest entries of local_dir
+            manifest: Manifest the transferred files are accounted in
+            progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable that returns True if operation should be cancelled
+
+        Returns:
+            True if upload successful, False otherwise
+        """
+        import logging
+
+        safe_dir = shlex.quote(remote_dir)
+        # tar creates and overwrites anything below remote_dir
+        self.listing_cache.invalidate(os.path.dirname(remote_dir))
+        self.listing_cache.invalidate(remote_dir, recursive=True)
+        stdin, stdout, stderr = self.client.exec_command(
+            f"mkdir -p {safe_dir} && tar xf - -C {safe_dir}"
+        )
+        channel = stdin.channel
+
+        try:
+            # Follow symlinks like the SFTP path does
+            with tarfile.open(fileobj=stdin, mode='w|', dereference=True) as tar:
+                for entry in entries:
+                    local_item = os.path.join(local_dir, *entry.path.split('/'))
+                    if entry.is_dir:
+                        tar.add(local_item, arcname=entry.path, recursive=False)
+                        continue
+
+                    # 🛑 Check for cancellation before each item
+                    if cancel_check and cancel_check():
+                        raise TransferCancelled()
+
+                    tarinfo = tar.gettarinfo(local_item, arcname=entry.path)
+                    report = self._make_transfer_callback(
+                        os.path.basename(local_item), progress_callback, cancel_check,
+                        manifest=manifest, source=local_item,
+                    )
+                    with open(local_item, 'rb') as local_file:
+                        tar.addfile(tarinfo, _CallbackReader(local_file, tarinfo.size, report))
+                    manifest.file_finished(local_dir, local_item, tarinfo.size)
+                    logging.debug(f"  Streamed: {local_item}")
+            stdin.close()
+        except Exception as e:
+            channel.close()
+            if isinstance(e, TransferCancelled):
+                logging.debug("  Tar upload cancelled by user")
+            else:
+                logging.error(f"  Tar upload failed: {type(e).__name__}: {e}", exc_info=True)
+                console.print(f"❌ [red]Directory upload failed: {e}[/red]")
+            return False
+
+        exit_status = channel.recv_exit_status()
+        self.listing_cache.invalidate(remote_dir, recursive=True)
+        if exit_status != 0:
+            error = stderr.read().decode(errors='replace').strip()
+            logging.error(f"  Remote tar exited with {exit_status}: {error}")
+            error = error or f"tar exited with {exit_status}"
+            console.print(f"❌ [red]Directory upload failed: {error}[/red]")
+            return False
+
+        console.print(f"✅ [green]Uploaded: {local_dir} → {remote_dir}[/green]")
+        return True
+
+    def _download_directory_tar(
+        self, remote_dir: str, local_dir: str, manifest: TransferManifest,
+        progress_callback=None, cancel_check=None,
+    ) -> bool:
+        """Download a directory by unpacking the output of `tar cf -` on the remote host.
+
+        Members are extracted as they arrive, without any temporary archive.
+        Progress is reported per file.
+
+        Args:
+            remote_dir: Remote directory path
+            local_dir: Local directory path
+            manifest: Manifest the transferred files are accounted in
+            progress_callback: Optional callback for progress updates
+            cancel_check: Optional callable that returns True if operation should be cancelled
+
+        Returns:
+            True if download successful, False otherwise
+        """
+        import logging
+
+        # -h: follow symlinks like the SFTP path does
+        stdin, stdout, stderr = self.client.exec_command(
+            f"tar chf - -C {shlex.quote(remote_dir)} ."
+        )
+        channel = stdout.channel
+        local_root = Path(local_dir).resolve()
+        local_root.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with tarfile.open(fileobj=stdout, mode='r|') as tar:
+                for member in tar:
+                    # 🛑 Check for cancellation before each item
+                    if cancel_check and cancel_check():
+                        raise TransferCancelled()
+
+                    target = (local_root / member.name).resolve()
+                    if target != local_root and local_root not in target.parents:
+                        logging.warning(f"  Skipping unsafe tar member: {member.name}")
+                        continue
+
+                    if member.isdir():
+                        target.mkdir(parents=True, exist_ok=True)
+                    elif member.isfile():
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        remote_item = f"{remote_dir.rstrip('/')}/{member.name}"
+                        report = self._make_transfer_callback(
+                            Path(member.name).name, progress_callback, cancel_check,
+                            manifest=manifest, source=remote_item,
+                        )
+                        reader = _CallbackReader(tar.extractfile(member), member.size, report)
+                        with open(target, 'wb') as local_file:
+                            shutil.copyfileobj(reader, local_file)
+                        manifest.file_finished(remote_dir, remote_item, member.size)
+                        logging.debug(f"  Extracted: {target}")
+                    else:
+                        logging.debug(f"  Skipping special tar member: {member.name}")
+        except Exception as e:
+            if isinstance(e, TransferCancelled):
+                channel.close()
+                logging.debug("  Tar download cancelled by user")
+                return False
+            error = str(e)
+            if channel.eof_received:
+                # An empty or cut off archive: tar's own error says why
+                exit_status = channel.recv_exit_status()
+                if exit_status != 0:
+                    error = stderr.read().decode(errors='replace').strip() or error
+            channel.close()
+            logging.error(f"  Tar download failed: {type(e).__name__}: {error}", exc_info=True)
+            console.print(f"❌ [red]Directory download failed: {error}[/red]")
+            return False
+
+        exit_status = channel.recv_exit_status()
+        if exit_status != 0:
+            error = stderr.read().decode(errors='replace').strip()
+            logging.error(f"  Remote tar exited with {exit_status}: {error}")
+            error = error or f"tar exited with {exit_status}"
+            console.print(f"❌ [red]Directory download failed: {error}[/red]")
+            return False
+
+        console.print(f"✅ [green]Downloaded: {remote_dir} → {local_dir}[/green]")
+        return True
+
+    def upload_directory(
+        self, local_dir: str, remote_dir: str, progress_callback=None, cancel_check=None,
+        manifest: Optional[TransferManifest] = None,
+    ) -> bool:
         """Upload directory recursively.
 
+        The local tree is walked once into the transfer manifest: directories are
+        created as their entries come up and files are handed to the transfer pool
+        (see `jobs`) while the walk goes on. Trees of many small files can instead be
+        streamed as one tar archive (see `tar_mode`).
+        In sync mode, files are compared with one listing of each target directory
+        and only new or changed ones are queued.
+
         Args:
             local_dir: Local directory path
             remote_dir: Remote directory path
             progress_callback: Optional callback for progress updates
             cancel_check: Optional callable that returns True if operation should be cancelled
+            manifest: Optional job manifest, which may already be walking local_dir
+                (see `build_manifest`); the transferred files are accounted in it
 
         Returns:
             True if upload successful, False otherwise
@@ -702,34 +2672,93 @@ class SCPClient:
             logging.error("  SFTP connection not available")
             return False
 
-        try:
-            # Create remote directory
-            self._create_remote_directory(remote_dir)
+        manifest = manifest or TransferManifest()
+        entries = manifest.entries(local_dir, lambda: self._local_manifest_walk(local_dir))
 
-            local_path = Path(local_dir)
-            all_success = True
+        def count_local_files():
+            # The tar decision needs the whole tree, keep it for the transfer
+            nonlocal entries
+            entries = list(entries)
+            files = [entry for entry in entries if not entry.is_dir]
+            return len(files), sum(entry.size for entry in files)
 
-            for item in local_path.iterdir():
-                # 🛑 Check for cancellation before each item
-                if cancel_check and cancel_check():
-                    logging.debug("  Upload directory cancelled during iteration")
-                    return False
+        skipped = [0]
+        sizes = {}
 
-                local_item = str(item)
-                remote_item = f"{remote_dir}/{item.name}"
-                logging.debug(f"  Processing: {item.name} (is_dir={item.is_dir()})")
+        def remote_listing(remote_root):
+            """Map the file names of an existing remote directory to (size, mtime).
 
-                if item.is_dir():
-                    result = self.upload_directory(local_item, remote_item, progress_callback=progress_callback, cancel_check=cancel_check)
-                    if not result:
-                        logging.error(f"  Failed to upload directory: {item.name}")
-                        all_success = False
-                else:
-                    result = self.upload_file(local_item, remote_item, progress_callback=progress_callback, cancel_check=cancel_check)
-                    if not result:
-                        logging.error(f"  Failed to upload file: {item.name}")
-                        all_success = False
+            An upload to a symlink writes its target, so symlinks are compared by
+            their target. Returns None if the directory is missing.
+            """
+            try:
+                attrs = self.sftp.listdir_attr(remote_root)
+            except IOError:
+                return None
+            links = [
+                f"{remote_root}/{entry.filename}" for entry in attrs if stat.S_ISLNK(entry.st_mode)
+            ]
+            resolved = self._resolve_symlinks(self.sftp, links)
+            existing = {}
+            for entry in attrs:
+                target = entry
+                if stat.S_ISLNK(entry.st_mode):
+                    _, target = resolved.get(f"{remote_root}/{entry.filename}", (None, None))
+                    if target is None:
+                        continue  # Broken link, the upload replaces it
+                if not stat.S_ISDIR(target.st_mode):
+                    existing[entry.filename] = (target.st_size, target.st_mtime or 0)
+            return existing
+
+        def prepare(remote_root, listings):
+            # Sync compares against one listing of the target directory, not a stat per file
+            existing = remote_listing(remote_root) if self.sync else None
+            if existing is None:
+                # Create remote directory before any of its files are queued
+                self._create_remote_directory(remote_root)
+                existing = {}
+            listings[remote_root] = existing
+
+        def walk():
+            listings = {}
+            prepare(remote_dir, listings)
+            # Parents come before their contents
+            for entry in entries:
+                remote_item = f"{remote_dir}/{entry.path}"
+                if entry.is_dir:
+                    prepare(remote_item, listings)
+                    continue
+                remote_root, name = remote_item.rsplit('/', 1)
+                local_item = os.path.join(local_dir, *entry.path.split('/'))
+                target = listings.get(remote_root, {}).get(name)
+                if self.sync and self._is_unchanged(entry.size, entry.mtime, target):
+                    skipped[0] += 1
+                    manifest.file_finished(local_dir, local_item, entry.size, SKIPPED)
+                    continue
+                sizes[local_item] = entry.size
+                logging.debug(f"  Queueing: {local_item}")
+                yield local_item, remote_item
+
+        def upload_one(local_item, remote_item, sftp):
+            state = self._upload_file(
+                local_item, remote_item, progress_callback, cancel_check, sftp,
+                check_unchanged=False, manifest=manifest,
+            )
+            manifest.file_finished(local_dir, local_item, sizes.pop(local_item, 0), state)
+            return state == DONE
 
+        try:
+            if self._use_tar(count_local_files):
+                logging.debug("  Using tar stream mode")
+                return self._upload_directory_tar(
+                    local_dir, remote_dir, entries, manifest, progress_callback, cancel_check
+                )
+
+            all_success = self._run_transfer_pool(
+                walk(), upload_one, progress_callback, cancel_check
+            )
+            if skipped[0] and progress_callback:
+                progress_callback(f"⏭️  {skipped[0]} unchanged file(s) skipped")
             logging.debug(f"=== upload_directory completed, success={all_success} ===")
             return all_success
 
@@ -738,14 +2767,26 @@ class SCPClient:
             console.print(f"❌ [red]Directory upload failed: {e}[/red]")
             return False
 
-    def download_directory(self, remote_dir: str, local_dir: str, progress_callback=None, cancel_check=None) -> bool:
+    def download_directory(
+        self, remote_dir: str, local_dir: str, progress_callback=None, cancel_check=None,
+        manifest: Optional[TransferManifest] = None,
+    ) -> bool:
         """Download directory recursively.
 
+        The remote tree is walked once into the transfer manifest (see `walk_remote`):
+        directories are created as their entries come up and files are handed to the
+        transfer pool (see `jobs`) while the walk goes on. Trees of many small files can
+        instead be streamed as one tar archive (see `tar_mode`).
+        In sync mode, files are compared with one listing of each target directory
+        and only new or changed ones are queued.
+
         Args:
             remote_dir: Remote directory path
             local_dir: Local directory path
             progress_callback: Optional callback for progress updates
             cancel_check: Optional callable that returns True if operation should be cancelled
+            manifest: Optional job manifest, which may already be walking remote_dir
+                (see `build_manifest`); the transferred files are accounted in it
 
         Returns:
             True if download successful, False otherwise
@@ -765,35 +2806,87 @@ class SCPClient:
             logging.error("  SFTP connection not available")
             return False
 
-        try:
-            # Create local directory
+        manifest = manifest or TransferManifest()
+        entries = manifest.entries(
+            remote_dir, lambda: self._remote_manifest_walk(remote_dir, sftp=self.sftp)
+        )
+
+        def count_remote_files():
+            # The tar decision needs the whole tree, keep it for the transfer
+            nonlocal entries
+            entries = list(entries)
+            files = [entry for entry in entries if not entry.is_dir]
+            return len(files), sum(entry.size for entry in files)
+
+        skipped = [0]
+        not_followed = []
+        sizes = {}
+
+        def local_listing(local_root):
+            """Map file names of a local directory to (size, mtime) with one scan."""
+            existing = {}
+            with os.scandir(local_root) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        entry_stat = entry.stat()
+                        existing[entry.name] = (entry_stat.st_size, entry_stat.st_mtime)
+            return existing
+
+        def walk():
             logging.debug(f"  Creating local directory: {local_dir}")
             Path(local_dir).mkdir(parents=True, exist_ok=True)
+            listings = {}
+
+            # Parents come before their contents, so directories exist before their files are queued
+            for entry in entries:
+                remote_item = f"{remote_dir.rstrip('/')}/{entry.path}"
+                local_item = os.path.join(local_dir, *entry.path.split('/'))
+                if entry.is_dir:
+                    if entry.is_symlink:
+                        # The walk follows symlinked directories, except ones that would loop
+                        logging.error(f"  Symlinked directory not followed: {remote_item}")
+                        not_followed.append(remote_item)
+                        if progress_callback:
+                            progress_callback(f"❌ Symlinked directory not followed: {entry.path}")
+                    else:
+                        logging.debug(f"  Creating local directory: {local_item}")
+                        Path(local_item).mkdir(parents=True, exist_ok=True)
+                    continue
+
+                if self.sync:
+                    # Sync compares against one listing of the target directory, not a stat per file
+                    local_root, name = os.path.split(local_item)
+                    if local_root not in listings:
+                        listings[local_root] = local_listing(local_root)
+                    if self._is_unchanged(entry.size, entry.mtime, listings[local_root].get(name)):
+                        skipped[0] += 1
+                        manifest.file_finished(remote_dir, remote_item, entry.size, SKIPPED)
+                        continue
+
+                sizes[remote_item] = entry.size
+                logging.debug(f"  Queueing: {remote_item}")
+                yield remote_item, local_item
+
+        def download_one(remote_item, local_item, sftp):
+            state = self._download_file(
+                remote_item, local_item, progress_callback, cancel_check, sftp,
+                check_unchanged=False, manifest=manifest,
+            )
+            manifest.file_finished(remote_dir, remote_item, sizes.pop(remote_item, 0), state)
+            return state == DONE
 
-            all_success = True
-
-            for entry in self.sftp.listdir_attr(remote_dir):
-                # 🛑 Check for cancellation before each item
-                if cancel_check and cancel_check():
-                    logging.debug("  Download directory cancelled during iteration")
-                    return False
-
-                remote_item = f"{remote_dir}/{entry.filename}"
-                local_item = os.path.join(local_dir, entry.filename)
-                is_dir = stat.S_ISDIR(entry.st_mode)
-                logging.debug(f"  Processing: {entry.filename} (is_dir={is_dir})")
-
-                if is_dir:
-                    result = self.download_directory(remote_item, local_item, progress_callback=progress_callback, cancel_check=cancel_check)
-                    if not result:
-                        logging.error(f"  Failed to download directory: {entry.filename}")
-                        all_success = False
-                else:
-                    result = self.download_file(remote_item, local_item, progress_callback=progress_callback, cancel_check=cancel_check)
-                    if not result:
-                        logging.error(f"  Failed to download file: {entry.filename}")
-                        all_success = False
-
+        try:
+            if self._use_tar(count_remote_files):
+                logging.debug("  Using tar stream mode")
+                return self._download_directory_tar(
+                    remote_dir, local_dir, manifest, progress_callback, cancel_check
+                )
+
+            all_success = self._run_transfer_pool(
+                walk(), download_one, progress_callback, cancel_check
+            ) and not not_followed
+            if skipped[0] and progress_callback:
+                progress_callback(f"⏭️  {skipped[0]} unchanged file(s) skipped")
             logging.debug(f"=== download_directory completed, success={all_success} ===")
             return all_success
 
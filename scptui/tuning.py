@@ -0,0 +1,152 @@
+"""Bandwidth-delay-product tuning of SSH channel windows, packet size and request depth."""
+
+import json
+import logging
+import math
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+# SFTP read/write request size used by paramiko
+REQUEST_SIZE = 32 * 1024
+
+# Measurements older than this are taken again
+TUNING_MAX_AGE = 7 * 24 * 3600
+
+# Throughput probe: stop after this many bytes or seconds, whichever comes first
+PROBE_MAX_BYTES = 64 * 1024 * 1024
+PROBE_MAX_SECONDS = 2.0
+
+# Assumed bandwidth (1 Gbit/s) when the remote host cannot run the throughput probe
+DEFAULT_BANDWIDTH = 125 * 1000 * 1000
+
+# Bounds of the tuned values (paramiko defaults are a 2 MiB window and 32 KiB packets)
+MIN_WINDOW_SIZE = 2 * 1024 * 1024
+MAX_WINDOW_SIZE = 64 * 1024 * 1024
+MIN_PACKET_SIZE = 32 * 1024
+MAX_PACKET_SIZE = 256 * 1024
+MIN_REQUEST_DEPTH = 64
+
+
+def tuning_path() -> Path:
+    """File holding the tuning results of every host."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(cache_home) / "scptui" / "tuning.json"
+
+
+def _next_power_of_two(value: float) -> int:
+    return 1 << max(0, math.ceil(math.log2(max(1.0, value))))
+
+
+def compute_tuning(rtt: float, bandwidth: float) -> dict:
+    """Derive channel settings from a round-trip time and a throughput.
+
+    The window holds twice the bandwidth-delay product so the sender never
+    waits for a window adjustment, and enough requests are kept in flight to
+    fill it.
+
+    Args:
+        rtt: Round-trip time in seconds
+        bandwidth: Throughput in bytes per second
+
+    Returns:
+        Dict with rtt, bandwidth, window_size, max_packet_size and request_depth
+    """
+    bdp = rtt * bandwidth
+    window_size = min(MAX_WINDOW_SIZE, max(MIN_WINDOW_SIZE, _next_power_of_two(2 * bdp)))
+    max_packet_size = min(MAX_PACKET_SIZE, max(MIN_PACKET_SIZE, _next_power_of_two(bdp / 64)))
+    return {
+        "rtt": rtt,
+        "bandwidth": bandwidth,
+        "window_size": window_size,
+        "max_packet_size": max_packet_size,
+        "request_depth": max(MIN_REQUEST_DEPTH, window_size // REQUEST_SIZE),
+    }
+
+
+def measure_rtt(sftp, samples: int = 5) -> float:
+    """Measure the SFTP round-trip time as the fastest of a few stat requests."""
+    best = None
+    for _ in range(samples):
+        start = time.perf_counter()
+        sftp.stat(".")
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_bandwidth(transport) -> Optional[float]:
+    """Measure download throughput by streaming zeros from the remote shell.
+
+    The probe channel gets the largest window so the result is not capped by
+    the window being tuned.
+
+    Args:
+        transport: Connected paramiko transport
+
+    Returns:
+        Bytes per second, or None if the remote host cannot run the probe
+    """
+    try:
+        channel = transport.open_session(
+            window_size=MAX_WINDOW_SIZE, max_packet_size=MAX_PACKET_SIZE
+        )
+        channel.exec_command(f"head -c {PROBE_MAX_BYTES} /dev/zero")
+    except Exception as e:
+        logging.debug(f"  Bandwidth probe could not start: {e}")
+        return None
+
+    try:
+        # Time from the first chunk on, so the command start-up is not counted
+        first = channel.recv(REQUEST_SIZE)
+        if not first:
+            return None
+        start = time.perf_counter()
+        received = 0
+        while time.perf_counter() - start < PROBE_MAX_SECONDS:
+            data = channel.recv(1024 * 1024)
+            if not data:
+                break
+            received += len(data)
+        elapsed = time.perf_counter() - start
+    except Exception as e:
+        logging.debug(f"  Bandwidth probe failed: {e}")
+        return None
+    finally:
+        channel.close()
+
+    if received < 1024 * 1024 or elapsed <= 0:
+        return None
+    return received / elapsed
+
+
+def load_tuning(key: str) -> Optional[dict]:
+    """Load the saved tuning of a host, if it is recent enough."""
+    try:
+        with open(tuning_path()) as f:
+            entry = json.load(f).get(key)
+    except (OSError, ValueError):
+        return None
+    if not entry or time.time() - entry.get("measured_at", 0) > TUNING_MAX_AGE:
+        return None
+    return entry
+
+
+def save_tuning(key: str, tuning: dict):
+    """Save the tuning of a host next to the ones of other hosts."""
+    path = tuning_path()
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data[key] = dict(tuning, measured_at=time.time())
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.warning(f"  Could not save tuning {path}: {e}")
@@ -1,111 +1,287 @@
 """Terminal UI components using Textual."""
 
 import os
+import bisect
 import logging
+import math
+import threading
+import time
 from pathlib import Path
-from typing import List, Optional, Callable
+from typing import Iterable, List, Optional, Callable
 
+from textual import events
 from textual.app import App, ComposeResult
 from textual.containers import Container, Vertical, Horizontal
-from textual.widgets import Header, Footer, Static, Button, Label, ListView, ListItem, ProgressBar, Input
+from textual.geometry import Size
+from textual.widgets import Header, Footer, Static, Button, Label, ProgressBar, Input
 from textual.binding import Binding
 from textual.message import Message
 from textual.screen import ModalScreen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.worker import get_current_worker
+from rich.markup import escape
 from rich.text import Text
 
+from scptui.entry_store import EntryStore, FileEntry
+from scptui.manifest import TransferManifest
+from scptui.progress import CANCELLED, DONE, FAILED, ProgressEvent
+
 # Logging will be configured in main.py based on --debug flag
 
+# Listing prefetch: delay before the highlighted directory is listed, and how many
+# directory neighbours on each side are listed after it
+PREFETCH_DELAY = 0.3
+PREFETCH_SIBLINGS = 1
+# Prefetch listings running at once (stale ones may still be finishing)
+PREFETCH_CONCURRENCY = 1
+
+# Progress of a copy job: redraws per second (progress events are sampled, never pushed),
+# and time constant (seconds) of the moving averages of the byte and file rates the ETA is
+# derived from
+PROGRESS_FRAME_RATE = 10
+RATE_SMOOTHING = 5.0
+
+# Status lines kept in the progress modal
+PROGRESS_STATUS_LINES = 50
+
+
+def _format_size(size: int) -> str:
+    """Format file size in human-readable format."""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024.0:
+            return f"{size:.1f} {unit}"
+        size /= 1024.0
+    return f"{size:.1f} PB"
+
+
+def _entry_markup(entry: FileEntry) -> str:
+    """Build the Rich markup of an entry's row."""
+    # Format display and calculate display width
+    if entry.file_name == "..":
+        icon = "⬆️ "
+        display = (
+            f"{icon} [bold yellow]{entry.file_name}[/bold yellow] [dim](Parent Directory)[/dim]"
+        )
+        # icon(2) + space(1)
+        display_width = len(entry.file_name) + len(" (Parent Directory)") + 3
+    elif entry.is_symlink:
+        # Symlink - show with arrow to target
+        if entry.target_is_dir:
+            icon = "📁🔗"
+            display = (
+                f"{icon} [bold cyan]{escape(entry.file_name)}/[/bold cyan] "
+                f"[dim]→ {escape(entry.symlink_target)}[/dim]"
+            )
+            # icons(4) + " / → "(5)
+            display_width = len(entry.file_name) + len(entry.symlink_target) + 9
+        else:
+            icon = "📄🔗"
+            size_str = _format_size(entry.file_size)
+            display = (
+                f"{icon} {escape(entry.file_name)} "
+                f"[dim]({size_str}) → {escape(entry.symlink_target)}[/dim]"
+            )
+            # icons(4) + " () → "(9)
+            display_width = (
+                len(entry.file_name) + len(size_str) + len(entry.symlink_target) + 13
+            )
+    elif entry.is_directory:
+        icon = "📁"
+        display = f"{icon} [bold cyan]{escape(entry.file_name)}/[/bold cyan]"
+        display_width = len(entry.file_name) + 4  # icon(2) + space(1) + /(1)
+    else:
+        icon = "📄"
+        size_str = _format_size(entry.file_size)
+        display = f"{icon} {escape(entry.file_name)} [dim]({size_str})[/dim]"
+        display_width = len(entry.file_name) + len(size_str) + 7  # icon(2) + space(1) + " ()"(4)
+
+    # Add time information with dynamic spacing for alignment
+    if entry.ctime > 0 and entry.mtime > 0:
+        from datetime import datetime
+        ctime_str = datetime.fromtimestamp(entry.ctime).strftime('%Y-%m-%d %H:%M:%S')
+        mtime_str = datetime.fromtimestamp(entry.mtime).strftime('%Y-%m-%d %H:%M:%S')
+
+        # Calculate spaces needed to align at target column (50)
+        target_column = 50
+        spaces_needed = max(2, target_column - display_width)
+        spaces = " " * spaces_needed
+
+        display += f"{spaces}[dim]ctime: {ctime_str}  mtime: {mtime_str}[/dim]"
+
+    return display
+
+
+class FileList(ScrollView, can_focus=True):
+    """Virtualized list of file entries.
+
+    Entries live in an `EntryStore` and only the rows on screen are rendered
+    (Textual's line API), so memory and render time do not grow with the
+    size of the directory. The owner changes the store and calls
+    `entries_changed` afterwards.
+    """
+
+    COMPONENT_CLASSES = {"file-list--cursor", "file-list--selected"}
+
+    DEFAULT_CSS = """
+    FileList {
+        background: $surface;
+    }
+
+    FileList > .file-list--selected {
+        background: $accent 30%;
+    }
+
+    FileList > .file-list--cursor {
+        color: $block-cursor-blurred-foreground;
+        background: $block-cursor-blurred-background;
+        text-style: $block-cursor-blurred-text-style;
+    }
+
+    FileList:focus > .file-list--cursor {
+        color: $block-cursor-foreground;
+        background: $block-cursor-background;
+        text-style: $block-cursor-text-style;
+    }
+    """
+
+    BINDINGS = [
+        Binding("up", "cursor_up", "Cursor Up", show=False),
+        Binding("down", "cursor_down", "Cursor Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+    ]
+
+    class Highlighted(Message):
+        """Posted when the cursor moves to another entry."""
+
+        def __init__(self, file_list: "FileList", index: int):
+            super().__init__()
+            self.file_list = file_list
+            self.index = index
+
+        @property
+        def control(self) -> "FileList":
+            return self.file_list
 
-class FileListItem(ListItem):
-    """Custom list item for file/folder display."""
+    class Selected(Message):
+        """Posted when an entry is clicked."""
 
-    def __init__(self, name: str, is_dir: bool, size: int = 0, is_symlink: bool = False,
-                 symlink_target: str = "", target_is_dir: bool = False,
-                 ctime: float = 0, mtime: float = 0, *args, **kwargs):
-        """Initialize file list item.
+        def __init__(self, file_list: "FileList", index: int):
+            super().__init__()
+            self.file_list = file_list
+            self.index = index
+
+        @property
+        def control(self) -> "FileList":
+            return self.file_list
+
+    def __init__(self, entries: EntryStore, id: Optional[str] = None):
+        """Initialize file list.
 
         Args:
-            name: File/folder name
-            is_dir: Whether this is a directory (or symlink to directory)
-            size: File size in bytes
-            is_symlink: Whether this is a symbolic link
-            symlink_target: Target path if this is a symlink
-            target_is_dir: Whether the symlink target is a directory
-            ctime: Creation time (timestamp)
-            mtime: Modification time (timestamp)
+            entries: Entries to show, shared with (and changed by) the owner
+            id: Widget ID
         """
-        super().__init__(*args, **kwargs)
-        self.file_name = name
-        self.is_directory = is_dir
-        self.file_size = size
-        self.is_selected = False
-        self.is_symlink = is_symlink
-        self.symlink_target = symlink_target
-        self.target_is_dir = target_is_dir
-        self.ctime = ctime
-        self.mtime = mtime
+        super().__init__(id=id)
+        self.entries = entries
+        self._index: Optional[int] = None
+
+    @property
+    def index(self) -> Optional[int]:
+        """Index of the entry under the cursor, or None for an empty list."""
+        return self._index
+
+    @index.setter
+    def index(self, value: Optional[int]) -> None:
+        if not self.entries:
+            value = None
+        elif value is not None:
+            value = max(0, min(value, len(self.entries) - 1))
+        if value == self._index:
+            return
+        self._index = value
+        self.refresh()
+        if value is not None:
+            self._scroll_to_row(value)
+            self.post_message(self.Highlighted(self, value))
+
+    def clear(self) -> None:
+        """Drop every entry but ".." and reset the cursor."""
+        self.entries.clear()
+        self._index = None
+        self.entries_changed()
+
+    def entries_changed(self) -> None:
+        """Update the scroll range and cursor after `entries` changed in place."""
+        self.virtual_size = Size(self.size.width, len(self.entries))
+        if self.entries and (self._index is None or self._index >= len(self.entries)):
+            self.index = min(self._index or 0, len(self.entries) - 1)
+        self.refresh()
 
-    def compose(self) -> ComposeResult:
-        """Compose the list item."""
-        # Format display and calculate display width
-        if self.file_name == "..":
-            icon = "⬆️ "
-            display = f"{icon} [bold yellow]{self.file_name}[/bold yellow] [dim](Parent Directory)[/dim]"
-            display_width = len(self.file_name) + len(" (Parent Directory)") + 3  # icon(2) + space(1)
-        elif self.is_symlink:
-            # Symlink - show with arrow to target
-            if self.target_is_dir:
-                icon = "📁🔗"
-                display = f"{icon} [bold cyan]{self.file_name}/[/bold cyan] [dim]→ {self.symlink_target}[/dim]"
-                display_width = len(self.file_name) + len(self.symlink_target) + 9  # icons(4) + " / → "(5)
-            else:
-                icon = "📄🔗"
-                size_str = self._format_size(self.file_size)
-                display = f"{icon} {self.file_name} [dim]({size_str}) → {self.symlink_target}[/dim]"
-                display_width = len(self.file_name) + len(size_str) + len(self.symlink_target) + 13  # icons(4) + " () → "(9)
-        elif self.is_directory:
-            icon = "📁"
-            display = f"{icon} [bold cyan]{self.file_name}/[/bold cyan]"
-            display_width = len(self.file_name) + 4  # icon(2) + space(1) + /(1)
-        else:
-            icon = "📄"
-            size_str = self._format_size(self.file_size)
-            display = f"{icon} {self.file_name} [dim]({size_str})[/dim]"
-            display_width = len(self.file_name) + len(size_str) + 7  # icon(2) + space(1) + " ()"(4)
-
-        # Add time information with dynamic spacing for alignment
-        if self.ctime > 0 and self.mtime > 0:
-            from datetime import datetime
-            ctime_str = datetime.fromtimestamp(self.ctime).strftime('%Y-%m-%d %H:%M:%S')
-            mtime_str = datetime.fromtimestamp(self.mtime).strftime('%Y-%m-%d %H:%M:%S')
-
-            # Calculate spaces needed to align at target column (50)
-            target_column = 50
-            spaces_needed = max(2, target_column - display_width)
-            spaces = " " * spaces_needed
-
-            display += f"{spaces}[dim]ctime: {ctime_str}  mtime: {mtime_str}[/dim]"
-
-        yield Label(display)
-
-    def _format_size(self, size: int) -> str:
-        """Format file size in human-readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024.0:
-                return f"{size:.1f} {unit}"
-            size /= 1024.0
-        return f"{size:.1f} PB"
-
-    def toggle_selection(self):
-        """Toggle selection state."""
-        if self.file_name == "..":
-            return  # Cannot select parent directory
-
-        self.is_selected = not self.is_selected
-        if self.is_selected:
-            self.add_class("selected")
-        else:
-            self.remove_class("selected")
+    def on_resize(self) -> None:
+        self.virtual_size = Size(self.size.width, len(self.entries))
+
+    def _scroll_to_row(self, index: int) -> None:
+        height = self.scrollable_content_region.height
+        if height <= 0:
+            return
+        top = self.scroll_offset.y
+        if index < top:
+            self.scroll_to(y=index, animate=False)
+        elif index >= top + height:
+            self.scroll_to(y=index - height + 1, animate=False)
+
+    def render_line(self, y: int) -> Strip:
+        """Render one visible row."""
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        style = self.rich_style
+        if index >= len(self.entries):
+            return Strip.blank(width, style)
+
+        entry = self.entries[index]
+        if entry.is_selected:
+            style += self.get_component_rich_style("file-list--selected")
+        if index == self._index:
+            style += self.get_component_rich_style("file-list--cursor")
+
+        text = Text.from_markup(" " + _entry_markup(entry))
+        text.no_wrap = True
+        text.stylize_before(style)
+        strip = Strip(text.render(self.app.console), text.cell_len)
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+    def on_click(self, event: events.Click) -> None:
+        index = self.scroll_offset.y + event.y
+        if index < len(self.entries):
+            self.focus()
+            self.index = index
+            self.post_message(self.Selected(self, index))
+
+    def _page_height(self) -> int:
+        return max(1, self.scrollable_content_region.height - 1)
+
+    def action_cursor_up(self) -> None:
+        self.index = 0 if self._index is None else self._index - 1
+
+    def action_cursor_down(self) -> None:
+        self.index = 0 if self._index is None else self._index + 1
+
+    def action_page_up(self) -> None:
+        self.index = (self._index or 0) - self._page_height()
+
+    def action_page_down(self) -> None:
+        self.index = (self._index or 0) + self._page_height()
+
+    def action_first(self) -> None:
+        self.index = 0
+
+    def action_last(self) -> None:
+        self.index = len(self.entries) - 1
 
 
 class ConfirmModal(ModalScreen[bool]):
@@ -248,23 +424,40 @@ class ProgressModal(ModalScreen):
     }
     """
 
-    def __init__(self, title: str = "📦 Copying Files", total_items: int = 0, cancel_callback: Optional[Callable] = None):
+    def __init__(
+        self,
+        title: str = "📦 Copying Files",
+        total_items: int = 0,
+        cancel_callback: Optional[Callable] = None,
+        manifest: Optional[TransferManifest] = None,
+    ):
         """Initialize progress modal.
 
         Args:
             title: Modal title
             total_items: Total number of items to copy
             cancel_callback: Optional callback to cancel the operation
+            manifest: Optional manifest of the copy job; its totals and progress
+                events are sampled once per frame
         """
         super().__init__()
         self.title = title
         self.status_messages: List[str] = []
+        self.active_lines: List[str] = []  # One per file in flight
+        self._rendered_status = None
         self.current_progress = 0.0
         self.start_time = None
         self.total_items = total_items
+        self.counting = False  # True while the total is still growing
         self.completed_items = 0
         self.cancel_callback = cancel_callback
         self.cancelled = False
+        self.manifest = manifest
+        # Smoothed job rates, sampled from the manifest (see `_sample_rates`)
+        self.byte_rate: Optional[float] = None
+        self.file_rate: Optional[float] = None
+        self._first_sample = None
+        self._last_sample = None
 
     def compose(self) -> ComposeResult:
         """Compose the modal."""
@@ -282,6 +475,9 @@ class ProgressModal(ModalScreen):
                 yield ProgressBar(total=100, show_eta=False, id="progress-bar")
                 yield Static("", id="progress-stats")
             with Horizontal(id="progress-buttons"):
+                if self.manifest:
+                    # Transfers hold at their next chunk, see `ProgressAccumulator.pause`
+                    yield Button("⏸️ Pause", variant="warning", id="pause-copy")
                 yield Button("❌ Cancel", variant="error", id="cancel-copy")
 
     def on_mount(self) -> None:
@@ -305,16 +501,167 @@ class ProgressModal(ModalScreen):
         except Exception as e:
             logging.debug(f"Error logging sizes or setting focus: {e}")
 
-        self.set_interval(0.5, self.update_stats)
-        self.update_stats()
+        self.set_interval(1 / PROGRESS_FRAME_RATE, self.update_frame)
+        self.update_frame()
+
+    def update_frame(self) -> None:
+        """Sample the job's progress and redraw, once per frame."""
+        if self.manifest:
+            self._sample_progress()
+            # The copy's own walk finds the files while they are transferred
+            self.update_total_items(self.manifest.total_files, final=not self.manifest.walking)
+        else:
+            self.update_stats()
+
+    def _sample_progress(self) -> None:
+        """Fold the progress events since the previous frame into the status lines."""
+        active, log = self.manifest.progress.sample()
+        for item in log:
+            if isinstance(item, str):
+                self.status_messages.append(item)
+            elif item.state == DONE:
+                self.status_messages.append(f"✅ {item.name} ({_format_size(item.bytes_total)})")
+            elif item.state == FAILED:
+                self.status_messages.append(f"❌ {item.name}: failed")
+            elif item.state == CANCELLED:
+                self.status_messages.append(f"🛑 {item.name}: cancelled")
+            # Skipped files are summed up by the transfer itself
+        self.active_lines = [self._active_line(event) for event in active]
+        self._render_status()
+
+    @staticmethod
+    def _active_line(event: ProgressEvent) -> str:
+        """Status line of a file in flight."""
+        if not event.bytes_total:
+            return f"📄 {event.name}: starting..."
+        percent = int(event.bytes_done / event.bytes_total * 100) if event.bytes_total else 0
+        elapsed = time.monotonic() - event.started if event.started else 0
+        speed = f"{_format_size(event.bytes_done / elapsed)}/s" if elapsed > 0 else "..."
+        done, total = _format_size(event.bytes_done), _format_size(event.bytes_total)
+        return f"📄 {event.name}: {done} / {total} ({percent}%) - {speed}"
+
+    def _render_status(self) -> None:
+        """Show the latest status messages followed by the files in flight, if anything changed."""
+        del self.status_messages[:-PROGRESS_STATUS_LINES]
+        keep = max(0, PROGRESS_STATUS_LINES - len(self.active_lines))
+        text = "\n".join((self.status_messages[-keep:] if keep else []) + self.active_lines)
+        if text == self._rendered_status:
+            return
+        try:
+            self.query_one("#progress-status", Static).update(text)
+            self._rendered_status = text
+        except Exception:
+            # Widget not mounted yet, will update on next frame
+            pass
+
+    def _sample_rates(self) -> None:
+        """Fold the progress since the last sample into the smoothed byte and file rates.
+
+        Each rate is an exponentially weighted moving average with a time
+        constant of RATE_SMOOTHING seconds, so a single slow or fast file moves
+        the ETA a little instead of resetting it.
+        """
+        if not self.counting and 0 < self.total_items <= self.completed_items:
+            return  # Job finished, keep the rates it ended with
+
+        now = time.monotonic()
+        bytes_done = self.manifest.bytes_done
+        files_done = self.manifest.files_done
+        if not self._first_sample:
+            self._first_sample = self._last_sample = (now, bytes_done, files_done)
+            return
+
+        if self.manifest.progress.paused:
+            # Keep the rates of the running job, the paused time must not count once it goes on
+            first_time, first_bytes, first_files = self._first_sample
+            self._first_sample = (first_time + now - self._last_sample[0], first_bytes, first_files)
+            self._last_sample = (now, bytes_done, files_done)
+            return
+
+        first_time, first_bytes, first_files = self._first_sample
+        if self.byte_rate is None or now - first_time < RATE_SMOOTHING:
+            # Warming up: the plain average, the first samples alone are too noisy
+            elapsed = now - first_time
+            if elapsed <= 0:
+                return
+            self.byte_rate = (bytes_done - first_bytes) / elapsed
+            self.file_rate = (files_done - first_files) / elapsed
+        else:
+            last_time, last_bytes, last_files = self._last_sample
+            elapsed = now - last_time
+            if elapsed <= 0:
+                return
+            weight = 1 - math.exp(-elapsed / RATE_SMOOTHING)
+            self.byte_rate += weight * ((bytes_done - last_bytes) / elapsed - self.byte_rate)
+            self.file_rate += weight * ((files_done - last_files) / elapsed - self.file_rate)
+        self._last_sample = (now, bytes_done, files_done)
+
+    def _job_eta(self) -> Optional[float]:
+        """Seconds left in the job, from the remaining bytes and files at the smoothed rates.
+
+        The byte rate alone underestimates jobs of many small files and the file
+        rate alone jobs of a few large ones, so the larger estimate is used.
+        """
+        manifest = self.manifest
+        estimates = []
+        remaining_bytes = manifest.total_bytes - manifest.bytes_done
+        if self.byte_rate and remaining_bytes > 0:
+            estimates.append(remaining_bytes / self.byte_rate)
+        remaining_files = manifest.total_files - manifest.files_done
+        if self.file_rate and remaining_files > 0:
+            estimates.append(remaining_files / self.file_rate)
+        if estimates:
+            return max(estimates)
+        return 0.0 if manifest.total_files and not remaining_files else None
+
+    def _job_stats(self, time_info: str) -> str:
+        """Stats of a job followed through its manifest: files, bytes, rates and ETA."""
+        from datetime import timedelta
+
+        manifest = self.manifest
+        self._sample_rates()
+        more = "+" if self.counting else ""
+
+        if manifest.progress.paused:
+            lines = [f"{time_info} | ⏸️ paused"]
+        else:
+            eta = self._job_eta()
+            eta_str = str(timedelta(seconds=int(eta))) if eta is not None else "calculating..."
+            lines = [f"{time_info} | ⏳ {eta_str}{more}"]
+
+        if self.total_items > 0:
+            line = (
+                f"📊 {self.completed_items}/{self.total_items}{more} files | "
+                f"💾 {_format_size(manifest.bytes_done)} / "
+                f"{_format_size(manifest.total_bytes)}{more}"
+            )
+            if self.byte_rate is not None:
+                line += f" | ⚡ {_format_size(self.byte_rate)}/s, {self.file_rate:.1f} files/s"
+            lines.append(line)
+        else:
+            lines.append("📊 calculating...")
 
-    def update_total_items(self, total: int) -> None:
+        # The bar follows the whole job, by bytes (by files for a job of empty files)
+        if manifest.total_bytes:
+            progress = manifest.bytes_done / manifest.total_bytes * 100
+        elif self.total_items:
+            progress = self.completed_items / self.total_items * 100
+        else:
+            progress = 0.0
+        self.current_progress = progress
+        self.query_one("#progress-bar", ProgressBar).update(progress=progress)
+
+        return "\n".join(lines)
+
+    def update_total_items(self, total: int, final: bool = True) -> None:
         """Update the total items count.
 
         Args:
             total: New total items count
+            final: False while files are still being counted (shown as "N+")
         """
         self.total_items = total
+        self.counting = not final
         # Force update stats display
         self.update_stats()
 
@@ -325,6 +672,9 @@ class ProgressModal(ModalScreen):
         if not self.start_time:
             return
 
+        if self.manifest:
+            self.completed_items = self.manifest.files_done
+
         try:
             stats_widget = self.query_one("#progress-stats", Static)
 
@@ -332,20 +682,15 @@ class ProgressModal(ModalScreen):
             elapsed = datetime.now() - self.start_time
             elapsed_str = str(timedelta(seconds=int(elapsed.total_seconds())))
 
-            # Calculate ETA
-            if self.current_progress > 0:
-                total_seconds = elapsed.total_seconds() / (self.current_progress / 100)
-                remaining_seconds = total_seconds - elapsed.total_seconds()
-                eta_str = str(timedelta(seconds=int(remaining_seconds)))
-            else:
-                eta_str = "calculating..."
-
-            # Build stats display - show times and file count in one line
-            time_info = f"🕐 {self.start_time.strftime('%H:%M:%S')} | ⏱️ {elapsed_str} | ⏳ {eta_str}"
+            time_info = f"🕐 {self.start_time.strftime('%H:%M:%S')} | ⏱️ {elapsed_str}"
+            if self.manifest:
+                stats_widget.update(self._job_stats(time_info))
+                return
 
-            # Add file count to the same line if available
+            # Without a manifest there is nothing to derive an ETA from, show the file count
             if self.total_items > 0:
-                time_info += f" | 📊 {self.completed_items}/{self.total_items} files"
+                more = "+" if self.counting else ""
+                time_info += f" | 📊 {self.completed_items}/{self.total_items}{more} files"
             else:
                 time_info += f" | 📊 calculating..."
 
@@ -361,64 +706,44 @@ class ProgressModal(ModalScreen):
             message: Message to display
             replace_last: If True, replace the last message instead of appending
         """
-        import re
+        if self.manifest:
+            # Messages queued by the transfer come first
+            self._sample_progress()
 
-        # Check if this is a progress update (contains percentage)
-        percentage_match = re.search(r'\((\d+)%\)', message)
-        
         if replace_last and self.status_messages:
             self.status_messages[-1] = message
-        elif percentage_match:
-            percentage = int(percentage_match.group(1))
-            
-            # Extract filename from message
-            # Assuming format: "📄 filename: size / total (50%)"
-            filename_match = re.search(r'📄 (.+?):', message)
-            
-            if filename_match and self.status_messages:
-                current_filename = filename_match.group(1)
-                last_msg = self.status_messages[-1]
-                last_filename_match = re.search(r'📄 (.+?):', last_msg)
-                
-                if last_filename_match and last_filename_match.group(1) == current_filename:
-                    # Replace last message for same file
-                    self.status_messages[-1] = message
-                else:
-                    # New file - append
-                    self.status_messages.append(message)
-            else:
-                # First message - append
-                self.status_messages.append(message)
-
-            # Increment counter whenever any file reaches 100%
-            if percentage == 100:
-                self.completed_items += 1
         else:
-            # Not a progress update - append normally
             self.status_messages.append(message)
+        self._render_status()
+
+    def toggle_pause(self) -> None:
+        """Pause the job's transfers, or let them go on."""
+        progress = self.manifest.progress
+        button = self.query_one("#pause-copy", Button)
+        if progress.paused:
+            progress.resume()
+            button.label = "⏸️ Pause"
+            self.update_status("▶️ Resumed")
+        else:
+            progress.pause()
+            button.label = "▶️ Resume"
+            self.update_status("⏸️ Paused, open files are kept until the job goes on")
+        self.update_stats()
 
-        # Keep last 50 messages
-        if len(self.status_messages) > 50:
-            self.status_messages = self.status_messages[-50:]
-
-        try:
-            status_widget = self.query_one("#progress-status", Static)
-            status_widget.update("\n".join(self.status_messages))
-
-            # Extract percentage from message if present (e.g., "50%")
-            if percentage_match:
-                percentage = float(percentage_match.group(1))
-                self.current_progress = percentage
-                progress_bar = self.query_one("#progress-bar", ProgressBar)
-                progress_bar.update(progress=percentage)
-        except:
-            # Widget not mounted yet, will update on next call
-            pass
+    def on_unmount(self) -> None:
+        """Never leave transfers paused without a way to resume them."""
+        if self.manifest and self.manifest.progress.paused:
+            self.manifest.progress.resume()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle cancel button press."""
-        if event.button.id == "cancel-copy":
+        """Handle pause and cancel button presses."""
+        if event.button.id == "pause-copy":
+            self.toggle_pause()
+        elif event.button.id == "cancel-copy":
             self.cancelled = True
+            if self.manifest:
+                # Read by the per-chunk transfer callbacks
+                self.manifest.progress.cancel()
             # Call cancel callback if provided
             if self.cancel_callback:
                 self.cancel_callback()
@@ -460,7 +785,7 @@ class FileBrowser(App):
         margin: 0 1;
     }
 
-    ListView {
+    FileList {
         height: 100%;
     }
 
@@ -479,18 +804,6 @@ class FileBrowser(App):
         border: solid $accent;
     }
 
-    ListItem {
-        padding: 0 1;
-    }
-
-    ListItem.selected {
-        background: $accent 30%;
-    }
-
-    ListItem > Label {
-        width: 100%;
-    }
-
     #buttons {
         height: auto;
         layout: horizontal;
@@ -535,6 +848,7 @@ class FileBrowser(App):
         Binding("escape", "cancel", "Cancel"),
         Binding("ctrl+c", "confirm_copy", "Copy Selected"),
         Binding("left", "navigate_parent", "Parent Directory"),
+        Binding("r", "reload", "Refresh"),
         Binding("/", "start_search", "Search"),
         Binding("n", "next_match", "Next Match"),
         Binding("p", "prev_match", "Previous Match"),
@@ -549,7 +863,9 @@ class FileBrowser(App):
         copy_callback: Optional[Callable[[List[tuple]], bool]] = None,
         target_path: str = "",
         select_destination_mode: bool = False,
-        get_dir_size_func: Optional[Callable[[str], int]] = None
+        prefetch_func: Optional[Callable[[str, Callable[[], bool]], None]] = None,
+        stream_files_func: Optional[Callable[[str], Iterable[List[tuple]]]] = None,
+        invalidate_func: Optional[Callable[[str], None]] = None,
     ):
         """Initialize file browser.
 
@@ -558,10 +874,18 @@ class FileBrowser(App):
             current_path: Starting directory path
             list_files_func: Function to list files, returns [(name, is_dir, size), ...]
             is_remote: Whether browsing remote filesystem
-            copy_callback: Optional callback to copy files, receives [(path, is_dir), ...]
+            copy_callback: Optional callback to copy files, receives [(path, is_dir), ...],
+                a progress callback, `cancel_check` and a `manifest` (TransferManifest) to
+                account the job in
             target_path: Target destination path to display
             select_destination_mode: If True, button says "Copy Here" and callback receives current dir
-            get_dir_size_func: Optional function to calculate directory size (remote or local)
+            prefetch_func: Optional function warming the listing cache of a directory in the
+                background, receives the path and a function returning True once the
+                prefetch is stale
+            stream_files_func: Optional function listing a directory incrementally, yields sorted
+                batches of the tuples returned by `list_files_func`; used instead of it when set
+            invalidate_func: Optional function dropping the cached listing of a directory,
+                called before the current directory is listed again on refresh
         """
         super().__init__()
         self.browser_title = title
@@ -571,9 +895,14 @@ class FileBrowser(App):
         self.copy_callback = copy_callback
         self.target_path = target_path
         self.select_destination_mode = select_destination_mode
-        self.get_dir_size_func = get_dir_size_func
+        self.prefetch_func = prefetch_func
+        self.stream_files_func = stream_files_func
+        self.invalidate_func = invalidate_func
+        self._prefetch_timer = None
+        self._listing_generation = 0  # Bumped by every refresh, older listings are discarded
+        self._prefetch_slots = threading.BoundedSemaphore(PREFETCH_CONCURRENCY)
         self.selected_files: List[str] = []
-        self.all_items: List[FileListItem] = []
+        self.entries = EntryStore()
         self._last_click_time = 0
         self._last_click_index = None
         self.transfer_records = []  # Track all transfers: [(filename, size, duration), ...]
@@ -595,7 +924,7 @@ class FileBrowser(App):
         yield Static("", id="status-bar")
 
         with Container(id="file-list-container"):
-            yield ListView(id="file-list")
+            yield FileList(self.entries, id="file-list")
 
         # Search bar (hidden by default)
         with Container(id="search-container"):
@@ -710,47 +1039,6 @@ class FileBrowser(App):
         console.print(f"⏱️  Total time: {total_time_str}", style="bold cyan")
         console.print()
 
-    def count_files_recursive(self, path: str, is_dir: bool) -> int:
-        """Count total number of files recursively.
-
-        Args:
-            path: File or directory path
-            is_dir: Whether the path is a directory
-
-        Returns:
-            Total number of files (not directories)
-        """
-        if not is_dir:
-            return 1
-
-        total = 0
-        try:
-            items = self.list_files_func(path)
-            for item in items:
-                name = item[0]
-                item_is_dir = item[1]
-                
-                # Skip parent directory entry if present
-                if name == "..":
-                    continue
-
-                if item_is_dir:
-                    # Recursively count files in subdirectory
-                    if self.is_remote:
-                        subdir_path = f"{path.rstrip('/')}/{name}"
-                    else:
-                        subdir_path = str(Path(path) / name)
-                    total += self.count_files_recursive(subdir_path, True)
-                else:
-                    # It's a file
-                    total += 1
-        except Exception as e:
-            logging.debug(f"Error counting files in {path}: {e}")
-            # Return 1 as fallback if we can't count
-            return 1
-
-        return total if total > 0 else 1
-
     def update_status(self, message: str, status: str = "success", auto_clear: bool = True):
         """Update status bar.
 
@@ -778,8 +1066,8 @@ class FileBrowser(App):
     def update_selection_status(self):
         """Update status bar with selection count."""
         # Count selected files and folders separately
-        selected_files = sum(1 for item in self.all_items if item.is_selected and not item.is_directory)
-        selected_folders = sum(1 for item in self.all_items if item.is_selected and item.is_directory)
+        selected_files = self.entries.selected_files
+        selected_folders = self.entries.selected_folders
 
         if selected_files > 0 or selected_folders > 0:
             parts = []
@@ -792,27 +1080,19 @@ class FileBrowser(App):
         else:
             self.update_status("💡 Select file(s) or folder(s) to copy.", "info", auto_clear=False)
 
-    def record_transfers(self, items: List[tuple], duration: float):
+    def record_transfers(self, items: List[tuple], duration: float, manifest: TransferManifest):
         """Record transferred files for summary display.
 
         Args:
             items: List of (path, is_dir) tuples that were transferred
             duration: Total transfer duration in seconds
+            manifest: Manifest of the copy job, giving the bytes actually moved
         """
         for path, is_dir in items:
             from pathlib import Path
             filename = Path(path).name
-            # Get size - for directories, calculate total size of all files
-            size = 0
-            if is_dir:
-                # Calculate actual size by recursively summing all files
-                size = self._calculate_directory_size(path)
-            else:
-                # Get size from items list for files
-                for item in self.all_items:
-                    if item.file_name == filename:
-                        size = item.file_size
-                        break
+            # Bytes actually moved, as accounted by the transfer in the job manifest
+            size = manifest.moved_bytes(path) or 0
 
             # Determine source and target based on interactive side
             source_path = path
@@ -827,72 +1107,18 @@ class FileBrowser(App):
                 'is_dir': is_dir
             })
 
-    def _calculate_directory_size(self, dir_path: str) -> int:
-        """Calculate total size of all files in a directory recursively.
-
-        Args:
-            dir_path: Path to the directory
+    def refresh_file_list(self):
+        """Refresh the file list.
 
-        Returns:
-            Total size in bytes
+        The directory is listed in a worker thread so a slow remote or mounted
+        directory does not freeze the UI. A newer refresh cancels the one in
+        flight, and a listing is only applied if it is still the latest one
+        for the current path.
         """
-        total_size = 0
-        try:
-            if self.is_remote:
-                # For remote directories, use SFTP to calculate size
-                if self.get_dir_size_func:
-                    return self.get_dir_size_func(dir_path)
-                return 0
-            else:
-                # For local directories, walk through all files
-                from pathlib import Path
-                path_obj = Path(dir_path)
-                if path_obj.exists() and path_obj.is_dir():
-                    for item in path_obj.rglob('*'):
-                        if item.is_file():
-                            try:
-                                total_size += item.stat().st_size
-                            except (OSError, PermissionError):
-                                # Skip files we can't access
-                                pass
-        except Exception:
-            # If we can't calculate, return 0
-            pass
-
-        return total_size
-
-    def refresh_file_list(self):
-        """Refresh the file list."""
         logging.debug(f"refresh_file_list called for path: {self.current_path}")
-        list_view = self.query_one("#file-list", ListView)
+        list_view = self.query_one("#file-list", FileList)
+        # Keeps the parent directory entry
         list_view.clear()
-        self.all_items.clear()
-
-        # Add parent directory
-        parent_item = FileListItem("..", True, 0)
-        self.all_items.append(parent_item)
-        list_view.append(parent_item)
-
-        try:
-            # Add files and directories
-            logging.debug("Calling list_files_func...")
-            files = self.list_files_func(self.current_path)
-            logging.debug(f"list_files_func returned {len(files)} items")
-            
-            for file_info in files:
-                # Handle both old format (6 elements) and new format (8 elements)
-                if len(file_info) >= 8:
-                    name, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime = file_info[:8]
-                else:
-                    name, is_dir, size, is_symlink, symlink_target, target_is_dir = file_info[:6]
-                    ctime, mtime = 0, 0
-
-                item = FileListItem(name, is_dir, size, is_symlink, symlink_target, target_is_dir, ctime, mtime)
-                self.all_items.append(item)
-                list_view.append(item)
-        except Exception as e:
-            logging.error(f"Error in refresh_file_list: {e}", exc_info=True)
-            self.update_status(f"Error listing files: {e}", "error")
 
         # Update path label
         path_label = self.query_one("#current-path", Static)
@@ -901,6 +1127,78 @@ class FileBrowser(App):
             path_display += f" → {self.target_path}"
         path_label.update(path_display)
 
+        self._listing_generation += 1
+        generation, path = self._listing_generation, self.current_path
+        list_view.loading = True
+        self.run_worker(
+            lambda: self._load_file_list(generation, path),
+            thread=True, exclusive=True, group="listing",
+        )
+
+    def _load_file_list(self, generation: int, path: str) -> None:
+        """List a directory and hand the result to the UI (runs in a worker thread).
+
+        With `stream_files_func`, each batch is handed over as soon as it is
+        listed, so the first entries show up before a huge directory is done.
+        """
+        worker = get_current_worker()
+        try:
+            if self.stream_files_func:
+                logging.debug("Calling stream_files_func...")
+                batches = self.stream_files_func(path)
+                try:
+                    for batch in batches:
+                        if worker.is_cancelled:
+                            return
+                        self.call_from_thread(self._apply_file_list, generation, path, batch, None)
+                finally:
+                    batches.close()
+                files = []
+            else:
+                logging.debug("Calling list_files_func...")
+                files = self.list_files_func(path)
+                logging.debug(f"list_files_func returned {len(files)} items")
+            error = None
+        except Exception as e:
+            logging.error(f"Error in refresh_file_list: {e}", exc_info=True)
+            files, error = [], e
+
+        if not worker.is_cancelled:
+            self.call_from_thread(self._apply_file_list, generation, path, files, error)
+
+    def _apply_file_list(
+        self, generation: int, path: str, files: List[tuple], error: Optional[Exception],
+    ) -> None:
+        """Merge a listed batch into the list, unless the user navigated away meanwhile.
+
+        Batches are merged in sorted order (directories first, then by name),
+        and the cursor stays on the entry it was on.
+        """
+        if generation != self._listing_generation or path != self.current_path:
+            logging.debug(f"Discarding stale listing of {path}")
+            return
+
+        list_view = self.query_one("#file-list", FileList)
+        if list_view.loading:
+            list_view.loading = False
+            # The list cannot take focus while it is loading,
+            # give it back unless the user is searching
+            if self.focused is None or (self.focused.id == "search-input" and not self.search_mode):
+                list_view.focus()
+        if error:
+            self.update_status(f"Error listing files: {error}", "error")
+            return
+        if not files:
+            return
+
+        cursor = list_view.index
+        positions = self.entries.merge(files)
+        list_view.entries_changed()
+
+        # Keep the cursor on the entry it was on
+        if cursor is not None and cursor > 0:
+            list_view.index = cursor + bisect.bisect_right(positions, cursor)
+
     def action_toggle_select(self):
         """Toggle selection of current item."""
         logging.debug("=== action_toggle_select() called (Space key) ===")
@@ -909,20 +1207,18 @@ class FileBrowser(App):
         if self.select_destination_mode:
             return
 
-        list_view = self.query_one("#file-list", ListView)
+        list_view = self.query_one("#file-list", FileList)
         if list_view.index is not None:
-            item = self.all_items[list_view.index]
+            item = self.entries[list_view.index]
             logging.debug(f"Toggling selection for: {item.file_name}")
-            item.toggle_selection()
-            self.refresh()
+            self.entries.toggle_selected(list_view.index)
+            list_view.refresh()
             self.update_selection_status()
 
     def action_select_all(self):
         """Select all files (except parent dir)."""
-        for item in self.all_items:
-            if item.file_name != ".." and not item.is_selected:
-                item.toggle_selection()
-        self.refresh()
+        self.entries.select_all()
+        self.query_one("#file-list", FileList).refresh()
         self.update_selection_status()
 
     def action_navigate_parent(self):
@@ -946,6 +1242,18 @@ class FileBrowser(App):
         logging.debug(f"⬅️  Navigated to parent: {old_path} -> {self.current_path}")
         self.refresh_file_list()
 
+    def action_reload(self):
+        """List the current directory again, bypassing the listing cache (r key).
+
+        A cached listing is revalidated by the directory mtime, which changes
+        when entries are added, removed or renamed but not when a file inside
+        is modified.
+        """
+        logging.debug(f"=== action_reload() called for {self.current_path} ===")
+        if self.invalidate_func:
+            self.invalidate_func(self.current_path)
+        self.refresh_file_list()
+
     def action_start_search(self):
         """Start search mode - show search input."""
         logging.debug("=== action_start_search() called (/ key) ===")
@@ -992,11 +1300,11 @@ class FileBrowser(App):
             return
 
         match_index = self.search_matches[self.current_match_index]
-        list_view = self.query_one("#file-list", ListView)
+        list_view = self.query_one("#file-list", FileList)
         list_view.index = match_index
 
         # Update status to show current position
-        match_item = self.all_items[match_index]
+        match_item = self.entries[match_index]
         self.update_status(
             f"Match {self.current_match_index + 1}/{len(self.search_matches)}: {match_item.file_name}",
             "info",
@@ -1018,12 +1326,8 @@ class FileBrowser(App):
             self.update_status("💡 Select file(s) to copy.", "info", auto_clear=False)
             return
 
-        # Find all matching items (case-insensitive)
-        for i, item in enumerate(self.all_items):
-            if item.file_name == "..":
-                continue  # Skip parent directory
-            if self.search_term in item.file_name.lower():
-                self.search_matches.append(i)
+        # Find all matching items (case-insensitive, skips the parent directory)
+        self.search_matches = self.entries.search(self.search_term)
 
         # Update status
         if self.search_matches:
@@ -1038,14 +1342,15 @@ class FileBrowser(App):
         # Clean up finished workers
         self._cleanup_finished_workers()
 
-        list_view = self.query_one("#file-list", ListView)
-        logging.debug(f"ListView index: {list_view.index}")
+        list_view = self.query_one("#file-list", FileList)
+        logging.debug(f"FileList index: {list_view.index}")
 
         if list_view.index is None:
             logging.debug("No item selected, returning")
             return
 
-        item = self.all_items[list_view.index]
+        index = list_view.index
+        item = self.entries[index]
         logging.debug(f"Selected item: name='{item.file_name}', is_directory={item.is_directory}")
 
         # Construct full path
@@ -1069,9 +1374,6 @@ class FileBrowser(App):
                     # User confirmed - copy immediately
                     # Call copy callback if available
                     if self.copy_callback:
-                        # 📊 Calculate file count before starting worker (to avoid thread issues)
-                        file_count = self.count_files_recursive(full_path, item.is_directory)
-
                         # Worker reference for cancellation
                         worker = None
 
@@ -1082,18 +1384,20 @@ class FileBrowser(App):
                                 worker.cancel()
 
                         # Show progress modal with cancel callback
-                        progress_modal = ProgressModal(title="📦 Copying File", total_items=file_count, cancel_callback=cancel_copy)
+                        manifest = TransferManifest()
+                        progress_modal = ProgressModal(
+                            title="📦 Copying File", cancel_callback=cancel_copy, manifest=manifest
+                        )
                         
                         def on_modal_close(result=None):
                             self.query_one("#file-list").focus()
 
                         self.push_screen(progress_modal, on_modal_close)
 
-                        # Create progress callback that updates on main thread
+                        # Progress callback, the modal samples the queued messages once per frame
                         def update_progress(message: str):
-                            """Update progress modal."""
-                            if not progress_modal.cancelled:
-                                self.call_from_thread(progress_modal.update_status, message)
+                            """Queue a message for the next frame of the progress modal."""
+                            manifest.progress.note(message)
 
                         # Run copy in worker thread
                         def do_copy():
@@ -1105,7 +1409,10 @@ class FileBrowser(App):
                                 # 🛑 Create cancel check function
                                 def is_cancelled():
                                     return progress_modal.cancelled
-                                success = self.copy_callback([(full_path, False)], update_progress, cancel_check=is_cancelled)
+                                success = self.copy_callback(
+                                    [(full_path, False)], update_progress,
+                                    cancel_check=is_cancelled, manifest=manifest,
+                                )
                                 duration = time.time() - start_time
                                 logging.debug(f"do_copy: copy_callback returned success={success}")
                                 # Dismiss modal and show result on main thread
@@ -1114,7 +1421,9 @@ class FileBrowser(App):
                                     if success:
                                         logging.debug(f"do_copy: Copy reported as successful")
                                         # Record transfer
-                                        self.record_transfers([(full_path, False)], duration)
+                                        self.record_transfers(
+                                            [(full_path, False)], duration, manifest
+                                        )
                                         self.call_from_thread(self.update_status, f"Copied '{item.file_name}' successfully!", "success")
                                         
                                         # Wait 5s with countdown
@@ -1143,12 +1452,12 @@ class FileBrowser(App):
                         self.exit([(full_path, False)])
                 else:
                     # User declined - just toggle selection
-                    item.toggle_selection()
-                    self.refresh()
+                    self.entries.toggle_selected(index)
+                    self.query_one("#file-list", FileList).refresh()
                     self.query_one("#file-list").focus()
 
             # Build confirmation message
-            size_str = item._format_size(item.file_size)
+            size_str = _format_size(item.file_size)
             message = f"Copy '{item.file_name}' ({size_str}) now?\n"
             if item.is_symlink:
                 message += f"\n🔗 This is a symbolic link to:\n   {item.symlink_target}\n"
@@ -1216,11 +1525,11 @@ class FileBrowser(App):
         # Clean up finished workers
         self._cleanup_finished_workers()
 
-        list_view = self.query_one("#file-list", ListView)
+        list_view = self.query_one("#file-list", FileList)
         if list_view.index is None:
             return
 
-        item = self.all_items[list_view.index]
+        item = self.entries[list_view.index]
 
         # Skip parent directory
         if item.file_name == "..":
@@ -1234,9 +1543,6 @@ class FileBrowser(App):
 
         # Call copy callback if available
         if self.copy_callback:
-            # 📊 Calculate file count before starting worker (to avoid thread issues)
-            file_count = self.count_files_recursive(full_path, item.is_directory)
-
             # Worker reference for cancellation
             worker = None
 
@@ -1247,19 +1553,22 @@ class FileBrowser(App):
                     worker.cancel()
 
             # Show progress modal with cancel callback
+            # 📊 Files are counted by the walk of the copy itself, which starts right away
             item_type = "Directory" if item.is_directory else "File"
-            progress_modal = ProgressModal(title=f"📦 Copying {item_type}", total_items=file_count, cancel_callback=cancel_copy)
+            manifest = TransferManifest()
+            progress_modal = ProgressModal(
+                title=f"📦 Copying {item_type}", cancel_callback=cancel_copy, manifest=manifest
+            )
             
             def on_modal_close(result=None):
                 self.query_one("#file-list").focus()
 
             self.push_screen(progress_modal, on_modal_close)
 
-            # Create progress callback that updates on main thread
+            # Progress callback, the modal samples the queued messages once per frame
             def update_progress(message: str):
-                """Update progress modal."""
-                if not progress_modal.cancelled:
-                    self.call_from_thread(progress_modal.update_status, message)
+                """Queue a message for the next frame of the progress modal."""
+                manifest.progress.note(message)
 
             # Run copy in worker thread
             def do_copy():
@@ -1271,13 +1580,18 @@ class FileBrowser(App):
                     def is_cancelled():
                         return progress_modal.cancelled
                     # Perform the copy
-                    success = self.copy_callback([(full_path, item.is_directory)], update_progress, cancel_check=is_cancelled)
+                    success = self.copy_callback(
+                        [(full_path, item.is_directory)], update_progress,
+                        cancel_check=is_cancelled, manifest=manifest,
+                    )
                     duration = time.time() - start_time
                     # Dismiss modal and show result on main thread
                     if not progress_modal.cancelled:
                         if success:
                             # Record transfer
-                            self.record_transfers([(full_path, item.is_directory)], duration)
+                            self.record_transfers(
+                                [(full_path, item.is_directory)], duration, manifest
+                            )
                             self.call_from_thread(self.update_status, f"Copied '{item.file_name}' successfully!", "success")
                             
                             # Wait 5s with countdown
@@ -1325,19 +1639,19 @@ class FileBrowser(App):
             selected.append((self.current_path, True))
         else:
             # Normal mode: gather selected items
-            for item in self.all_items:
-                if item.is_selected:
-                    if self.is_remote:
-                        full_path = f"{self.current_path.rstrip('/')}/{item.file_name}"
-                    else:
-                        full_path = str(Path(self.current_path) / item.file_name)
-                    selected.append((full_path, item.is_directory))
+            for index in self.entries.selected_indices():
+                item = self.entries[index]
+                if self.is_remote:
+                    full_path = f"{self.current_path.rstrip('/')}/{item.file_name}"
+                else:
+                    full_path = str(Path(self.current_path) / item.file_name)
+                selected.append((full_path, item.is_directory))
 
             # If no files selected, use current highlighted item
             if not selected:
-                list_view = self.query_one("#file-list", ListView)
-                if list_view.index is not None and list_view.index < len(self.all_items):
-                    item = self.all_items[list_view.index]
+                list_view = self.query_one("#file-list", FileList)
+                if list_view.index is not None and list_view.index < len(self.entries):
+                    item = self.entries[list_view.index]
                     # Skip parent directory
                     if item.file_name == "..":
                         self.update_status("Cannot copy parent directory", "info")
@@ -1355,16 +1669,6 @@ class FileBrowser(App):
 
         # Call copy callback if available
         if self.copy_callback:
-            # 📊 Calculate total files before starting worker (to avoid thread issues)
-            total_files = 0
-            
-            if self.select_destination_mode:
-                # In destination mode, we don't count files here (callback handles source items)
-                total_files = 1 # Dummy count
-            else:
-                for path, is_dir in selected:
-                    total_files += self.count_files_recursive(path, is_dir)
-
             # Worker reference for cancellation
             worker = None
 
@@ -1381,18 +1685,22 @@ class FileBrowser(App):
             else:
                 title_str = f"📦 Copying {count} Item(s)"
             
-            progress_modal = ProgressModal(title=title_str, total_items=total_files, cancel_callback=cancel_copy)
+            # 📊 Files are counted by the walk of the copy itself, which starts right away
+            # (in destination mode, the callback walks the source items)
+            manifest = TransferManifest()
+            progress_modal = ProgressModal(
+                title=title_str, cancel_callback=cancel_copy, manifest=manifest
+            )
             
             def on_modal_close(result=None):
                 self.query_one("#file-list").focus()
 
             self.push_screen(progress_modal, on_modal_close)
 
-            # Create progress callback that updates on main thread
+            # Progress callback, the modal samples the queued messages once per frame
             def update_progress(message: str):
-                """Update progress modal."""
-                if not progress_modal.cancelled:
-                    self.call_from_thread(progress_modal.update_status, message)
+                """Queue a message for the next frame of the progress modal."""
+                manifest.progress.note(message)
 
             # Run copy in worker thread
             def do_copy():
@@ -1404,14 +1712,16 @@ class FileBrowser(App):
                     def is_cancelled():
                         return progress_modal.cancelled
                     
-                    success = self.copy_callback(selected, update_progress, cancel_check=is_cancelled)
+                    success = self.copy_callback(
+                        selected, update_progress, cancel_check=is_cancelled, manifest=manifest
+                    )
                     
                     duration = time.time() - start_time
                     # Dismiss modal and show result on main thread
                     if not progress_modal.cancelled:
                         if success:
                             if not self.select_destination_mode:
-                                self.record_transfers(selected, duration)
+                                self.record_transfers(selected, duration, manifest)
                             self.call_from_thread(self.update_status, "Copy completed successfully!", "success")
                             # Refresh list to show new files if we are in the target
                             self.call_from_thread(self.refresh_file_list)
@@ -1462,7 +1772,7 @@ class FileBrowser(App):
             self.search_mode = False
 
             # Refocus on file list
-            list_view = self.query_one("#file-list", ListView)
+            list_view = self.query_one("#file-list", FileList)
             list_view.focus()
 
             # Clear search results
@@ -1490,7 +1800,7 @@ class FileBrowser(App):
             # Enter key pressed - navigate directly
             logging.debug("Enter key pressed! Calling action_navigate()")
             self.action_navigate()
-            event.prevent_default()  # Prevent ListView from handling it
+            event.prevent_default()  # Prevent FileList from handling it
             event.stop()
 
     def on_input_changed(self, event: Input.Changed) -> None:
@@ -1510,7 +1820,7 @@ class FileBrowser(App):
             self.search_mode = False
 
             # Refocus on file list
-            list_view = self.query_one("#file-list", ListView)
+            list_view = self.query_one("#file-list", FileList)
             list_view.focus()
 
             # Keep the current match highlighted
@@ -1525,14 +1835,68 @@ class FileBrowser(App):
             event.prevent_default()
             event.stop()
 
-    def on_list_view_selected(self, event: ListView.Selected) -> None:
+    def on_file_list_highlighted(self, event: FileList.Highlighted) -> None:
+        """Prefetch the listing of a directory once the cursor rests on it."""
+        if not self.prefetch_func:
+            return
+
+        # The cursor moved: drop the pending and running prefetch
+        if self._prefetch_timer:
+            self._prefetch_timer.stop()
+        self.workers.cancel_group(self, "prefetch")
+        self._prefetch_timer = self.set_timer(PREFETCH_DELAY, self._start_prefetch)
+
+    def _start_prefetch(self) -> None:
+        """List the highlighted directory, then its directory neighbours, in the background."""
+        list_view = self.query_one("#file-list", FileList)
+        index = list_view.index
+        if index is None or index >= len(self.entries):
+            return
+
+        # Highlighted entry first, then neighbours by distance
+        order = [index]
+        for offset in range(1, PREFETCH_SIBLINGS + 1):
+            order += [index - offset, index + offset]
+
+        paths = []
+        for i in order:
+            if 0 <= i < len(self.entries):
+                item = self.entries[i]
+                if item.is_directory and item.file_name != "..":
+                    paths.append(f"{self.current_path.rstrip('/')}/{item.file_name}")
+
+        if paths:
+            self.run_worker(
+                lambda: self._prefetch_listings(paths),
+                thread=True, exclusive=True, group="prefetch",
+            )
+
+    def _prefetch_listings(self, paths: List[str]) -> None:
+        """Warm the listing cache for each path until cancelled (runs in a worker thread)."""
+        worker = get_current_worker()
+        for path in paths:
+            # Wait for a free slot, a stale prefetch may still be finishing its request
+            while not self._prefetch_slots.acquire(timeout=0.1):
+                if worker.is_cancelled:
+                    return
+            try:
+                if worker.is_cancelled:
+                    return
+                logging.debug(f"Prefetching listing: {path}")
+                self.prefetch_func(path, lambda: worker.is_cancelled)
+            except Exception as e:
+                logging.debug(f"Prefetch of {path} failed: {e}")
+            finally:
+                self._prefetch_slots.release()
+
+    def on_file_list_selected(self, event: FileList.Selected) -> None:
         """Handle list item selection event (fires on mouse click only)."""
         import time
 
-        logging.debug(f"on_list_view_selected: index={event.list_view.index}")
+        logging.debug(f"on_file_list_selected: index={event.index}")
 
         current_time = time.time()
-        current_index = event.list_view.index
+        current_index = event.index
 
         # Detect double-click: same item selected within 0.5 seconds
         if (current_index == self._last_click_index and
@@ -0,0 +1,248 @@
+"""Fixtures: an in-process SSH/SFTP server on the local filesystem, and clients of it.
+
+Remote paths are plain local paths (usually under `tmp_path`). Exec requests
+run in bash unless a test replaces `ssh_server.exec_handler` with a fake.
+"""
+
+import os
+import socket
+import subprocess
+import threading
+
+import paramiko
+import pytest
+from paramiko import (
+    AUTH_SUCCESSFUL,
+    OPEN_SUCCEEDED,
+    SFTP_OK,
+    SFTPAttributes,
+    SFTPHandle,
+    SFTPServer,
+    SFTPServerInterface,
+)
+
+from scptui.ssh_client import SCPClient
+
+
+def run_in_bash(channel, command):
+    """Exec handler running the command like sshd would, streaming stdin/stdout/stderr."""
+    process = subprocess.Popen(
+        command, shell=True, executable="/bin/bash",
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+
+    def feed():
+        try:
+            for data in iter(lambda: channel.recv(65536), b""):
+                process.stdin.write(data)
+            process.stdin.close()
+        except Exception:
+            pass
+
+    def copy_stderr():
+        for data in iter(lambda: process.stderr.read1(65536), b""):
+            channel.sendall_stderr(data)
+
+    threading.Thread(target=feed, daemon=True).start()
+    stderr = threading.Thread(target=copy_stderr, daemon=True)
+    stderr.start()
+    for data in iter(lambda: process.stdout.read1(65536), b""):
+        channel.sendall(data)
+    status = process.wait()
+    stderr.join()
+    channel.send_exit_status(status)
+    channel.close()
+
+
+class FakeExec:
+    """Exec handler answering every command with canned output, recording the commands."""
+
+    def __init__(self, stdout=b"", stderr=b"", status=0):
+        self.stdout = stdout
+        self.stderr = stderr
+        self.status = status
+        self.commands = []
+        self.stdin = b""
+
+    def __call__(self, channel, command):
+        self.commands.append(command)
+        if self.stderr:
+            channel.sendall_stderr(self.stderr)
+        channel.sendall(self.stdout)
+        channel.shutdown_write()
+        channel.send_exit_status(self.status)
+        # Keep what the client streamed in (e.g. a tar archive)
+        for data in iter(lambda: channel.recv(65536), b""):
+            self.stdin += data
+        channel.close()
+
+
+class _Interface(paramiko.ServerInterface):
+    def __init__(self, server):
+        self.server = server
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        return AUTH_SUCCESSFUL
+
+    def check_channel_request(self, kind, chanid):
+        return OPEN_SUCCEEDED
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(
+            target=self.server.exec_handler, args=(channel, command.decode()), daemon=True
+        ).start()
+        return True
+
+
+class _Handle(SFTPHandle):
+    def stat(self):
+        return SFTPAttributes.from_stat(os.fstat(self.readfile.fileno()))
+
+
+def _errors(method):
+    def call(*args):
+        try:
+            result = method(*args)
+        except OSError as e:
+            return SFTPServer.convert_errno(e.errno)
+        return SFTP_OK if result is None else result
+    return call
+
+
+class _SFTPInterface(SFTPServerInterface):
+    @_errors
+    def list_folder(self, path):
+        entries = []
+        for name in os.listdir(path):
+            attr = SFTPAttributes.from_stat(os.lstat(os.path.join(path, name)))
+            attr.filename = name
+            entries.append(attr)
+        return entries
+
+    @_errors
+    def stat(self, path):
+        return SFTPAttributes.from_stat(os.stat(path))
+
+    @_errors
+    def lstat(self, path):
+        return SFTPAttributes.from_stat(os.lstat(path))
+
+    @_errors
+    def open(self, path, flags, attr):
+        fd = os.open(path, flags, 0o644)
+        if flags & os.O_WRONLY:
+            mode = "ab" if flags & os.O_APPEND else "wb"
+        elif flags & os.O_RDWR:
+            mode = "a+b" if flags & os.O_APPEND else "r+b"
+        else:
+            mode = "rb"
+        handle = _Handle(flags)
+        handle.filename = path
+        handle.readfile = handle.writefile = os.fdopen(fd, mode)
+        return handle
+
+    @_errors
+    def remove(self, path):
+        os.remove(path)
+
+    @_errors
+    def rename(self, old, new):
+        os.rename(old, new)
+
+    @_errors
+    def posix_rename(self, old, new):
+        os.replace(old, new)
+
+    @_errors
+    def mkdir(self, path, attr):
+        os.mkdir(path)
+
+    @_errors
+    def rmdir(self, path):
+        os.rmdir(path)
+
+    @_errors
+    def chattr(self, path, attr):
+        if attr._flags & attr.FLAG_SIZE:
+            os.truncate(path, attr.st_size)
+        if attr._flags & attr.FLAG_AMTIME:
+            os.utime(path, (attr.st_atime, attr.st_mtime))
+        if attr._flags & attr.FLAG_PERMISSIONS:
+            os.chmod(path, attr.st_mode & 0o7777)
+
+    @_errors
+    def readlink(self, path):
+        return os.readlink(path)
+
+    def canonicalize(self, path):
+        return os.path.realpath(path if os.path.isabs(path) else os.path.join("/", path))
+
+
+class SSHServer:
+    """SSH server accepting any password, serving SFTP and exec requests in threads."""
+
+    def __init__(self):
+        self.host_key = paramiko.RSAKey.generate(1024)
+        self.exec_handler = run_in_bash
+        self.transports = []
+        self._socket = socket.socket()
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.listen(16)
+        self.port = self._socket.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                connection, _ = self._socket.accept()
+            except OSError:
+                return
+            transport = paramiko.Transport(connection)
+            transport.add_server_key(self.host_key)
+            transport.set_subsystem_handler("sftp", SFTPServer, _SFTPInterface)
+            transport.start_server(server=_Interface(self))
+            self.transports.append(transport)
+
+    def close(self):
+        self._socket.close()
+        for transport in self.transports:
+            transport.close()
+
+
+@pytest.fixture(scope="session")
+def _session_server():
+    server = SSHServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def ssh_server(_session_server):
+    _session_server.exec_handler = run_in_bash
+    return _session_server
+
+
+@pytest.fixture
+def make_client(ssh_server):
+    """Build connected SCPClients of the test server; keyword arguments go to SCPClient."""
+    clients = []
+
+    def make(**options):
+        client = SCPClient(
+            "127.0.0.1", port=ssh_server.port, username="test", password="test", **options
+        )
+        assert client.connect()
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.disconnect()
+
+
+@pytest.fixture
+def client(make_client):
+    return make_client()
@@ -0,0 +1,135 @@
+"""Tests for cancelling directory transfers while files are queued and in flight."""
+
+import os
+
+import pytest
+
+from scptui import ssh_client
+from scptui.manifest import TransferManifest
+from scptui.progress import ProgressAccumulator
+from scptui.resume import PARTIAL_SUFFIX
+
+FILES = 20
+SIZE = 1024 * 1024
+
+
+@pytest.fixture
+def tree(tmp_path):
+    source = tmp_path / "source"
+    source.mkdir()
+    for index in range(FILES):
+        (source / f"f{index:02}").write_bytes(os.urandom(SIZE))
+    return source
+
+
+class Cancel:
+    """Press the progress modal's Cancel once the third file is halfway through.
+
+    Like the modal it raises the manifest's cancel flag, which the chunk
+    callbacks of the files in flight read; call it as the job's cancel_check.
+    """
+
+    def __init__(self):
+        self.manifest = TransferManifest()
+        progress = self.manifest.progress
+        started = []
+
+        def start(file_id, name, bytes_done=0):
+            started.append(file_id)
+            counter = ProgressAccumulator.start(progress, file_id, name, bytes_done)
+            return Tripwire(counter, progress.cancel if len(started) == 3 else None)
+
+        progress.start = start
+
+    def __call__(self):
+        return self.manifest.progress.cancelled
+
+    def transfer(self, method, source, target):
+        return method(source, target, cancel_check=self, manifest=self.manifest)
+
+
+class Tripwire:
+    """File counter calling `trip` once the transfer stores a count past half the file."""
+
+    def __init__(self, counter, trip):
+        object.__setattr__(self, "counter", counter)
+        object.__setattr__(self, "trip", trip)
+
+    def __setattr__(self, name, value):
+        setattr(self.counter, name, value)
+        if name == "bytes_done" and self.trip and value >= SIZE // 2:
+            self.trip()
+
+
+def started(client, method):
+    """Record the files `method` starts on."""
+    paths = []
+    transfer = getattr(client, method)
+
+    def record(source, *args, **kwargs):
+        paths.append(source)
+        return transfer(source, *args, **kwargs)
+
+    setattr(client, method, record)
+    return paths
+
+
+def leftovers(directory):
+    return sorted(name for name in os.listdir(directory) if name.endswith(PARTIAL_SUFFIX))
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_cancel_download(make_client, tree, tmp_path, jobs):
+    client = make_client(jobs=jobs)
+    target = tmp_path / "target"
+    downloads = started(client, "_download_file")
+
+    assert not Cancel().transfer(client.download_directory, str(tree), str(target))
+
+    # Queued files were dropped, the ones in flight stopped at their next chunk
+    assert 0 < len(downloads) < FILES
+    names = os.listdir(target)
+    assert len(names) <= len(downloads)
+    # Without resume a stopped file is removed, whatever is left is complete
+    assert leftovers(target) == []
+    assert all((target / name).read_bytes() == (tree / name).read_bytes() for name in names)
+    # The session stays usable for the next transfer
+    assert client.download_file(str(tree / "f00"), str(tmp_path / "again"))
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_cancel_upload(make_client, tree, tmp_path, jobs):
+    client = make_client(jobs=jobs)
+    target = tmp_path / "target"
+    uploads = started(client, "_upload_file")
+
+    assert not Cancel().transfer(client.upload_directory, str(tree), str(target))
+
+    assert 0 < len(uploads) < FILES
+    names = os.listdir(target)
+    assert len(names) <= len(uploads)
+    assert leftovers(target) == []
+    assert all((target / name).read_bytes() == (tree / name).read_bytes() for name in names)
+    assert client.upload_file(str(tree / "f00"), str(tmp_path / "again"))
+
+
+def test_cancel_keeps_only_started_part_files(make_client, tree, tmp_path, monkeypatch):
+    monkeypatch.setattr(ssh_client, "RESUME_MIN_SIZE", 1)
+    client = make_client(jobs=3, resume=True)
+    target = tmp_path / "target"
+    downloads = started(client, "_download_file")
+
+    assert not Cancel().transfer(client.download_directory, str(tree), str(target))
+
+    parts = leftovers(target)
+    # Only interrupted files keep a .part to resume from, and never next to a finished copy
+    assert 0 < len(parts) <= 3
+    assert {name[:-len(PARTIAL_SUFFIX)] for name in parts} <= {
+        os.path.basename(path) for path in downloads
+    }
+    assert not any(os.path.exists(target / name[:-len(PARTIAL_SUFFIX)]) for name in parts)
+
+    # Going on resumes them and leaves nothing behind
+    assert client.download_directory(str(tree), str(target))
+    assert leftovers(target) == []
+    assert sorted(os.listdir(target)) == sorted(os.listdir(tree))
@@ -0,0 +1,161 @@
+"""Tests for the pool of SSH connections."""
+
+import paramiko
+import pytest
+
+from scptui import connection_pool
+from scptui.connection_pool import ConnectionPool
+
+
+class FakeTransport:
+    def __init__(self):
+        self.active = True
+        self.ignores = 0
+        self.fail_ignore = False
+
+    def is_active(self):
+        return self.active
+
+    def send_ignore(self):
+        if self.fail_ignore:
+            raise EOFError("connection reset")
+        self.ignores += 1
+
+
+class FakeSFTP:
+    def __init__(self, client):
+        self.client = client
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class FakeClient:
+    def __init__(self, name):
+        self.name = name
+        self.transport = FakeTransport()
+        self.closed = False
+
+    def get_transport(self):
+        return None if self.closed else self.transport
+
+    def open_sftp(self):
+        return FakeSFTP(self)
+
+    def close(self):
+        self.closed = True
+
+
+class Connector:
+    """Stand-in for SCPClient._open_pooled_client, recording the clients it opened."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.opened = []
+
+    def __call__(self):
+        if self.fail:
+            raise paramiko.SSHException("MaxStartups")
+        client = FakeClient(f"extra{len(self.opened) + 1}")
+        self.opened.append(client)
+        return client
+
+
+def owners(channels):
+    return [sftp.client.name for sftp in channels]
+
+
+def test_idle_primary_is_used_first():
+    connector = Connector()
+    pool = ConnectionPool(FakeClient("primary"), connector, size=3)
+    assert owners([pool.open_sftp()]) == ["primary"]
+    assert connector.opened == []
+
+
+def test_grows_while_every_connection_is_busy():
+    connector = Connector()
+    pool = ConnectionPool(FakeClient("primary"), connector, size=3)
+    channels = [pool.open_sftp() for _ in range(5)]
+    assert owners(channels) == ["primary", "extra1", "extra2", "primary", "extra1"]
+    assert pool.connection_count == 3
+
+    # A released channel makes its connection the least busy one
+    pool.release(channels[2])
+    assert channels[2].closed
+    assert owners([pool.open_sftp()]) == ["extra2"]
+
+
+def test_size_one_never_connects():
+    connector = Connector()
+    pool = ConnectionPool(FakeClient("primary"), connector, size=1)
+    assert owners([pool.open_sftp() for _ in range(3)]) == ["primary"] * 3
+    assert connector.opened == []
+
+
+def test_connect_failure_shrinks_the_pool():
+    connector = Connector(fail=True)
+    pool = ConnectionPool(FakeClient("primary"), connector, size=4)
+    assert owners([pool.open_sftp(), pool.open_sftp()]) == ["primary", "primary"]
+    assert pool.size == 1
+
+    connector.fail = False
+    pool.open_sftp()
+    assert connector.opened == []  # No further attempts
+
+
+def test_dead_connection_is_dropped():
+    connector = Connector()
+    pool = ConnectionPool(FakeClient("primary"), connector, size=2)
+    first, second = pool.open_sftp(), pool.open_sftp()
+    assert owners([first, second]) == ["primary", "extra1"]
+    pool.release(second)
+
+    dead = connector.opened[0]
+    dead.transport.active = False
+    # The dead connection is closed and a new one takes its place
+    assert owners([pool.open_sftp()]) == ["extra2"]
+    assert dead.closed
+    assert pool.connection_count == 2
+
+
+def test_no_usable_connection():
+    primary = FakeClient("primary")
+    pool = ConnectionPool(primary, Connector(fail=True), size=1)
+    primary.transport.active = False
+    with pytest.raises(paramiko.SSHException):
+        pool.open_sftp()
+    assert not primary.closed  # The primary connection belongs to the SCPClient
+
+
+def test_idle_connection_is_health_checked(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(connection_pool.time, "monotonic", lambda: now[0])
+    primary = FakeClient("primary")
+    connector = Connector()
+    pool = ConnectionPool(primary, connector, size=2)
+
+    pool.release(pool.open_sftp())
+    assert primary.transport.ignores == 0
+
+    now[0] += connection_pool.HEALTH_CHECK_AFTER + 1
+    pool.release(pool.open_sftp())
+    assert primary.transport.ignores == 1
+
+    # A connection that cannot even take an SSH_MSG_IGNORE is not handed out
+    now[0] += connection_pool.HEALTH_CHECK_AFTER + 1
+    primary.transport.fail_ignore = True
+    assert owners([pool.open_sftp()]) == ["extra1"]
+
+
+def test_close_keeps_the_primary_connection():
+    primary = FakeClient("primary")
+    connector = Connector()
+    pool = ConnectionPool(primary, connector, size=3)
+    channels = [pool.open_sftp() for _ in range(3)]
+    for sftp in channels:
+        pool.release(sftp)
+    pool.close()
+    assert all(client.closed for client in connector.opened)
+    assert not primary.closed
+    assert pool.connection_count == 1
@@ -0,0 +1,136 @@
+"""Tests for the rsync-style delta encoding."""
+
+import io
+import random
+
+import pytest
+
+from scptui import delta
+
+BLOCK_SIZE = 2048
+
+
+def random_bytes(size: int, seed: int = 0) -> bytes:
+    """Deterministic pseudo-random data."""
+    if not size:
+        return b""
+    return random.Random(seed).getrandbits(8 * size).to_bytes(size, "little")
+
+
+def signature_of(basis: bytes, block_size: int = BLOCK_SIZE):
+    out = io.BytesIO()
+    delta.write_signature(io.BytesIO(basis), len(basis), block_size, out)
+    out.seek(0)
+    return delta.read_signature(out)
+
+
+def encode(basis: bytes, new: bytes, block_size: int = BLOCK_SIZE) -> bytes:
+    return b"".join(delta.compute_delta(io.BytesIO(new), signature_of(basis, block_size)))
+
+
+def apply(basis: bytes, ops: bytes, block_size: int = BLOCK_SIZE) -> bytes:
+    out = io.BytesIO()
+    delta.apply_delta(io.BytesIO(basis), block_size, io.BytesIO(ops), out)
+    return out.getvalue()
+
+
+def literal_bytes(ops: bytes) -> int:
+    """Sum of the literal data carried by an encoded delta."""
+    total = 0
+    pos = 0
+    while True:
+        kind = ops[pos:pos + 1]
+        pos += 1
+        if kind == b"C":
+            pos += 8
+        elif kind == b"D":
+            length = int.from_bytes(ops[pos:pos + 4], "big")
+            total += length
+            pos += 4 + length
+        else:
+            assert kind == b"E"
+            return total
+
+
+BASIS = random_bytes(40 * BLOCK_SIZE + 123)
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        BASIS,
+        b"",
+        BASIS[:10 * BLOCK_SIZE],  # Truncated at a block boundary
+        BASIS[:10 * BLOCK_SIZE + 7],  # Truncated inside a block
+        BASIS + random_bytes(BLOCK_SIZE // 2, 1),  # Partial block appended
+        BASIS[:5 * BLOCK_SIZE] + b"x" + BASIS[5 * BLOCK_SIZE:],  # Insert at a boundary
+        BASIS[:5 * BLOCK_SIZE] + BASIS[6 * BLOCK_SIZE:],  # One block removed
+        BASIS[:5 * BLOCK_SIZE - 1] + b"\0\0" + BASIS[5 * BLOCK_SIZE + 1:],  # Straddles a boundary
+        BASIS[20 * BLOCK_SIZE:] + BASIS[:20 * BLOCK_SIZE],  # Halves swapped
+        random_bytes(3 * BLOCK_SIZE, 2),  # Nothing in common
+    ],
+    ids=[
+        "unchanged", "empty", "cut-at-boundary", "cut-in-block", "appended", "inserted",
+        "removed-block", "edit-across-boundary", "swapped", "unrelated",
+    ],
+)
+def test_round_trip(new):
+    assert apply(BASIS, encode(BASIS, new)) == new
+
+
+@pytest.mark.parametrize("new", [b"", random_bytes(5 * BLOCK_SIZE + 1, 3)], ids=["empty", "data"])
+def test_round_trip_empty_basis(new):
+    ops = encode(b"", new)
+    assert apply(b"", ops) == new
+    assert literal_bytes(ops) == len(new)
+
+
+def test_unchanged_file_sends_no_literal_data():
+    assert literal_bytes(encode(BASIS, BASIS)) == 0
+
+
+def test_edit_sends_about_one_block():
+    new = bytearray(BASIS)
+    new[7 * BLOCK_SIZE + 100] ^= 0xFF
+    ops = encode(BASIS, bytes(new))
+    assert literal_bytes(ops) == BLOCK_SIZE
+    assert apply(BASIS, ops) == bytes(new)
+
+
+def test_block_size_bounds():
+    assert delta.block_size_for(0) == 2 * 1024
+    assert delta.block_size_for(1 << 40) == 128 * 1024
+    assert delta.block_size_for(16 * 1024 * 1024) == 4 * 1024
+
+
+def test_gives_up_when_mostly_literal(monkeypatch):
+    monkeypatch.setattr(delta, "GIVE_UP_AFTER", 4 * BLOCK_SIZE)
+    new = random_bytes(2 * 1024 * 1024, 4)
+    with pytest.raises(delta.DeltaNotWorthwhile):
+        encode(BASIS, new)
+
+
+def test_gives_up_past_literal_budget(monkeypatch):
+    # Two thirds of the data match, but the literal third alone exceeds the budget
+    monkeypatch.setattr(delta, "LITERAL_BUDGET", 1024 * 1024)
+    chunks = []
+    for i in range(64):
+        chunks.append(BASIS[:32 * BLOCK_SIZE])
+        chunks.append(random_bytes(16 * BLOCK_SIZE, 10 + i))
+    with pytest.raises(delta.DeltaNotWorthwhile):
+        encode(BASIS, b"".join(chunks))
+
+
+def test_apply_rejects_corrupted_literal():
+    new = random_bytes(BLOCK_SIZE, 5) + BASIS
+    ops = bytearray(encode(BASIS, new))
+    assert ops[:1] == b"D"
+    ops[10] ^= 0xFF  # Inside the literal run
+    with pytest.raises(ValueError, match="Checksum mismatch"):
+        apply(BASIS, bytes(ops))
+
+
+def test_apply_rejects_truncated_stream():
+    ops = encode(BASIS, BASIS)
+    with pytest.raises(ValueError, match="Truncated"):
+        apply(BASIS, ops[:-5])
@@ -0,0 +1,92 @@
+"""Tests for the columnar store of browser entries."""
+
+from scptui.entry_store import EntryStore
+
+
+def row(name, is_dir=False, size=0, is_symlink=False, target="", target_is_dir=False, mtime=0.0):
+    return (name, is_dir, size, is_symlink, target, target_is_dir, 0.0, mtime)
+
+
+def names(store):
+    return [store[index].file_name for index in range(len(store))]
+
+
+def test_merge_keeps_dirs_first_then_by_name():
+    store = EntryStore()
+    store.merge([row("b.txt"), row("Zeta", is_dir=True), row("A.txt")])
+    store.merge([row("alpha", is_dir=True), row("c.txt"), row("a0.txt")])
+    assert names(store) == ["..", "alpha", "Zeta", "A.txt", "a0.txt", "b.txt", "c.txt"]
+    assert store.dir_count == 2
+
+
+def test_merge_returns_insert_positions():
+    store = EntryStore()
+    store.merge([row("b"), row("d")])
+    # Before the merge: 0 "..", 1 "b", 2 "d"
+    assert store.merge([row("a"), row("c"), row("e")]) == [1, 2, 3]
+    assert store.merge([]) == []
+
+
+def test_merge_accepts_short_rows():
+    store = EntryStore()
+    store.merge([("old", False, 5, False, "", False)])
+    entry = store[1]
+    assert (entry.file_name, entry.file_size, entry.mtime) == ("old", 5, 0.0)
+
+
+def test_entry_fields():
+    store = EntryStore()
+    store.merge([row("link", True, 0, True, "/srv/target", True, mtime=12.5)])
+    entry = store[1]
+    assert entry.is_directory and entry.is_symlink and entry.target_is_dir
+    assert entry.symlink_target == "/srv/target"
+    assert entry.mtime == 12.5
+    assert not entry.is_selected
+
+
+def test_toggle_selected_counts():
+    store = EntryStore()
+    store.merge([row("dir", is_dir=True), row("a"), row("b")])
+    assert not store.toggle_selected(0)  # ".." cannot be selected
+    assert store.toggle_selected(1)
+    assert store.toggle_selected(2)
+    assert (store.selected_folders, store.selected_files) == (1, 1)
+    assert store.selected_indices() == [1, 2]
+    assert not store.toggle_selected(2)
+    assert (store.selected_folders, store.selected_files) == (1, 0)
+
+
+def test_select_all_keeps_other_flags():
+    store = EntryStore()
+    store.merge([row("dir", is_dir=True), row("link", is_symlink=True, target="x"), row("a")])
+    store.toggle_selected(2)  # "a"
+    store.select_all()
+    assert store.selected_indices() == [1, 2, 3]
+    assert (store.selected_folders, store.selected_files) == (1, 2)
+    assert store[1].is_directory and store[3].is_symlink and not store[0].is_selected
+
+
+def test_selection_moves_with_merged_entries():
+    store = EntryStore()
+    store.merge([row("b"), row("d")])
+    store.toggle_selected(2)  # "d"
+    store.merge([row("a"), row("c")])
+    assert [store[index].file_name for index in store.selected_indices()] == ["d"]
+
+
+def test_search_and_index_of():
+    store = EntryStore()
+    store.merge([row("Report.PDF"), row("notes.txt"), row("reports", is_dir=True)])
+    assert [store[index].file_name for index in store.search("report")] == ["reports", "Report.PDF"]
+    assert store.index_of("notes.txt") == 2
+    assert store.index_of("..") is None
+    assert store.index_of("missing") is None
+
+
+def test_clear():
+    store = EntryStore()
+    store.merge([row("dir", is_dir=True), row("a")])
+    store.select_all()
+    store.clear()
+    assert names(store) == [".."]
+    assert (store.dir_count, store.selected_files, store.selected_folders) == (0, 0, 0)
@@ -0,0 +1,139 @@
+"""Tests for remote directory listings and their background prefetch."""
+
+import os
+import threading
+import time
+
+import pytest
+
+from tests.conftest import FakeExec
+
+
+@pytest.fixture
+def big_dir(tmp_path):
+    # paramiko's SFTP server answers READDIR with 16 entries at a time
+    directory = tmp_path / "big"
+    directory.mkdir()
+    for index in range(100):
+        (directory / f"f{index:03}").write_bytes(b"x" * index)
+    return str(directory)
+
+
+def test_list_remote_files(client, tmp_path):
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "b.txt").write_bytes(b"hello")
+    os.symlink(tmp_path / "sub", tmp_path / "link")
+    items = client.list_remote_files(str(tmp_path))
+    assert [item[:6] for item in items] == [
+        ("link", True, 0, True, str(tmp_path / "sub"), True),
+        ("sub", True, 0, False, "", False),
+        ("b.txt", False, 5, False, "", False),
+    ]
+
+
+def test_iter_remote_files_batches(client, big_dir):
+    batches = list(client.iter_remote_files(big_dir))
+    names = sorted(name for batch in batches for name, *_ in batch)
+    assert names == [f"f{index:03}" for index in range(100)]
+    assert client.listing_cache.get(big_dir)[0][0][0] == "f000"
+
+
+def test_prefetch_fills_the_cache(client, big_dir):
+    client.prefetch_listing(big_dir)
+    items, fresh, _ = client.listing_cache.get(big_dir)
+    assert fresh and len(items) == 100
+    assert items[1][:3] == ("f001", False, 1)
+
+
+def test_server_clock_judges_recent_mtimes(client, ssh_server, tmp_path):
+    # The server runs an hour ahead: a directory modified a minute ago by its
+    # clock is still in the future by ours, but old enough to trust
+    ssh_server.exec_handler = FakeExec(stdout=f"{int(time.time()) + 3600}\n".encode())
+    old, fresh = tmp_path / "old", tmp_path / "fresh"
+    old.mkdir()
+    fresh.mkdir()
+    os.utime(old, (time.time() + 3540, time.time() + 3540))
+    os.utime(fresh, (time.time() + 3600, time.time() + 3600))
+
+    client.list_remote_files(str(old))
+    client.list_remote_files(str(fresh))
+
+    assert abs(client._server_time() - time.time() - 3600) < 2
+    assert client.listing_cache.get(str(old))[2] is not None
+    assert client.listing_cache.get(str(fresh))[2] is None
+    assert len(ssh_server.exec_handler.commands) == 1
+
+
+def test_prefetch_error_never_reconnects(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(client, "connect", lambda: pytest.fail("prefetch reconnected"))
+    ssh_client, transfer_sftp = client.client, client.sftp
+
+    client.prefetch_listing(str(tmp_path / "missing"))
+
+    assert client.client is ssh_client and client.sftp is transfer_sftp
+    assert ssh_client.get_transport().is_active()
+    assert transfer_sftp.stat(str(tmp_path)) is not None
+    assert client.listing_cache.get(str(tmp_path / "missing")) is None
+
+
+def test_prefetch_stops_between_replies(client, big_dir):
+    checks = []
+
+    def navigate():
+        acquired = client._browse_lock.acquire(timeout=5)
+        checks.append(acquired)
+        if acquired:
+            client._browse_lock.release()
+
+    def cancel_check():
+        # Between replies the browse channel is free for a navigation
+        other = threading.Thread(target=navigate)
+        other.start()
+        other.join()
+        return len(checks) == 2
+
+    client.prefetch_listing(big_dir, cancel_check)
+    assert checks == [True, True]
+    assert client.listing_cache.get(big_dir) is None
+    # The directory handle was closed, the channel is usable
+    assert len(client.list_remote_files(big_dir)) == 100
+
+
+class CountingSFTP:
+    """Proxy of an SFTP channel recording the most requests ever awaiting a response."""
+
+    def __init__(self, sftp):
+        self.sftp = sftp
+        self.in_flight = 0
+        self.most_in_flight = 0
+
+    def __getattr__(self, name):
+        return getattr(self.sftp, name)
+
+    def _async_request(self, *args):
+        self.in_flight += 1
+        self.most_in_flight = max(self.most_in_flight, self.in_flight)
+        return self.sftp._async_request(*args)
+
+    def _read_response(self):
+        self.in_flight -= 1
+        return self.sftp._read_response()
+
+
+def test_resolve_symlinks_bounds_requests_in_flight(client, tmp_path):
+    (tmp_path / "target").write_bytes(b"data")
+    paths = []
+    for index in range(300):
+        link = tmp_path / f"link{index}"
+        os.symlink("target" if index % 3 else "missing", link)
+        paths.append(str(link))
+    client.request_depth = 8
+    sftp = CountingSFTP(client._browse_channel())
+
+    resolved = client._resolve_symlinks(sftp, paths)
+
+    assert sftp.most_in_flight <= 8
+    assert sftp.in_flight == 0
+    assert sorted(resolved) == sorted(path for index, path in enumerate(paths) if index % 3)
+    target, attributes = resolved[paths[1]]
+    assert (target, attributes.st_size) == ("target", 4)
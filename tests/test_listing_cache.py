@@ -0,0 +1,105 @@
+"""Tests for the remote directory listing cache."""
+
+import pytest
+
+from scptui import listing_cache
+from scptui.listing_cache import ListingCache
+
+ITEMS = [("a.txt", False, 10, False, "", False)]
+OLD_MTIME = 1_000_000.0
+
+
+class Clock:
+    def __init__(self):
+        self.now = 2_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(listing_cache.time, "time", clock)
+    return clock
+
+
+def test_fresh_until_ttl(clock):
+    cache = ListingCache(ttl=30)
+    cache.put("/srv", ITEMS, OLD_MTIME, clock.now)
+    assert cache.get("/srv") == (ITEMS, True, OLD_MTIME)
+    clock.now += 31
+    assert cache.get("/srv") == (ITEMS, False, OLD_MTIME)
+
+
+def test_paths_are_normalized(clock):
+    cache = ListingCache()
+    cache.put("/srv/data/", ITEMS, OLD_MTIME, clock.now)
+    assert cache.get("/srv/./data")[0] == ITEMS
+    assert cache.get("/srv/other/../data")[0] == ITEMS
+
+
+def test_lru_eviction(clock):
+    cache = ListingCache(max_entries=2)
+    cache.put("/a", ITEMS, OLD_MTIME, clock.now)
+    cache.put("/b", ITEMS, OLD_MTIME, clock.now)
+    cache.get("/a")  # /b is now the least recently used
+    cache.put("/c", ITEMS, OLD_MTIME, clock.now)
+    assert cache.get("/b") is None
+    assert cache.get("/a") is not None
+    assert cache.get("/c") is not None
+
+
+def test_revalidate_restarts_ttl(clock):
+    cache = ListingCache(ttl=30)
+    cache.put("/srv", ITEMS, OLD_MTIME, clock.now)
+    clock.now += 31
+    assert cache.revalidate("/srv", OLD_MTIME)
+    assert cache.get("/srv")[1] is True
+
+
+def test_revalidate_rejects_changed_mtime(clock):
+    cache = ListingCache(ttl=30)
+    cache.put("/srv", ITEMS, OLD_MTIME, clock.now)
+    clock.now += 31
+    assert not cache.revalidate("/srv", OLD_MTIME + 1)
+    assert not cache.revalidate("/srv", None)
+    assert not cache.revalidate("/unknown", OLD_MTIME)
+    assert cache.get("/srv")[1] is False
+
+
+def test_recent_mtime_cannot_revalidate(clock):
+    # The directory may still change within the same mtime second
+    cache = ListingCache(ttl=30)
+    server_time = clock.now + 3600  # The local clock is an hour behind
+    cache.put("/srv", ITEMS, server_time - 1, server_time)
+    assert cache.get("/srv")[2] is None
+    clock.now += 31
+    assert not cache.revalidate("/srv", server_time - 1)
+
+    # Only the server's clock tells whether an mtime is recent
+    cache.put("/srv", ITEMS, clock.now - 10, clock.now - 3600)  # Ahead of the server
+    assert cache.get("/srv")[2] is None
+    cache.put("/srv", ITEMS, clock.now + 7200, clock.now + 7210)  # Ten seconds old
+    assert cache.get("/srv")[2] == clock.now + 7200
+
+
+def test_unknown_server_time_leaves_only_the_ttl(clock):
+    cache = ListingCache(ttl=30)
+    cache.put("/srv", ITEMS, OLD_MTIME)
+    assert cache.get("/srv") == (ITEMS, True, None)
+    clock.now += 31
+    assert not cache.revalidate("/srv", OLD_MTIME)
+
+
+def test_invalidate(clock):
+    cache = ListingCache()
+    for path in ("/srv", "/srv/a", "/srv/a/b", "/srv2"):
+        cache.put(path, ITEMS, OLD_MTIME, clock.now)
+    cache.invalidate("/srv/a")
+    assert cache.get("/srv/a") is None
+    assert cache.get("/srv/a/b") is not None
+    cache.invalidate("/srv", recursive=True)
+    assert cache.get("/srv") is None
+    assert cache.get("/srv/a/b") is None
+    assert cache.get("/srv2") is not None
@@ -0,0 +1,89 @@
+"""Tests for the copy job of the command line and the browser."""
+
+import threading
+
+import pytest
+
+from scptui import main
+from scptui.main import TransferConfig, perform_copy
+from scptui.manifest import TransferManifest
+
+
+class RecordingClient:
+    """Stand-in for SCPClient recording the copy job's calls."""
+
+    def __init__(self, cancel_after=None, error=None):
+        self.cancel_after = cancel_after
+        self.error = error
+        self.copied = []
+        self.walk_stop = None
+        self.walked = threading.Event()
+
+    def build_manifest(self, items, is_upload, manifest, cancel_check=None):
+        self.walk_stop = cancel_check
+        manifest.abandon()
+        self.walked.set()
+
+    def upload_file(self, local_path, remote_path, **options):
+        if self.error:
+            raise self.error
+        self.copied.append(local_path)
+        return True
+
+    def cancelled(self):
+        return self.cancel_after is not None and len(self.copied) >= self.cancel_after
+
+
+def config():
+    return TransferConfig(source="", target="", remote=None, is_upload=True)
+
+
+def copy(client, items, **options):
+    return perform_copy(
+        items, "/src", "/dst", True, client, config(), progress_callback=lambda message: None,
+        **options,
+    )
+
+
+def test_copies_every_item():
+    client = RecordingClient()
+    assert copy(client, [("/src/a", False), ("/src/b", False)], cancel_check=client.cancelled)
+    assert client.copied == ["/src/a", "/src/b"]
+
+
+def test_cancel_stops_the_walk_and_the_watch(monkeypatch):
+    monkeypatch.setattr(main, "CANCEL_POLL_INTERVAL", 0.01)
+    client = RecordingClient(cancel_after=1)
+    manifest = TransferManifest()
+    before = set(threading.enumerate())
+
+    result = copy(
+        client, [("/src/a", False), ("/src/b", False)],
+        cancel_check=client.cancelled, manifest=manifest,
+    )
+
+    assert result is False
+    assert client.copied == ["/src/a"]
+    assert client.walked.wait(5) and client.walk_stop()
+    for thread in set(threading.enumerate()) - before:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+def test_error_stops_the_watch(monkeypatch):
+    monkeypatch.setattr(main, "CANCEL_POLL_INTERVAL", 0.01)
+    client = RecordingClient(error=RuntimeError("boom"))
+    before = set(threading.enumerate())
+    with pytest.raises(RuntimeError):
+        copy(client, [("/src/a", False)], cancel_check=client.cancelled)
+    for thread in set(threading.enumerate()) - before:
+        thread.join(5)
+        assert not thread.is_alive()
+    assert client.walked.wait(5) and client.walk_stop()
+
+
+def test_walk_stops_when_the_copy_ends():
+    client = RecordingClient()
+    assert copy(client, [("/src/a", False)])
+    assert client.walked.wait(5)
+    assert client.walk_stop()
@@ -0,0 +1,131 @@
+"""Tests for the transfer manifest."""
+
+import threading
+
+import pytest
+
+from scptui.manifest import ManifestEntry, TransferManifest
+from scptui.progress import CANCELLED, DONE, FAILED, SKIPPED
+
+
+def file_entry(path, size):
+    return ManifestEntry(path, False, size, 0.0)
+
+
+def gated_walk(gate, entries, error=None):
+    """Walk yielding one entry per set of `gate`, so a test controls its pace."""
+    for entry in entries:
+        gate.acquire()
+        yield entry
+    if error:
+        gate.acquire()
+        raise error
+
+
+ENTRIES = [ManifestEntry("d", True, 0, 0.0), file_entry("d/a", 10), file_entry("d/b", 20)]
+
+
+def test_entries_follow_a_concurrent_record():
+    manifest = TransferManifest()
+    manifest.plan(["/src"])
+    gate = threading.Semaphore(0)
+    walker = threading.Thread(target=manifest.record, args=("/src", gated_walk(gate, ENTRIES)))
+    walker.start()
+
+    seen = []
+    consumer = manifest.entries("/src", lambda: pytest.fail("planned root walked twice"))
+    for expected in ENTRIES:
+        assert manifest.walking
+        gate.release()
+        seen.append(next(consumer))
+        assert seen[-1] == expected
+    walker.join()
+    assert list(consumer) == []
+    assert seen == ENTRIES
+    assert not manifest.walking
+    assert (manifest.total_files, manifest.total_bytes) == (2, 30)
+
+
+def test_entries_of_unplanned_root_walk_it_once():
+    manifest = TransferManifest()
+    walks = []
+
+    def walk():
+        walks.append(1)
+        return iter(ENTRIES)
+
+    assert list(manifest.entries("/src", walk)) == ENTRIES
+    assert list(manifest.entries("/src", walk)) == ENTRIES
+    assert walks == [1]
+    assert manifest.root_bytes("/src") == 30
+
+
+def test_walk_error_reaches_every_consumer():
+    manifest = TransferManifest()
+    manifest.plan(["/src"])
+    gate = threading.Semaphore(0)
+    error = IOError("listing failed")
+    raised = []
+
+    def record():
+        try:
+            manifest.record("/src", gated_walk(gate, ENTRIES[:2], error))
+        except IOError as e:
+            raised.append(e)
+
+    walker = threading.Thread(target=record)
+    walker.start()
+
+    consumer = manifest.entries("/src", lambda: iter(()))
+    gate.release()
+    assert next(consumer) == ENTRIES[0]
+    gate.release()
+    gate.release()
+    assert next(consumer) == ENTRIES[1]
+    with pytest.raises(IOError, match="listing failed"):
+        next(consumer)
+    walker.join()
+    assert raised == [error]
+    with pytest.raises(IOError):
+        list(manifest.entries("/src", lambda: iter(())))
+
+
+def test_abandon_releases_waiting_consumers():
+    manifest = TransferManifest()
+    manifest.plan(["/src"])
+    consumed = []
+    consumer = threading.Thread(
+        target=lambda: consumed.extend(manifest.entries("/src", lambda: iter(())))
+    )
+    consumer.start()
+    manifest.abandon()
+    consumer.join(5)
+    assert not consumer.is_alive()
+    assert consumed == []
+    assert manifest.root_bytes("/src") == 0
+
+
+def test_file_finished_accounting():
+    manifest = TransferManifest()
+    manifest.record("/src", iter([file_entry(name, 100) for name in "abcd"]))
+    manifest.progress.start("/src/a", "a").bytes_done = 40
+    assert manifest.bytes_done == 40
+
+    manifest.file_finished("/src", "/src/a", 100, DONE)
+    manifest.file_finished("/src", "/src/b", 100, SKIPPED)
+    manifest.file_finished("/src", "/src/c", 100, FAILED)
+    assert manifest.files_done == 3
+    assert (manifest.bytes_moved, manifest.bytes_skipped) == (100, 200)
+    assert manifest.moved_bytes("/src") == 100
+    assert manifest.moved_bytes("/other") is None
+    assert manifest.bytes_done == 300
+
+    # A cancelled file leaves flight but never finished
+    manifest.progress.start("/src/d", "d").bytes_done = 50
+    manifest.file_finished("/src", "/src/d", 100, CANCELLED)
+    assert manifest.files_done == 3
+    assert manifest.bytes_done == 300
+
+    active, log = manifest.progress.sample()
+    assert active == []
+    assert [event.state for event in log] == [DONE, SKIPPED, FAILED, CANCELLED]
@@ -0,0 +1,128 @@
+"""Tests for the progress accumulator of a transfer job."""
+
+import threading
+import time
+
+import pytest
+
+from scptui import progress
+from scptui.progress import DONE, ProgressAccumulator, ProgressEvent
+
+
+@pytest.fixture
+def short_pause(monkeypatch):
+    monkeypatch.setattr(progress, "PAUSE_CHECKPOINT_AFTER", 0.05)
+
+
+def start_holding(accumulator, count=1):
+    """Start threads calling hold() like paused transfer callbacks, collecting its results."""
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(accumulator.hold())) for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+def join(threads):
+    for thread in threads:
+        thread.join(5)
+        assert not thread.is_alive()
+
+
+def test_sample_coalesces_counts():
+    accumulator = ProgressAccumulator()
+    counter = accumulator.start("/src/a", "a")
+    for transferred in range(0, 1000, 10):
+        counter.bytes_done = transferred
+    counter.bytes_total = 1000
+    accumulator.note("hello")
+    active, log = accumulator.sample()
+    assert [(e.file_id, e.bytes_done, e.bytes_total) for e in active] == [("/src/a", 990, 1000)]
+    assert log == ["hello"]
+    assert accumulator.active_bytes() == 990
+
+    done = ProgressEvent("/src/a", "a", 1000, 1000, DONE)
+    accumulator.publish(done)
+    assert accumulator.sample() == ([], [done])
+    assert accumulator.sample() == ([], [])
+
+
+def test_not_held_by_default():
+    accumulator = ProgressAccumulator()
+    assert not accumulator.held and not accumulator.paused
+    assert accumulator.hold() is False
+
+
+def test_pause_blocks_until_resume():
+    accumulator = ProgressAccumulator()
+    accumulator.pause()
+    assert accumulator.held and accumulator.paused
+    threads, results = start_holding(accumulator, 2)
+    time.sleep(0.1)
+    assert all(thread.is_alive() for thread in threads)
+    accumulator.resume()
+    join(threads)
+    assert results == [False, False]
+    assert not accumulator.held
+
+
+def test_cancel_wakes_paused_transfers():
+    accumulator = ProgressAccumulator()
+    accumulator.pause()
+    threads, results = start_holding(accumulator)
+    accumulator.cancel()
+    join(threads)
+    assert results == [True]
+    accumulator.resume()
+    assert accumulator.held  # Stays cancelled
+
+
+def test_long_pause_checkpoints_once(short_pause):
+    accumulator = ProgressAccumulator()
+    calls = []
+    accumulator.add_checkpoint(lambda: calls.append(1))
+    accumulator.pause()
+    threads, _ = start_holding(accumulator, 3)
+    time.sleep(0.3)
+    assert calls == [1]
+    accumulator.resume()
+    join(threads)
+
+    # Every pause checkpoints again
+    accumulator.pause()
+    threads, _ = start_holding(accumulator)
+    time.sleep(0.3)
+    accumulator.resume()
+    join(threads)
+    assert calls == [1, 1]
+
+
+def test_short_pause_does_not_checkpoint():
+    accumulator = ProgressAccumulator()
+    calls = []
+    accumulator.add_checkpoint(lambda: calls.append(1))
+    accumulator.pause()
+    threads, _ = start_holding(accumulator)
+    time.sleep(0.1)
+    accumulator.resume()
+    join(threads)
+    assert calls == []
+
+
+def test_removed_checkpoint_does_not_run(short_pause):
+    accumulator = ProgressAccumulator()
+    calls = []
+
+    def checkpoint():
+        calls.append(1)
+
+    accumulator.add_checkpoint(checkpoint)
+    accumulator.remove_checkpoint(checkpoint)
+    accumulator.pause()
+    threads, _ = start_holding(accumulator)
+    time.sleep(0.3)
+    accumulator.resume()
+    join(threads)
+    assert calls == []
@@ -0,0 +1,52 @@
+"""Tests for the segment journals of resumable transfers."""
+
+import json
+
+from scptui import resume
+
+RANGES = [[0, 100, 400], [400, 400, 800], [800, 1000, 1000]]
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "sub" / "journal.json"
+    resume.save_journal(path, 1000, 1234, RANGES)
+    assert resume.load_journal(path, 1000, 1234) == RANGES
+    assert not path.with_suffix(".tmp").exists()
+
+
+def test_load_missing_journal(tmp_path):
+    assert resume.load_journal(tmp_path / "missing.json", 1000, 1234) is None
+
+
+def test_source_changed_since_journal(tmp_path):
+    path = tmp_path / "journal.json"
+    resume.save_journal(path, 1000, 1234, RANGES)
+    assert resume.load_journal(path, 1001, 1234) is None
+    assert resume.load_journal(path, 1000, 1235) is None
+
+
+def test_malformed_journals(tmp_path):
+    path = tmp_path / "journal.json"
+    path.write_text("{not json")
+    assert resume.load_journal(path, 1000, 1234) is None
+
+    for ranges in ([], [[0, 500, 400]], [[0, 100]]):
+        path.write_text(json.dumps({"size": 1000, "mtime": 1234, "ranges": ranges}))
+        assert resume.load_journal(path, 1000, 1234) is None
+
+
+def test_remove_journal(tmp_path):
+    path = tmp_path / "journal.json"
+    resume.save_journal(path, 1000, 1234, RANGES)
+    resume.remove_journal(path)
+    assert not path.exists()
+    resume.remove_journal(path)  # Already gone
+
+
+def test_journal_path_per_transfer(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    path = resume.journal_path("host", 22, "download", "/srv/a.bin", "a.bin")
+    assert path.parent == tmp_path / "scptui" / "resume"
+    assert path == resume.journal_path("host", 22, "download", "/srv/a.bin", "a.bin")
+    assert path != resume.journal_path("host", 22, "upload", "/srv/a.bin", "a.bin")
+    assert path != resume.journal_path("host", 2222, "download", "/srv/a.bin", "a.bin")
@@ -0,0 +1,211 @@
+"""Tests for segmented and pipelined transfers of large files."""
+
+import os
+import threading
+import time
+
+import pytest
+from paramiko import Message
+from paramiko.sftp import CMD_DATA, CMD_READ, CMD_STATUS, SFTP_FAILURE
+
+from scptui.ssh_client import SCPClient, split_ranges
+
+
+@pytest.mark.parametrize("total_size, count, expected", [
+    (0, 4, [(0, 0)]),
+    (1, 4, [(0, 1)]),
+    (4, 4, [(0, 1), (1, 2), (2, 3), (3, 4)]),
+    (10, 4, [(0, 3), (3, 6), (6, 9), (9, 10)]),
+    (10, 1, [(0, 10)]),
+    (10, 0, [(0, 10)]),
+])
+def test_split_ranges(total_size, count, expected):
+    assert split_ranges(total_size, count) == expected
+
+
+@pytest.mark.parametrize("total_size", [1, 7, 1000, 64 * 1024 * 1024 + 3])
+@pytest.mark.parametrize("count", [1, 3, 4, 16])
+def test_split_ranges_cover_every_byte_once(total_size, count):
+    ranges = split_ranges(total_size, count)
+    assert 1 <= len(ranges) <= count
+    assert ranges[0][0] == 0 and ranges[-1][1] == total_size
+    assert all(start < end for start, end in ranges)
+    assert all(ranges[index][1] == ranges[index + 1][0] for index in range(len(ranges) - 1))
+
+
+def test_segments_from_the_threshold_on():
+    client = SCPClient("example.com", segments=4, segment_threshold=1000)
+    assert not client._use_segments(999)
+    assert client._use_segments(1000)
+    assert not SCPClient("example.com", segments=1, segment_threshold=1000)._use_segments(1000)
+
+
+class FakeRemoteFile:
+    MAX_REQUEST_SIZE = 10
+    handle = b"handle"
+
+
+class FakeSFTP:
+    """SFTP channel serving READs of `data`, answering the requests in flight newest first.
+
+    `short_at` truncates the reply to the read at that offset; `fail_at` answers
+    it with a failure status.
+    """
+
+    def __init__(self, data, short_at=None, fail_at=None):
+        self.data = data
+        self.short_at = short_at
+        self.fail_at = fail_at
+        self.pending = []  # (collector, request number, offset, size)
+        self.next_num = 0
+        self.most_in_flight = 0
+
+    def _async_request(self, collector, t, handle, offset, size):
+        assert t == CMD_READ and handle == FakeRemoteFile.handle
+        self.next_num += 1
+        self.pending.append((collector, self.next_num, int(offset), size))
+        self.most_in_flight = max(self.most_in_flight, len(self.pending))
+        return self.next_num
+
+    def _read_response(self):
+        collector, num, offset, size = self.pending.pop()
+        msg = Message()
+        if offset == self.fail_at:
+            msg.add_int(SFTP_FAILURE)
+            msg.add_string("failure")
+            msg.rewind()
+            collector._async_response(CMD_STATUS, msg, num)
+            return
+        data = self.data[offset:offset + size]
+        if offset == self.short_at:
+            data = data[:-1]
+        msg.add_string(data)
+        msg.rewind()
+        collector._async_response(CMD_DATA, msg, num)
+
+    def _convert_status(self, msg):
+        if msg.get_int() != 0:
+            raise IOError(msg.get_text())
+
+
+def read(sftp, start, end, depth=4):
+    client = SCPClient("example.com")
+    client.request_depth = depth
+    chunks = []
+    client._read_pipelined(sftp, FakeRemoteFile(), start, end, chunks.append)
+    return b"".join(chunks)
+
+
+DATA = bytes(range(256)) * 4
+
+
+def test_pipelined_read_reorders_responses():
+    sftp = FakeSFTP(DATA)
+    assert read(sftp, 0, len(DATA)) == DATA
+    assert sftp.most_in_flight == 4
+    assert read(FakeSFTP(DATA), 95, 203) == DATA[95:203]
+    assert read(FakeSFTP(DATA), 5, 5) == b""
+
+
+def test_pipelined_read_short_response():
+    sftp = FakeSFTP(DATA, short_at=40)
+    with pytest.raises(EOFError, match="offset 40"):
+        read(sftp, 0, len(DATA))
+    # The responses to the requests still in flight were read
+    assert sftp.pending == []
+
+
+def test_pipelined_read_error_status():
+    sftp = FakeSFTP(DATA, fail_at=20)
+    with pytest.raises(IOError, match="failure"):
+        read(sftp, 0, len(DATA))
+    assert sftp.pending == []
+
+
+def test_pipelined_read_consume_failure_drains_the_window():
+    sftp = FakeSFTP(DATA)
+    client = SCPClient("example.com")
+    client.request_depth = 8
+
+    def consume(data):
+        raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError):
+        client._read_pipelined(sftp, FakeRemoteFile(), 0, len(DATA), consume)
+    assert sftp.pending == []
+
+
+def test_run_segments_reassembles_ranges(make_client):
+    client = make_client(segments=4)
+    data = os.urandom(100_003)
+    target = bytearray(len(data))
+    ranges = [[start, start, end] for start, end in split_ranges(len(data), 7)]
+    ranges[2][1] += 1000  # Partly done already, e.g. by an earlier attempt
+    target[ranges[2][0]:ranges[2][1]] = data[ranges[2][0]:ranges[2][1]]
+    channels = set()
+    lock = threading.Lock()
+
+    def transfer_range(channel, start, end, advance):
+        with lock:
+            channels.add(id(channel))
+        time.sleep(0.05)  # Long enough for every channel to take a range
+        for offset in range(start, end, 4096):
+            chunk = data[offset:min(offset + 4096, end)]
+            target[offset:offset + len(chunk)] = chunk
+            advance(len(chunk))
+
+    reports = []
+    client._run_segments(
+        client.sftp, ranges, len(data), transfer_range,
+        lambda transferred, total: reports.append(transferred),
+    )
+
+    assert bytes(target) == data
+    assert all(done == end for start, done, end in ranges)
+    assert max(reports) == len(data)
+    assert 1 < len(channels) <= 4
+
+
+def test_run_segments_raises_the_first_error(make_client):
+    client = make_client(segments=3)
+    ranges = [[start, start, end] for start, end in split_ranges(3000, 3)]
+
+    def transfer_range(channel, start, end, advance):
+        if start == 1000:
+            raise OSError("segment failed")
+        advance(end - start)
+
+    with pytest.raises(OSError, match="segment failed"):
+        client._run_segments(client.sftp, ranges, 3000, transfer_range, lambda *_: None)
+
+
+@pytest.fixture
+def segmented(make_client, monkeypatch):
+    client = make_client(segments=4, segment_threshold=1000)
+    used = []
+    for name in ("_download_segmented", "_upload_segmented"):
+        method = getattr(client, name)
+
+        def spy(*args, method=method, name=name, **kwargs):
+            used.append(name)
+            return method(*args, **kwargs)
+
+        monkeypatch.setattr(client, name, spy)
+    client.used = used
+    return client
+
+
+def test_segmented_download(segmented, tmp_path):
+    data = os.urandom(1_000_003)
+    (tmp_path / "remote.bin").write_bytes(data)
+    assert segmented.download_file(str(tmp_path / "remote.bin"), str(tmp_path / "local.bin"))
+    assert segmented.used == ["_download_segmented"]
+    assert (tmp_path / "local.bin").read_bytes() == data
+
+
+def test_segmented_upload(segmented, tmp_path):
+    data = os.urandom(1_000_003)
+    (tmp_path / "local.bin").write_bytes(data)
+    assert segmented.upload_file(str(tmp_path / "local.bin"), str(tmp_path / "remote.bin"))
+    assert segmented.used == ["_upload_segmented"]
+    assert (tmp_path / "remote.bin").read_bytes() == data
@@ -0,0 +1,105 @@
+"""Tests for sync mode, which skips files whose target is unchanged."""
+
+import os
+import sys
+
+import pytest
+
+from scptui.main import parse_arguments
+from scptui.ssh_client import SCPClient
+
+
+@pytest.mark.parametrize("source_size, source_mtime, target, unchanged", [
+    (10, 1000.0, None, False),
+    (10, 1000.0, (10, 1000.0), True),
+    (10, 1000.0, (11, 1000.0), False),
+    # SFTP carries whole seconds: a sub-second source mtime matches its truncated copy
+    (10, 1000.7, (10, 1000), True),
+    (10, 1000.7, (10, 999), False),
+    # A target written later than the source (its clock ahead) is still current
+    (10, 1000.0, (10, 1060.0), True),
+    (10, 1000.0, (9, 1060.0), False),
+    # The source was modified after the target was written (or the target's clock is behind)
+    (10, 1001.0, (10, 1000.0), False),
+])
+def test_is_unchanged(source_size, source_mtime, target, unchanged):
+    client = SCPClient("example.com", sync=True)
+    assert client._is_unchanged(source_size, source_mtime, target) is unchanged
+
+
+@pytest.mark.parametrize("flags, sync", [([], False), (["--sync"], True), (["--update"], True)])
+def test_update_is_sync(monkeypatch, flags, sync):
+    monkeypatch.setattr(sys, "argv", ["scptui", *flags, "user@example.com:/remote", "/local"])
+    assert parse_arguments().sync is sync
+
+
+@pytest.fixture
+def tree(tmp_path):
+    local = tmp_path / "local"
+    (local / "sub").mkdir(parents=True)
+    for path in ("a.txt", "b.txt", "sub/c.txt"):
+        (local / path).write_bytes(path.encode())
+    return local
+
+
+def recording(client, method):
+    """Record the source path of every file `method` is called for."""
+    paths = []
+    transfer = getattr(client, method)
+
+    def record(source, *args, **kwargs):
+        paths.append(os.path.basename(source))
+        return transfer(source, *args, **kwargs)
+
+    setattr(client, method, record)
+    return paths
+
+
+def test_sync_upload_skips_unchanged_files(make_client, tree, tmp_path):
+    client = make_client(sync=True)
+    remote = tmp_path / "remote"
+    uploaded = recording(client, "_upload_file")
+
+    assert client.upload_directory(str(tree), str(remote))
+    assert sorted(uploaded) == ["a.txt", "b.txt", "c.txt"]
+    # Uploaded files keep the source mtime
+    assert (remote / "a.txt").stat().st_mtime == int((tree / "a.txt").stat().st_mtime)
+
+    uploaded.clear()
+    assert client.upload_directory(str(tree), str(remote))
+    assert uploaded == []
+
+    (tree / "b.txt").write_bytes(b"B.txt")  # Same size, newer
+    os.utime(tree / "b.txt", (os.path.getmtime(tree / "a.txt") + 5,) * 2)
+    (tree / "d.txt").write_bytes(b"new")
+    (remote / "sub" / "c.txt").write_bytes(b"changed on the target")
+    assert client.upload_directory(str(tree), str(remote))
+    assert sorted(uploaded) == ["b.txt", "c.txt", "d.txt"]
+    assert (remote / "b.txt").read_bytes() == b"B.txt"
+    assert (remote / "sub" / "c.txt").read_bytes() == b"sub/c.txt"
+
+
+def test_sync_download_skips_unchanged_files(make_client, tree, tmp_path):
+    client = make_client(sync=True)
+    local = tmp_path / "copy"
+    downloaded = recording(client, "_download_file")
+
+    assert client.download_directory(str(tree), str(local))
+    assert sorted(downloaded) == ["a.txt", "b.txt", "c.txt"]
+
+    downloaded.clear()
+    assert client.download_directory(str(tree), str(local))
+    assert downloaded == []
+
+    os.utime(tree / "a.txt", (os.path.getmtime(tree / "a.txt") + 5,) * 2)
+    assert client.download_directory(str(tree), str(local))
+    assert downloaded == ["a.txt"]
+
+
+def test_without_sync_everything_is_sent(make_client, tree, tmp_path):
+    client = make_client()
+    remote = tmp_path / "remote"
+    uploaded = recording(client, "_upload_file")
+    assert client.upload_directory(str(tree), str(remote))
+    assert client.upload_directory(str(tree), str(remote))
+    assert len(uploaded) == 6
@@ -0,0 +1,111 @@
+"""Tests for directory transfers streamed as tar archives."""
+
+import io
+import os
+import tarfile
+
+import pytest
+
+from tests.conftest import FakeExec
+
+
+@pytest.fixture
+def tree(tmp_path):
+    local = tmp_path / "local"
+    (local / "sub dir").mkdir(parents=True)
+    (local / "a.txt").write_bytes(b"a" * 10)
+    (local / "sub dir" / "b.txt").write_bytes(b"b" * 20)
+    return local
+
+
+def archive(members):
+    """A tar archive of {name: data} files (None for directories)."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            if data is None:
+                info.type = tarfile.DIRTYPE
+                tar.addfile(info)
+            else:
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def serve_tar(ssh_server, fake):
+    """Answer the remote tar check, hand every other command to `fake`."""
+
+    def handler(channel, command):
+        if command == "command -v tar":
+            FakeExec(stdout=b"/usr/bin/tar\n")(channel, command)
+        else:
+            fake(channel, command)
+
+    ssh_server.exec_handler = handler
+    return fake
+
+
+def test_round_trip(make_client, tree, tmp_path):
+    client = make_client(tar_mode="always")
+    remote, copy = tmp_path / "remote dir", tmp_path / "copy"
+    assert client.upload_directory(str(tree), str(remote))
+    assert client.download_directory(str(remote), str(copy))
+    assert (copy / "a.txt").read_bytes() == b"a" * 10
+    assert (copy / "sub dir" / "b.txt").read_bytes() == b"b" * 20
+
+
+def test_upload_streams_into_tar(make_client, ssh_server, tree, tmp_path):
+    fake = serve_tar(ssh_server, FakeExec())
+    assert make_client(tar_mode="always").upload_directory(str(tree), str(tmp_path / "remote dir"))
+    assert fake.commands == [
+        f"mkdir -p '{tmp_path}/remote dir' && tar xf - -C '{tmp_path}/remote dir'"
+    ]
+    with tarfile.open(fileobj=io.BytesIO(fake.stdin)) as tar:
+        files = {
+            member.name: tar.extractfile(member).read() for member in tar if member.isfile()
+        }
+    assert files == {"a.txt": b"a" * 10, "sub dir/b.txt": b"b" * 20}
+
+
+def test_upload_reports_a_failing_tar(make_client, ssh_server, tree, tmp_path, capsys):
+    serve_tar(ssh_server, FakeExec(stderr=b"tar: Cannot mkdir: Permission denied\n", status=2))
+    assert not make_client(tar_mode="always").upload_directory(str(tree), str(tmp_path / "r"))
+    assert "Cannot mkdir: Permission denied" in capsys.readouterr().out
+
+
+def test_download_unpacks_tar_output(make_client, ssh_server, tmp_path):
+    fake = serve_tar(ssh_server, FakeExec(stdout=archive({
+        "./": None,
+        "./sub dir": None,
+        "./sub dir/b.txt": b"b" * 20,
+        "./a.txt": b"a" * 10,
+        "../escaped.txt": b"x",
+    })))
+    copy = tmp_path / "copy"
+    assert make_client(tar_mode="always").download_directory(str(tmp_path / "my dir"), str(copy))
+    assert fake.commands == [f"tar chf - -C '{tmp_path}/my dir' ."]
+    assert (copy / "a.txt").read_bytes() == b"a" * 10
+    assert (copy / "sub dir" / "b.txt").read_bytes() == b"b" * 20
+    # Members outside the target are never written
+    assert not (tmp_path / "escaped.txt").exists()
+
+
+@pytest.mark.parametrize("fake, error", [
+    (FakeExec(stderr=b"tar: /missing: Cannot open\n", status=2), "Cannot open"),
+    (FakeExec(stdout=archive({"./a.txt": b"a"}), status=2), "tar exited with 2"),
+    (FakeExec(stdout=b"not a tar archive" * 100), "Directory download failed"),
+])
+def test_download_reports_a_failing_tar(make_client, ssh_server, tmp_path, capsys, fake, error):
+    serve_tar(ssh_server, fake)
+    client = make_client(tar_mode="always")
+    assert not client.download_directory(str(tmp_path / "missing"), str(tmp_path / "copy"))
+    assert error in capsys.readouterr().out
+
+
+def test_no_tar_on_the_remote_host(make_client, ssh_server, tree, tmp_path):
+    ssh_server.exec_handler = FakeExec(status=1)
+    client = make_client(tar_mode="always")
+    assert client.upload_directory(str(tree), str(tmp_path / "remote"))
+    assert ssh_server.exec_handler.commands == ["command -v tar"]
+    assert os.path.exists(tmp_path / "remote" / "sub dir" / "b.txt")
@@ -0,0 +1,53 @@
+"""Tests for the window, packet size and request depth derived from RTT and bandwidth."""
+
+import pytest
+
+from scptui.tuning import (
+    MAX_PACKET_SIZE,
+    MAX_WINDOW_SIZE,
+    MIN_PACKET_SIZE,
+    MIN_REQUEST_DEPTH,
+    MIN_WINDOW_SIZE,
+    compute_tuning,
+)
+
+KiB = 1024
+MiB = 1024 * KiB
+
+
+@pytest.mark.parametrize("rtt, bandwidth, window_size, max_packet_size, request_depth", [
+    # Nothing measured: the lower bounds
+    (0.0, 0.0, 2 * MiB, 32 * KiB, 64),
+    # LAN, 1 ms at 1 Gbit/s: below the minimum window
+    (0.001, 125e6, 2 * MiB, 32 * KiB, 64),
+    # Twice the bandwidth-delay product exactly on a power of two
+    (1.0, 1 * MiB, 2 * MiB, 32 * KiB, 64),
+    (1.0, 4 * MiB, 8 * MiB, 64 * KiB, 256),
+    # Rounded up to the next power of two
+    (0.05, 125e6, 16 * MiB, 128 * KiB, 512),
+    (0.1, 100e6, 32 * MiB, 256 * KiB, 1024),
+    # Long fat pipe, 300 ms at 10 Gbit/s: the upper bounds
+    (0.3, 1.25e9, 64 * MiB, 256 * KiB, 2048),
+])
+def test_compute_tuning(rtt, bandwidth, window_size, max_packet_size, request_depth):
+    assert compute_tuning(rtt, bandwidth) == {
+        "rtt": rtt,
+        "bandwidth": bandwidth,
+        "window_size": window_size,
+        "max_packet_size": max_packet_size,
+        "request_depth": request_depth,
+    }
+
+
+@pytest.mark.parametrize("rtt", [0.0, 0.0005, 0.01, 0.08, 0.25, 2.0])
+@pytest.mark.parametrize("bandwidth", [1e5, 1e7, 125e6, 1.25e9, 1e11])
+def test_tuning_stays_within_bounds(rtt, bandwidth):
+    tuning = compute_tuning(rtt, bandwidth)
+    window_size, max_packet_size = tuning["window_size"], tuning["max_packet_size"]
+    assert MIN_WINDOW_SIZE <= window_size <= MAX_WINDOW_SIZE
+    assert MIN_PACKET_SIZE <= max_packet_size <= MAX_PACKET_SIZE
+    assert tuning["request_depth"] >= MIN_REQUEST_DEPTH
+    # Powers of two, and room for twice the bandwidth-delay product unless capped
+    assert window_size & (window_size - 1) == 0
+    assert max_packet_size & (max_packet_size - 1) == 0
+    assert window_size >= 2 * rtt * bandwidth or window_size == MAX_WINDOW_SIZE
@@ -0,0 +1,252 @@
+"""Tests for the browser's widgets."""
+
+import asyncio
+import math
+import threading
+from types import SimpleNamespace
+
+import pytest
+from textual.app import App
+
+from scptui import ui
+from scptui.entry_store import EntryStore
+from scptui.manifest import ManifestEntry, TransferManifest
+from scptui.ui import FileBrowser, FileList, ProgressModal
+
+
+def test_totals_follow_the_walk():
+    manifest = TransferManifest()
+    manifest.plan(["/src"])
+    modal = ProgressModal(manifest=manifest)
+    modal.update_frame()
+    assert (modal.total_items, modal.counting) == (0, True)
+
+    counted, gate = threading.Event(), threading.Event()
+
+    def walk():
+        yield ManifestEntry("a", False, 10, 0.0)
+        counted.set()  # The manifest took the first entry
+        gate.wait(5)
+        yield ManifestEntry("b", False, 10, 0.0)
+
+    walker = threading.Thread(target=manifest.record, args=("/src", walk()))
+    walker.start()
+    assert counted.wait(5)
+    modal.update_frame()
+    assert (modal.total_items, modal.counting) == (1, True)
+
+    gate.set()
+    walker.join()
+    modal.update_frame()
+    assert (modal.total_items, modal.counting) == (2, False)
+
+
+def run_app(app, interact):
+    """Run a Textual app headless, calling `interact(pilot)` once it is up."""
+
+    async def run():
+        async with app.run_test(size=(100, 30)) as pilot:
+            await pilot.pause()
+            await interact(pilot)
+
+    asyncio.run(run())
+
+
+def test_refresh_drops_the_cached_listing():
+    listed, invalidated = [], []
+
+    def list_files(path):
+        listed.append(path)
+        return [(f"file{len(listed)}", False, 1, False, "", False, 0.0, 0.0)]
+
+    app = FileBrowser(
+        "Remote", "/srv", list_files, is_remote=True, invalidate_func=invalidated.append
+    )
+
+    async def interact(pilot):
+        await pilot.press("r")
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert app.entries[1].file_name == "file2"
+
+    run_app(app, interact)
+    assert invalidated == ["/srv"]
+    assert listed == ["/srv", "/srv"]
+
+
+class ListApp(App):
+    """An app showing nothing but a FileList."""
+
+    def __init__(self, entries):
+        super().__init__()
+        self.entries = entries
+        self.highlighted = []
+
+    def compose(self):
+        yield FileList(self.entries)
+
+    def on_mount(self):
+        file_list = self.query_one(FileList)
+        file_list.focus()
+        file_list.entries_changed()
+
+    def on_file_list_highlighted(self, event):
+        self.highlighted.append(event.index)
+
+
+def big_store(count):
+    store = EntryStore()
+    store.merge([("dir", True, 0, False, "", False, 0.0, 0.0)])
+    store.merge(
+        [(f"f{index:05}", False, index, False, "", False, 0.0, 0.0) for index in range(count)]
+    )
+    return store
+
+
+def test_file_list_renders_rows():
+    store = big_store(100)
+    store.toggle_selected(3)
+    app = ListApp(store)
+
+    async def interact(pilot):
+        file_list = app.query_one(FileList)
+        lines = [file_list.render_line(y) for y in range(30)]
+        assert lines[0].text.startswith(" ⬆️  .. (Parent Directory)")
+        assert lines[1].text.rstrip() == " 📁 dir/"
+        assert lines[2].text.rstrip() == " 📄 f00000 (0.0 B)"
+        # Cursor row, selected row and plain rows look different
+        cursor, plain, selected = (list(lines[y])[-1].style for y in (0, 2, 3))
+        assert len({cursor, plain, selected}) == 3
+        assert lines[29].cell_length == file_list.size.width
+
+    run_app(app, interact)
+
+
+def test_file_list_renders_only_visible_rows(monkeypatch):
+    rendered = []
+    markup = ui._entry_markup
+    monkeypatch.setattr(ui, "_entry_markup", lambda entry: rendered.append(entry) or markup(entry))
+    app = ListApp(big_store(100_000))
+
+    async def interact(pilot):
+        await pilot.press("end")
+        await pilot.pause()
+
+    run_app(app, interact)
+    assert 0 < len(rendered) < 200
+
+
+def test_file_list_moves_the_highlight():
+    app = ListApp(big_store(100))
+    heights = []
+
+    async def interact(pilot):
+        file_list = app.query_one(FileList)
+        height = file_list.scrollable_content_region.height
+        heights.append(height)
+        assert file_list.index == 0
+        await pilot.press("down", "down")
+        assert file_list.index == 2
+        await pilot.press("up", "up", "up")
+        assert file_list.index == 0
+        await pilot.press("pagedown")
+        assert file_list.index == height - 1
+        await pilot.press("end")
+        await pilot.pause()
+        assert file_list.index == 101
+        # Scrolled so the last row is the bottom one on screen
+        assert file_list.scroll_offset.y == 102 - height
+        assert file_list.render_line(height - 1).text.startswith(" 📄 f00099")
+        await pilot.press("down")
+        assert file_list.index == 101
+        await pilot.press("home")
+        await pilot.pause()
+        assert (file_list.index, file_list.scroll_offset.y) == (0, 0)
+
+    run_app(app, interact)
+    assert app.highlighted == [0, 1, 2, 1, 0, heights[0] - 1, 101, 0]
+
+
+MB = 1000 * 1000
+
+
+@pytest.fixture
+def eta_modal(monkeypatch):
+    """A ProgressModal over a fake 100-file, 1000 MB job, on a clock the test moves."""
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(ui.time, "monotonic", lambda: clock.now)
+    manifest = SimpleNamespace(
+        total_bytes=1000 * MB, total_files=100, bytes_done=0, files_done=0,
+        progress=SimpleNamespace(paused=False),
+    )
+    modal = ProgressModal(manifest=manifest)
+    modal.total_items = 100
+
+    def advance(seconds, mb, files=0):
+        clock.now += seconds
+        manifest.bytes_done += mb * MB
+        manifest.files_done += files
+        modal._sample_rates()
+
+    modal.advance = advance
+    modal._sample_rates()
+    return modal
+
+
+def test_eta_without_progress(eta_modal):
+    assert eta_modal._job_eta() is None
+    eta_modal.advance(1, 0)
+    assert eta_modal.byte_rate == 0 and eta_modal.file_rate == 0
+    assert eta_modal._job_eta() is None
+
+
+def test_eta_warms_up_with_the_plain_average(eta_modal):
+    eta_modal.advance(1, 10, files=1)
+    eta_modal.advance(1, 30, files=1)
+    assert eta_modal.byte_rate == 20 * MB
+    # 960 MB left at 20 MB/s, 98 files at 1 file/s: the larger estimate
+    assert eta_modal._job_eta() == 98
+    eta_modal.advance(0, 0, files=48)
+    assert eta_modal._job_eta() == 48
+
+
+def test_eta_smooths_a_stall_and_a_burst(eta_modal):
+    for _ in range(10):
+        eta_modal.advance(1, 10)
+    assert eta_modal.byte_rate == pytest.approx(10 * MB)
+    eta = eta_modal._job_eta()
+
+    weight = 1 - math.exp(-1 / ui.RATE_SMOOTHING)
+    eta_modal.advance(1, 0)
+    assert eta_modal.byte_rate == pytest.approx(10 * MB * (1 - weight))
+    assert eta < eta_modal._job_eta() < 2 * eta
+
+    eta_modal.advance(1, 100)
+    assert eta_modal.byte_rate == pytest.approx(10 * MB * (1 - weight) ** 2 + 100 * MB * weight)
+
+
+def test_eta_ignores_paused_time(eta_modal):
+    for _ in range(10):
+        eta_modal.advance(1, 10)
+    eta_modal.manifest.progress.paused = True
+    eta_modal.advance(60, 0)
+    eta_modal.manifest.progress.paused = False
+    eta_modal.advance(1, 10)
+    assert eta_modal.byte_rate == pytest.approx(10 * MB)
+
+
+def test_eta_of_a_finished_job(eta_modal):
+    eta_modal.advance(10, 1000, files=100)
+    eta_modal.completed_items = 100
+    rate = eta_modal.byte_rate
+    assert eta_modal._job_eta() == 0.0
+    eta_modal.advance(10, 0)
+    assert eta_modal.byte_rate == rate
+
+
+def test_eta_from_late_or_simultaneous_samples(eta_modal):
+    eta_modal.advance(0, 10)
+    assert eta_modal.byte_rate is None
+    # The first frames came late, e.g. while the UI was busy
+    eta_modal.advance(2 * ui.RATE_SMOOTHING, 90)
+    assert eta_modal.byte_rate == pytest.approx(10 * MB)
@@ -0,0 +1,150 @@
+"""Tests for walking remote trees."""
+
+import os
+
+import pytest
+
+from scptui.ssh_client import FIND_PRINTF_FORMAT
+from tests.conftest import FakeExec
+
+
+@pytest.fixture
+def linked_tree(tmp_path):
+    """remote/ with a file, a symlinked directory outside of it, and a link to a file."""
+    remote = tmp_path / "remote"
+    (remote / "real").mkdir(parents=True)
+    (remote / "real" / "a.txt").write_bytes(b"a" * 10)
+    outside = tmp_path / "outside"
+    (outside / "sub").mkdir(parents=True)
+    (outside / "sub" / "b.txt").write_bytes(b"b" * 20)
+    os.symlink(outside, remote / "linked")
+    os.symlink("real/a.txt", remote / "a-link.txt")
+    return remote
+
+
+def walked(client, remote, **options):
+    return {
+        entry.path: (entry.is_dir, 0 if entry.is_dir else entry.size, entry.is_symlink)
+        for entry in client.walk_remote(str(remote), **options)
+    }
+
+
+def test_follows_symlinked_directories(client, linked_tree):
+    assert walked(client, linked_tree) == {
+        "real": (True, 0, False),
+        "real/a.txt": (False, 10, False),
+        "linked": (True, 0, False),
+        "linked/sub": (True, 0, False),
+        "linked/sub/b.txt": (False, 20, False),
+        "a-link.txt": (False, 10, True),
+    }
+
+
+def test_links_back_into_the_walk_are_not_followed(client, linked_tree):
+    os.symlink("..", linked_tree / "real" / "up")
+    os.symlink(linked_tree, linked_tree.parent / "outside" / "sub" / "back")
+    os.symlink(linked_tree.parent / "outside" / "sub", linked_tree / "sub-again")
+    entries = walked(client, linked_tree)
+    assert entries["real/up"] == (True, 0, True)
+    assert entries["linked/sub/back"] == (True, 0, True)
+    # Not a loop: the same directory twice
+    assert entries["sub-again"] == (True, 0, False)
+    assert entries["sub-again/b.txt"] == (False, 20, False)
+    assert entries["sub-again/back"] == (True, 0, True)
+
+
+def test_download_follows_symlinked_directories(client, linked_tree, tmp_path):
+    local = tmp_path / "local"
+    assert client.download_directory(str(linked_tree), str(local))
+    assert (local / "linked" / "sub" / "b.txt").read_bytes() == b"b" * 20
+    assert not (local / "linked").is_symlink()
+    assert (local / "a-link.txt").read_bytes() == b"a" * 10
+
+
+def test_download_reports_looping_links(client, linked_tree, tmp_path):
+    os.symlink("..", linked_tree / "real" / "up")
+    messages = []
+    local = tmp_path / "local"
+    assert not client.download_directory(str(linked_tree), str(local), messages.append)
+    assert "❌ Symlinked directory not followed: real/up" in messages
+    assert (local / "real" / "a.txt").exists()
+    assert not (local / "real" / "up").exists()
+
+
+def find_rows(*rows):
+    """NUL-separated `find -printf` output of (path, %y, %Y, size, mtime, link target) rows."""
+    return b"".join(
+        b"\0".join(str(field).encode() for field in row) + b"\0" for row in rows
+    )
+
+
+def test_find_parses_awkward_names(client, tmp_path):
+    (tmp_path / "with space").mkdir()
+    (tmp_path / "with space" / "new\nline.txt").write_bytes(b"x" * 3)
+    os.utime(tmp_path / "with space" / "new\nline.txt", (1000.5, 1000.5))
+    os.symlink("with space/new\nline.txt", tmp_path / "link")
+    entries = {entry.path: entry for entry in client._walk_remote_find(str(tmp_path))}
+    assert sorted(entries) == ["link", "with space", "with space/new\nline.txt"]
+    assert entries["with space"].is_dir
+    assert entries["with space/new\nline.txt"][1:] == (False, 3, 1000.5, False, "")
+    # Links get their target's attributes over SFTP, in whole seconds
+    assert entries["link"][1:] == (False, 3, 1000, True, "with space/new\nline.txt")
+
+
+def test_find_output_rows(client, ssh_server, tmp_path):
+    remote = tmp_path / "remote dir"
+    remote.mkdir()
+    (remote / "target.txt").write_bytes(b"t" * 7)
+    os.utime(remote / "target.txt", (1234, 1234))
+    ssh_server.exec_handler = FakeExec(stdout=find_rows(
+        ("a dir", "d", "d", 4096, "1000.5", ""),
+        ("a dir/two\nlines", "f", "f", 12, "1001.25", ""),
+        ("file-link", "l", "f", 10, "1002", "target.txt"),
+        ("dir-link", "l", "d", 5, "1003", "a dir"),
+        ("dangling", "l", "N", 7, "1004", "missing"),
+    ))
+    # Links are stat'ed over SFTP, relative to the walked directory
+    os.symlink("target.txt", remote / "file-link")
+    os.symlink("missing", remote / "dangling")
+
+    entries = list(client._walk_remote_find(str(remote)))
+
+    command = ssh_server.exec_handler.commands[0]
+    assert command.startswith(f"find -H '{remote}' -mindepth 1 -printf ")
+    assert command.endswith(f"'{FIND_PRINTF_FORMAT}'")
+    assert [tuple(entry) for entry in entries] == [
+        ("a dir", True, 4096, 1000.5, False, ""),
+        ("a dir/two\nlines", False, 12, 1001.25, False, ""),
+        ("file-link", False, 7, 1234, True, "target.txt"),
+        ("dir-link", True, 0, 0, True, "a dir"),
+        ("dangling", False, 0, 0, True, "missing"),
+    ]
+
+
+def test_find_output_across_reads(client, ssh_server, tmp_path):
+    # More than one 256 KB read, so rows and fields are split between reads
+    rows = [(f"dir/{'n' * 90}{index}", "f", "f", index, f"{index}.5", "") for index in range(4000)]
+    ssh_server.exec_handler = FakeExec(stdout=find_rows(*rows))
+    entries = list(client._walk_remote_find(str(tmp_path)))
+    assert [(entry.path, entry.size, entry.mtime) for entry in entries] == [
+        (path, size, float(mtime)) for path, _, _, size, mtime, _ in rows
+    ]
+
+
+def test_find_errors_after_output_are_warnings(client, ssh_server, tmp_path):
+    ssh_server.exec_handler = FakeExec(
+        stdout=find_rows(("a.txt", "f", "f", 1, "1", "")),
+        stderr=b"find: 'locked': Permission denied\n", status=1,
+    )
+    assert [entry.path for entry in client._walk_remote_find(str(tmp_path))] == ["a.txt"]
+
+
+@pytest.mark.parametrize("find", [
+    FakeExec(stderr=b"bash: find: command not found\n", status=127),
+    FakeExec(stderr=b"find: unknown predicate '-printf'\n", status=1),
+])
+def test_walk_falls_back_to_sftp(client, ssh_server, linked_tree, find):
+    expected = walked(client, linked_tree)
+    ssh_server.exec_handler = find
+    assert walked(client, linked_tree) == expected
+    assert find.commands